@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+"""Runner of timed scenarios on synthetic libraries"""
+
+import json
+import logging
+import time
+
+from benchmark.library_generator import LibraryGenerator
+from executor.executor_factory import ExecutorFactory
+from executor.rows_builder import RowsBuilder
+from libraries.constants.constants import Action, Category, Platform, Software
+from libraries.context.context import Context
+from libraries.event.event_bus import EventBus, EventType
+
+
+class BenchmarkRunner:
+    """Class to run headless timed scenarios for softwares on generated libraries"""
+
+    # Scenarios in their order of execution (each one uses the state left by the previous ones)
+    SCENARIOS = ['list', 'refresh', 'export', 'uninstall', 'install', 'delete']
+
+    # Actions executed by scenarios (rows are listed for the action before being executed)
+    __SCENARIOS_ACTIONS = {
+        'list': Action.EXPORT,
+        'refresh': Action.EXPORT,
+        'export': Action.EXPORT,
+        'uninstall': Action.UNINSTALL,
+        'install': Action.INSTALL,
+        'delete': Action.DELETE
+    }
+
+    # Differences under this duration are ignored when comparing to a baseline (noise)
+    __MIN_REGRESSION_SECONDS = 0.05
+
+    def __init__(
+        self,
+        generator: LibraryGenerator,
+        platforms: list[Platform]
+    ):
+        """Initialize runner"""
+
+        self.__generator = generator
+        self.__platforms = platforms
+
+    def __select(self, software: Software, action: Action):
+        """Select all rows and all components for an action in context"""
+
+        Context.set_selected_category(Category.GAMES)
+        Context.set_selected_action(action)
+        Context.set_selected_software(software)
+        Context.set_selected_platforms(self.__platforms)
+        Context.set_selected_rows(RowsBuilder.build_rows())
+        Context.set_selected_components(RowsBuilder.build_components_rows())
+
+    @staticmethod
+    def __execute(scenario: str):
+        """Execute the selected rows of a scenario in the current thread (error if not finished
+        or if errors were logged, timings of a failing execution are meaningless)"""
+
+        executor = ExecutorFactory.create()
+        event_bus = EventBus()
+        executor.set_event_bus(
+            event_bus=event_bus
+        )
+        executor.execute()
+
+        events = event_bus.drain()
+        errors_count = sum(
+            1 for event_type, data in events
+            if event_type == EventType.LOG and data['level'] >= logging.ERROR
+        )
+        if errors_count > 0:
+            raise Exception(f'Scenario {scenario} logged {errors_count} error(s)!')
+        if not any(
+            event_type == EventType.FINISHED for event_type, _ in events
+        ):
+            raise Exception(f'Scenario {scenario} not finished!')
+
+    def run_software(self, software: Software, scenarios: list[str]) -> dict[str, float]:
+        """Generate the library of a software and run scenarios, return durations in seconds"""
+
+        # Initialize result
+        result: dict[str, float] = {}
+
+        self.__generator.generate(software=software)
+        Context.update_context_from_setup()
+
+        for scenario in [scenario for scenario in self.SCENARIOS if scenario in scenarios]:
+            action = self.__SCENARIOS_ACTIONS[scenario]
+            start = time.perf_counter()
+            self.__select(software=software, action=action)
+            if scenario not in ['list', 'refresh']:
+                self.__execute(scenario=scenario)
+            result[scenario] = round(time.perf_counter() - start, 4)
+
+        return result
+
+    def run(self, softwares: list[Software], scenarios: list[str]) -> dict[str, dict[str, float]]:
+        """Run scenarios for softwares, return durations in seconds by software"""
+
+        return {
+            software.value: self.run_software(
+                software=software,
+                scenarios=scenarios
+            )
+            for software in softwares
+        }
+
+    @staticmethod
+    def write_results(file_path: str, parameters: dict, results: dict[str, dict[str, float]]):
+        """Write results in a JSON file"""
+
+        with open(file_path, mode='w', encoding='UTF-8') as file:
+            json.dump(
+                {
+                    'parameters': parameters,
+                    'results': results
+                },
+                file,
+                indent=2
+            )
+
+    @staticmethod
+    def compare_results(
+        baseline_file_path: str,
+        results: dict[str, dict[str, float]],
+        tolerance: float
+    ) -> list[str]:
+        """Compare results to a baseline and list regressions (slower than the tolerance)"""
+
+        # Initialize result
+        result: list[str] = []
+
+        with open(baseline_file_path, mode='r', encoding='UTF-8') as file:
+            baseline = json.load(file)['results']
+
+        for software, durations in results.items():
+            for scenario, duration in durations.items():
+                baseline_duration = baseline.get(software, {}).get(scenario, None)
+                if baseline_duration is None:
+                    continue
+                if duration > baseline_duration * (1 + tolerance) and \
+                        duration - baseline_duration > BenchmarkRunner.__MIN_REGRESSION_SECONDS:
+                    result.append(
+                        f'{software} {scenario}: {duration:.3f}s '
+                        f'(baseline {baseline_duration:.3f}s)'
+                    )
+
+        return result
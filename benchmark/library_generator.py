@@ -0,0 +1,293 @@
+#!/usr/bin/python3
+"""Generator of synthetic libraries to benchmark"""
+
+import os
+import random
+import shutil
+from xml.sax.saxutils import escape
+
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Media, Platform, Software
+from libraries.context.context import Context
+
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-instance-attributes
+
+
+class LibraryGenerator:
+    """Class to generate synthetic trees of softwares and the games store in a working folder"""
+
+    # File marking a working folder generated (the only one which can be cleaned)
+    MARKER_FILE_NAME = '.benchmark'
+
+    __ROM_EXTENSION = '.zip'
+    __MEDIA_EXTENSION = '.png'
+
+    __PLATFORMS_FOLDERS = {
+        Platform.MICROSOFT_XBOX360: 'xbox360',
+        Platform.NINTENDO_64: 'n64',
+        Platform.NINTENDO_GAME_CUBE: 'gamecube',
+        Platform.SEGA_DREAMCAST: 'dreamcast',
+        Platform.SEGA_MASTERSYSTEM: 'mastersystem',
+        Platform.SEGA_MEGADRIVE: 'megadrive',
+        Platform.SONY_PLAYSTATION_2: 'ps2'
+    }
+
+    # Tags of media in Batocera's gamelist (with their sub folder)
+    __BATOCERA_MEDIA = [
+        ('image', 'images', Media.SCREENSHOT_GAME),
+        ('marquee', 'images', Media.LOGO),
+        ('thumbnail', 'images', Media.BOX_3D),
+        ('fanart', 'images', Media.FAN_ART),
+        ('titleshot', 'images', Media.SCREENSHOT_TITLE),
+        ('boxback', 'images', Media.BOX_2D_BACK),
+        ('bezel', 'images', Media.BEZEL),
+        ('manual', 'manuals', Media.MANUAL),
+        ('video', 'videos', Media.VIDEO)
+    ]
+
+    # Folders of media for Skraper
+    __SKRAPER_MEDIA = [
+        ('screenshot', Media.SCREENSHOT_GAME),
+        ('wheel', Media.LOGO),
+        ('box3d', Media.BOX_3D),
+        ('fanart', Media.FAN_ART),
+        ('screenshottitle', Media.SCREENSHOT_TITLE),
+        ('box2dback', Media.BOX_2D_BACK),
+        ('box2dfront', Media.BOX_2D_FRONT),
+        ('manuals', Media.MANUAL),
+        ('videos', Media.VIDEO)
+    ]
+
+    def __init__(
+        self,
+        working_path: str,
+        platforms: list[Platform],
+        games_count: int,
+        media_count: int,
+        rom_size: int,
+        media_size: int,
+        gamelist_count: int = None,
+        seed: int = 0
+    ):
+        """Initialize generator (the gamelist lists games without rom if bigger than the number of
+        games)"""
+
+        self.__working_path = working_path
+        self.__platforms = platforms
+        self.__games_count = games_count
+        self.__media_count = media_count
+        self.__rom_size = rom_size
+        self.__media_size = media_size
+        self.__gamelist_count = max(gamelist_count or games_count, games_count)
+        self.__random = random.Random(seed)
+
+    def get_software_path(self, software: Software) -> str:
+        """Get the path of a software's tree"""
+
+        return os.path.join(
+            self.__working_path,
+            'softwares',
+            software.value.lower()
+        )
+
+    @staticmethod
+    def __build_game_id(index: int) -> str:
+        """Build the id of a game (basename of its rom)"""
+
+        return f'game_{index:06d}'
+
+    @staticmethod
+    def __build_game_name(index: int) -> str:
+        """Build the name of a game"""
+
+        return f'Synthetic Game {index:06d} (Europe)'
+
+    def __write_random_file(self, file_path: str, size: int):
+        """Write a file with random content"""
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, mode='wb') as file:
+            file.write(self.__random.randbytes(size))
+
+    def clean(self):
+        """Clean the working folder (refused if not generated by a benchmark)"""
+
+        if os.path.isdir(self.__working_path) and len(os.listdir(self.__working_path)) > 0 and \
+                not os.path.isfile(os.path.join(self.__working_path, self.MARKER_FILE_NAME)):
+            raise Exception(
+                f'{self.__working_path} is not empty and was not generated by a benchmark!'
+            )
+
+        # Logs are kept (files opened by loggers)
+        os.makedirs(self.__working_path, exist_ok=True)
+        for entry in os.listdir(self.__working_path):
+            entry_path = os.path.join(self.__working_path, entry)
+            if os.path.normpath(entry_path) == os.path.normpath(Context.get_logs_path()):
+                continue
+            if os.path.isdir(entry_path):
+                shutil.rmtree(entry_path)
+            else:
+                os.remove(entry_path)
+        with open(
+            os.path.join(self.__working_path, self.MARKER_FILE_NAME),
+            mode='w',
+            encoding='UTF-8'
+        ):
+            pass
+
+    def write_setup(self, softwares: list[Software]):
+        """Write the setup file using the generated trees of softwares"""
+
+        setup_path = os.path.join(self.__working_path, 'setup')
+        os.makedirs(setup_path, exist_ok=True)
+        lines = [
+            '[DEFAULT]',
+            'lang_code = en',
+            'monitor = 0',
+            'simulated = False',
+            'deferred_deletion = False',
+            f'available_softwares = {[software.value for software in softwares]}'
+        ]
+        for software in softwares:
+            lines.append(
+                f'software_{software.name.lower()}_path = {self.get_software_path(software)}'
+            )
+        with open(
+            os.path.join(setup_path, f'{Context.get_hostname()}.cfg'),
+            mode='w',
+            encoding='UTF-8'
+        ) as file:
+            file.write('\n'.join(lines) + '\n')
+
+    def generate_batocera(self):
+        """Generate a Batocera's tree (roms, media and gamelist by platform)"""
+
+        for platform in self.__platforms:
+            platform_path = os.path.join(
+                self.get_software_path(Software.BATOCERA),
+                'roms',
+                self.__PLATFORMS_FOLDERS[platform]
+            )
+            games = []
+            for index in range(self.__gamelist_count):
+                game_id = self.__build_game_id(index)
+                if index < self.__games_count:
+                    self.__write_random_file(
+                        file_path=os.path.join(platform_path, game_id + self.__ROM_EXTENSION),
+                        size=self.__rom_size
+                    )
+                tags = [
+                    f'\t\t<path>./{game_id}{self.__ROM_EXTENSION}</path>',
+                    f'\t\t<name>{escape(self.__build_game_name(index))}</name>'
+                ]
+                for tag, folder, _ in self.__BATOCERA_MEDIA[:self.__media_count]:
+                    media_file = f'{folder}/{game_id}-{tag}{self.__MEDIA_EXTENSION}'
+                    if index < self.__games_count:
+                        self.__write_random_file(
+                            file_path=os.path.join(platform_path, media_file),
+                            size=self.__media_size
+                        )
+                    tags.append(f'\t\t<{tag}>./{media_file}</{tag}>')
+                games.append('\t<game>\n' + '\n'.join(tags) + '\n\t</game>')
+
+            with open(
+                os.path.join(platform_path, 'gamelist.xml'),
+                mode='w',
+                encoding='UTF-8'
+            ) as file:
+                file.write(
+                    '<?xml version="1.0"?>\n<gameList>\n' + '\n'.join(games) + '\n</gameList>\n'
+                )
+
+    def generate_skraper(self):
+        """Generate a Skraper's tree (roms, media's folders and gamelist by platform)"""
+
+        for platform in self.__platforms:
+            platform_path = os.path.join(
+                self.get_software_path(Software.SKRAPER),
+                self.__PLATFORMS_FOLDERS[platform]
+            )
+            games = []
+            for index in range(self.__gamelist_count):
+                game_id = self.__build_game_id(index)
+                if index < self.__games_count:
+                    self.__write_random_file(
+                        file_path=os.path.join(platform_path, game_id + self.__ROM_EXTENSION),
+                        size=self.__rom_size
+                    )
+                    for folder, _ in self.__SKRAPER_MEDIA[:self.__media_count]:
+                        self.__write_random_file(
+                            file_path=os.path.join(
+                                platform_path,
+                                'media',
+                                folder,
+                                game_id + self.__MEDIA_EXTENSION
+                            ),
+                            size=self.__media_size
+                        )
+                games.append(
+                    '  <game>\n'
+                    f'    <path>./{game_id}{self.__ROM_EXTENSION}</path>\n'
+                    f'    <name>{escape(self.__build_game_name(index))}</name>\n'
+                    '  </game>'
+                )
+
+            with open(
+                os.path.join(platform_path, 'gamelist.xml'),
+                mode='w',
+                encoding='UTF-8'
+            ) as file:
+                file.write(
+                    '<?xml version="1.0"?>\n<gameList>\n' + '\n'.join(games) + '\n</gameList>\n'
+                )
+
+    def generate_games_store(self, software: Software):
+        """Generate the games store (rom, media and game info of a software for each game)"""
+
+        for platform in self.__platforms:
+            for index in range(self.__games_count):
+                game_id = self.__build_game_id(index)
+                game_path = os.path.join(Context.get_games_path(), platform.value, game_id)
+                self.__write_random_file(
+                    file_path=os.path.join(
+                        game_path,
+                        AbstractGamesExecutor.ROM_FOLDER_NAME,
+                        game_id + self.__ROM_EXTENSION
+                    ),
+                    size=self.__rom_size
+                )
+                for _, media in self.__SKRAPER_MEDIA[:self.__media_count]:
+                    self.__write_random_file(
+                        file_path=os.path.join(
+                            game_path,
+                            AbstractGamesExecutor.MEDIA_FOLDER_NAME,
+                            media.value + self.__MEDIA_EXTENSION
+                        ),
+                        size=self.__media_size
+                    )
+                with open(
+                    os.path.join(game_path, f'{software.value.lower()}.xml'),
+                    mode='w',
+                    encoding='UTF-8'
+                ) as file:
+                    file.write(
+                        '<game>\n'
+                        f'\t\t<name>{escape(self.__build_game_name(index))}</name>\n'
+                        '\t</game>'
+                    )
+
+    def generate(self, software: Software):
+        """Generate the working folder for a software (its tree, the games store and the setup)"""
+
+        self.clean()
+        match(software):
+            case Software.BATOCERA:
+                self.generate_batocera()
+            case Software.SKRAPER:
+                self.generate_skraper()
+            case _:
+                raise Exception(f'No generator for {software.value}!')
+        self.generate_games_store(software=software)
+        self.write_setup(softwares=[software])
@@ -1,15 +1,19 @@
 #!/usr/bin/python3
 """Dialog to execute in the application"""
 
+import collections
 import threading
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 
 from executor.executor_factory import ExecutorFactory
-from libraries.constants.constants import Constants
+from libraries.constants.constants import Constants, MetricsPhase
 from libraries.context.context import Context
+from libraries.event.event_bus import EventBus, EventType
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.execution_metrics import ExecutionMetrics
+from libraries.text.text_helper import TextHelper
 from libraries.ui.ui_helper import UIHelper
 
 # pylint: disable=attribute-defined-outside-init, too-many-locals
@@ -32,7 +36,10 @@ class ExecuteDialog:
         self.__executor = ExecutorFactory.create()
 
         # No execution is no confirmation
-        if not self.__executor.confirm_execution(
+        confirmation_message = self.__executor.retrieve_confirmation_message()
+        if confirmation_message is not None and not messagebox.askokcancel(
+            Context.get_text('confirmation'),
+            confirmation_message,
             parent=parent
         ):
             return
@@ -51,13 +58,13 @@ class ExecuteDialog:
         )
 
         # Add a progress bar
-        progress_bar = ttk.Progressbar(
+        self.progress_bar = ttk.Progressbar(
             self.dialog,
             orient=tk.HORIZONTAL,
             length=500,
             mode='determinate'
         )
-        progress_bar.pack(
+        self.progress_bar.pack(
             side=tk.TOP
         )
 
@@ -68,6 +75,14 @@ class ExecuteDialog:
             side=tk.TOP
         )
 
+        # Add a label for throughputs, ETA and time by phase
+        self.metrics_label = tk.Label(
+            self.dialog
+        )
+        self.metrics_label.pack(
+            side=tk.TOP
+        )
+
         # Create a textare with a scrollbar
         execution_frame = tk.Frame(self.dialog)
         execution_frame.pack(
@@ -78,14 +93,14 @@ class ExecuteDialog:
             pady=Constants.UI_PAD_BIG
         )
 
-        execution_area = tk.Text(
+        self.execution_area = tk.Text(
             execution_frame,
             wrap=tk.WORD,
             width=50,
             height=10
         )
-        execution_area.config(state=tk.DISABLED)
-        execution_area.pack(
+        self.execution_area.config(state=tk.DISABLED)
+        self.execution_area.pack(
             side=tk.LEFT,
             fill=tk.BOTH,
             expand=True
@@ -93,36 +108,32 @@ class ExecuteDialog:
 
         scrollbar = tk.Scrollbar(
             execution_frame,
-            command=execution_area.yview
+            command=self.execution_area.yview
         )
         scrollbar.pack(
             side=tk.RIGHT,
             fill=tk.Y
         )
-        execution_area.config(
+        self.execution_area.config(
             yscrollcommand=scrollbar.set
         )
 
-        # Button to close
-        button_close = tk.Button(
+        # Button to close (stop during execution)
+        self.button_close = tk.Button(
             self.dialog,
+            text=Context.get_text('stop'),
             command=self.__on_close
         )
-        button_close.pack(
+        self.button_close.pack(
             side=tk.TOP,
             pady=Constants.UI_PAD_BIG
         )
 
-        # Set log ui
-        LoggingHelper.set_log_ui(
-            log_ui=execution_area
-        )
-
-        # Set UI Components for executor
-        self.__executor.set_ui_components(
-            progress_bar=progress_bar,
-            progress_label=self.progress_label,
-            button_close=button_close
+        # Set event bus for executor (log of the execution posted to it)
+        self.__event_bus = EventBus()
+        self.__closing = False
+        self.__executor.set_event_bus(
+            event_bus=self.__event_bus
         )
 
         # Execute in a thread
@@ -131,61 +142,124 @@ class ExecuteDialog:
         )
         self.execution_thread.start()
 
+        # Process events posted by the execution
+        self.dialog.after(
+            Constants.UI_EVENTS_INTERVAL_MS,
+            self.__process_events
+        )
+
         # Bind closing event
         self.dialog.protocol("WM_DELETE_WINDOW", self.__on_close)
 
-    def __close_after_execution_stopped(self):
-        """Close after execution stopped"""
+    def __process_events(self):
+        """Process events posted since the last call (in UI's thread)"""
+
+        # Show events
+        # Only the last messages are kept as older ones would be trimmed from log area
+        log_messages = collections.deque(maxlen=Constants.UI_LOG_MAX_LINES)
+        for event_type, data in self.__event_bus.drain():
+            match(event_type):
+                case EventType.LOG:
+                    log_messages.append(f'\n{data["message"]}\n')
+
+                case EventType.PROGRESS | EventType.FINISHED:
+                    self.progress_bar.config(
+                        maximum=data['maximum'],
+                        value=data['value']
+                    )
+                    if not self.__closing:
+                        self.progress_label.config(
+                            text=data['text']
+                        )
+                    if event_type == EventType.FINISHED:
+                        self.button_close.config(
+                            text=Context.get_text('close')
+                        )
+
+        # Show metrics while executing
+        if not self.__executor.is_execution_finished():
+            self.__show_metrics()
+
+        # Add log messages in one insertion
+        if len(log_messages) > 0:
+            self.execution_area.config(state=tk.NORMAL)
+            self.execution_area.insert(tk.END, ''.join(log_messages))
+
+            # Trim older lines from log area
+            lines_count = int(self.execution_area.index('end-1c').split('.', maxsplit=1)[0])
+            if lines_count > Constants.UI_LOG_MAX_LINES:
+                self.execution_area.delete(
+                    '1.0',
+                    f'{lines_count - Constants.UI_LOG_MAX_LINES + 1}.0'
+                )
+            self.execution_area.config(state=tk.DISABLED)
+            self.execution_area.see('end')
+
+        # Close if execution stopped
+        if self.__closing and not self.execution_thread.is_alive():
+            self.__close()
+            return
 
-        # Update progress label
-        self.progress_label.config(
-            text=Context.get_text('waiting_for_stopping')
+        self.dialog.after(
+            Constants.UI_EVENTS_INTERVAL_MS,
+            self.__process_events
         )
 
-        # Log a waiting message
-        LoggingHelper.log_info(
-            message=Context.get_text('waiting_for_stopping')
+    def __show_metrics(self):
+        """Show throughputs, ETA and time by phase of the execution"""
+
+        snapshot = self.__executor.get_metrics().snapshot()
+        phases = snapshot[ExecutionMetrics.KEY_PHASES]
+        items_per_second = snapshot[ExecutionMetrics.KEY_ITEMS_PER_SECOND]
+        files_per_second = snapshot[ExecutionMetrics.KEY_FILES_PER_SECOND]
+        self.metrics_label.config(
+            text=Context.get_text(
+                'execution_metrics',
+                items_per_second=f'{items_per_second:.2f}' if items_per_second is not None else '-',
+                files_per_second=f'{files_per_second:.2f}' if files_per_second is not None else '-',
+                bytes_per_second=TextHelper.format_bytes(
+                    snapshot[ExecutionMetrics.KEY_BYTES_PER_SECOND]
+                ) or '-',
+                eta=TextHelper.format_duration(snapshot[ExecutionMetrics.KEY_ETA]) or '-',
+                read=f'{phases[MetricsPhase.READ]:.1f}',
+                write=f'{phases[MetricsPhase.WRITE]:.1f}',
+                xml=f'{phases[MetricsPhase.XML]:.1f}'
+            )
         )
 
-        # Signal the thread to stop
-        self.__executor.stop_execution()
-
-        # Wait for the thread to finish
-        self.execution_thread.join()
+    def __close(self):
+        """Close the dialog"""
 
-        # Unset log ui
-        LoggingHelper.set_log_ui(
-            log_ui=None
-        )
+        # Close the dialog
+        UIHelper.close_dialog(self.dialog)
 
         # Call back
         self.__callback()
 
-        # Close the dialog
-        UIHelper.close_dialog(self.dialog)
-
     def __on_close(self):
         """Called when closing"""
 
-        if self.__executor.is_execution_finished():
-            # Unset log ui
-            LoggingHelper.set_log_ui(
-                log_ui=None
-            )
-
-            # Close the dialog
-            UIHelper.close_dialog(self.dialog)
+        if self.__closing:
+            return
 
-            # Call back
-            self.__callback()
+        if self.__executor.is_execution_finished():
+            self.__close()
 
         elif messagebox.askokcancel(
             Context.get_text('confirmation'),
             Context.get_text('confirm_stop_execution'),
             parent=self.dialog
         ):
-            # Call a thread to close after execution stopped
-            close_thread = threading.Thread(
-                target=self.__close_after_execution_stopped
+            # Update progress label
+            self.progress_label.config(
+                text=Context.get_text('waiting_for_stopping')
             )
-            close_thread.start()
+
+            # Log a waiting message
+            LoggingHelper.log_info(
+                message=Context.get_text('waiting_for_stopping')
+            )
+
+            # Signal the thread to stop, the dialog is closed when stopped
+            self.__executor.stop_execution()
+            self.__closing = True
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+"""Dialog to show the operation queue of the application"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from executor.queue.operation_job import OperationJob
+from executor.queue.operation_queue import OperationQueue
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+from libraries.text.text_helper import TextHelper
+from libraries.ui.ui_helper import UIHelper
+
+
+class QueueDialog:
+    """Dialog to show the operation queue of the application (without blocking the window)"""
+
+    __COLUMNS = [
+        'job_name',
+        'job_state',
+        'job_progress',
+        'job_throughput',
+        'job_eta'
+    ]
+
+    def __init__(
+        self,
+        parent,
+        callback: any
+    ):
+        """Initialize dialog"""
+
+        self.__callback = callback
+        self.__jobs: list[OperationJob] = []
+        self.__ended_jobs_count = 0
+
+        # Create dialog
+        self.dialog = tk.Toplevel(parent)
+
+        # Fix dialog's title
+        self.dialog.title(Context.get_text('queue'))
+
+        # Fix dialog's size and position
+        UIHelper.center_dialog(
+            dialog=self.dialog,
+            width=800,
+            height=400,
+            modal=False
+        )
+
+        # Add the list of jobs
+        self.tree = ttk.Treeview(
+            self.dialog,
+            columns=self.__COLUMNS,
+            show='headings',
+            selectmode='browse'
+        )
+        for column in self.__COLUMNS:
+            self.tree.heading(
+                column,
+                text=Context.get_text(column)
+            )
+            self.tree.column(
+                column,
+                width=300 if column == 'job_name' else 100
+            )
+        self.tree.pack(
+            side=tk.TOP,
+            fill=tk.BOTH,
+            expand=True,
+            padx=Constants.UI_PAD_BIG,
+            pady=Constants.UI_PAD_BIG
+        )
+
+        # Add buttons
+        buttons_frame = tk.Frame(self.dialog)
+        buttons_frame.pack(
+            side=tk.TOP,
+            pady=Constants.UI_PAD_BIG
+        )
+        tk.Button(
+            buttons_frame,
+            text=Context.get_text('stop'),
+            command=self.__stop_selected_job
+        ).pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        tk.Button(
+            buttons_frame,
+            text=Context.get_text('remove_ended_jobs'),
+            command=self.__remove_ended_jobs
+        ).pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        tk.Button(
+            buttons_frame,
+            text=Context.get_text('close'),
+            command=self.__close
+        ).pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+
+        # Bind closing event
+        self.dialog.protocol("WM_DELETE_WINDOW", self.__close)
+
+        # Refresh jobs periodically
+        self.__refresh()
+
+    def __refresh(self):
+        """Refresh jobs"""
+
+        # Keep selection
+        selection = self.tree.selection()
+        selected_idx = self.tree.index(selection[0]) if len(selection) > 0 else None
+
+        self.__jobs = OperationQueue.list_jobs()
+        self.tree.delete(*self.tree.get_children())
+        for job in self.__jobs:
+            throughput = job.compute_throughput()
+            self.tree.insert(
+                '',
+                tk.END,
+                values=(
+                    job.get_name(),
+                    Context.get_text(job.get_state().value),
+                    f'{job.get_executed_items()}/{job.get_total_items()}',
+                    f'{throughput:.2f}/s' if throughput is not None else '',
+                    TextHelper.format_duration(job.compute_eta())
+                )
+            )
+        if selected_idx is not None and selected_idx < len(self.__jobs):
+            self.tree.selection_set(self.tree.get_children()[selected_idx])
+
+        # Call back when a job ended (to refresh the window)
+        ended_jobs_count = len([job for job in self.__jobs if job.is_ended()])
+        if ended_jobs_count > self.__ended_jobs_count:
+            self.__callback()
+        self.__ended_jobs_count = ended_jobs_count
+
+        self.dialog.after(
+            Constants.UI_QUEUE_INTERVAL_MS,
+            self.__refresh
+        )
+
+    def __stop_selected_job(self):
+        """Stop the selected job"""
+
+        selection = self.tree.selection()
+        if len(selection) == 0:
+            return
+
+        self.__jobs[self.tree.index(selection[0])].stop()
+
+    def __remove_ended_jobs(self):
+        """Remove ended jobs"""
+
+        OperationQueue.remove_ended_jobs()
+        self.__ended_jobs_count = 0
+
+    def __close(self):
+        """Close the dialog (jobs are still executed)"""
+
+        UIHelper.close_dialog(self.dialog)
@@ -7,7 +7,7 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog
 
-from libraries.constants.constants import Constants, Software
+from libraries.constants.constants import Constants, Profiling, Software
 from libraries.context.context import Context
 from libraries.ui.ui_helper import UIHelper
 
@@ -37,7 +37,7 @@ class SetupDialog:
         UIHelper.center_dialog(
             dialog=self.dialog,
             width=800,
-            height=400
+            height=470
         )
 
         # Create top frame
@@ -107,6 +107,12 @@ class SetupDialog:
         # Retrieve general setup
         simulated = self.simulation_boolean_var.get()
         monitor = int(self.combo_monitor.get()) - 1
+        deferred_deletion = self.deferred_deletion_boolean_var.get()
+        trash_retention_days = int(self.combo_trash_retention_days.get())
+        verify_bandwidth_mbps = int(self.combo_verify_bandwidth_mbps.get())
+        deduplicated_media = self.deduplicated_media_boolean_var.get()
+        ui_log_level = self.combo_ui_log_level.get()
+        profiling = self.__retrieve_selected_profiling()
 
         # Retrieve softwares setup
         available_softwares = []
@@ -125,6 +131,12 @@ class SetupDialog:
             Constants.SETUP_LANG_CODE: self.__lang_code,
             Constants.SETUP_MONITOR: monitor,
             Constants.SETUP_SIMULATED: simulated,
+            Constants.SETUP_DEFERRED_DELETION: deferred_deletion,
+            Constants.SETUP_TRASH_RETENTION_DAYS: trash_retention_days,
+            Constants.SETUP_VERIFY_BANDWIDTH_MBPS: verify_bandwidth_mbps,
+            Constants.SETUP_DEDUPLICATED_MEDIA: deduplicated_media,
+            Constants.SETUP_UI_LOG_LEVEL: ui_log_level,
+            Constants.SETUP_PROFILING: profiling.name,
             Constants.SETUP_AVAILABLE_SOFTWARES: available_softwares
         }
 
@@ -163,6 +175,16 @@ class SetupDialog:
         # Call back
         self.__callback()
 
+    def __retrieve_selected_profiling(self) -> Profiling:
+        """Retrieve the profiling selected in its combo (shown in any lang)"""
+
+        for profiling in Profiling:
+            for lang_code in ['en', 'fr']:
+                if self.combo_profiling.get() == Context.get_text(profiling.value, lang=lang_code):
+                    return profiling
+
+        return Profiling.OFF
+
     def __cancel(self):
         """Cancel"""
 
@@ -369,6 +391,186 @@ class SetupDialog:
             lambda e: simulation_checkbox.invoke()
         )
 
+        # Create deferred deletion checkbox with trash retention
+        deferred_deletion_frame = tk.Frame(self.general_frame)
+        deferred_deletion_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.deferred_deletion_boolean_var = tk.BooleanVar()
+        self.deferred_deletion_boolean_var.trace_add(
+            "write",
+            self.__on_entry_changed
+        )
+        self.deferred_deletion_boolean_var.set(
+            Context.is_deferred_deletion()
+        )
+        deferred_deletion_checkbox = tk.Checkbutton(
+            deferred_deletion_frame,
+            variable=self.deferred_deletion_boolean_var
+        )
+        deferred_deletion_checkbox.pack(
+            side=tk.LEFT,
+        )
+        self.label_deferred_deletion = tk.Label(
+            deferred_deletion_frame
+        )
+        self.label_deferred_deletion.pack(
+            side=tk.LEFT
+        )
+        self.label_deferred_deletion.bind(
+            "<Button-1>",
+            lambda e: deferred_deletion_checkbox.invoke()
+        )
+        self.combo_trash_retention_days = ttk.Combobox(
+            deferred_deletion_frame,
+            values=[0, 1, 7, 30],
+            width=5
+        )
+        self.combo_trash_retention_days.set(
+            Context.get_trash_retention_days()
+        )
+        self.combo_trash_retention_days.config(state="readonly")
+        self.combo_trash_retention_days.pack(
+            side=tk.RIGHT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.label_trash_retention_days = tk.Label(
+            deferred_deletion_frame
+        )
+        self.label_trash_retention_days.pack(
+            side=tk.RIGHT,
+            padx=Constants.UI_PAD_SMALL
+        )
+
+        # Create deduplicated media checkbox
+        deduplicated_media_frame = tk.Frame(self.general_frame)
+        deduplicated_media_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.deduplicated_media_boolean_var = tk.BooleanVar()
+        self.deduplicated_media_boolean_var.trace_add(
+            "write",
+            self.__on_entry_changed
+        )
+        self.deduplicated_media_boolean_var.set(
+            Context.is_deduplicated_media()
+        )
+        deduplicated_media_checkbox = tk.Checkbutton(
+            deduplicated_media_frame,
+            variable=self.deduplicated_media_boolean_var
+        )
+        deduplicated_media_checkbox.pack(
+            side=tk.LEFT,
+        )
+        self.label_deduplicated_media = tk.Label(
+            deduplicated_media_frame
+        )
+        self.label_deduplicated_media.pack(
+            side=tk.LEFT
+        )
+        self.label_deduplicated_media.bind(
+            "<Button-1>",
+            lambda e: deduplicated_media_checkbox.invoke()
+        )
+
+        # Create combo for the bandwidth of verifications
+        verify_bandwidth_frame = tk.Frame(self.general_frame)
+        verify_bandwidth_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.label_verify_bandwidth_mbps = tk.Label(
+            verify_bandwidth_frame
+        )
+        self.label_verify_bandwidth_mbps.pack(
+            side=tk.LEFT
+        )
+        self.combo_verify_bandwidth_mbps = ttk.Combobox(
+            verify_bandwidth_frame,
+            values=[0, 25, 50, 100, 200, 500],
+            width=5
+        )
+        self.combo_verify_bandwidth_mbps.set(
+            Context.get_verify_bandwidth_mbps()
+        )
+        self.combo_verify_bandwidth_mbps.config(state="readonly")
+        self.combo_verify_bandwidth_mbps.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.combo_verify_bandwidth_mbps.bind(
+            "<<ComboboxSelected>>",
+            self.__on_entry_changed
+        )
+
+        # Create combo for the log level shown in UI
+        ui_log_level_frame = tk.Frame(self.general_frame)
+        ui_log_level_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.label_ui_log_level = tk.Label(
+            ui_log_level_frame
+        )
+        self.label_ui_log_level.pack(
+            side=tk.LEFT
+        )
+        self.combo_ui_log_level = ttk.Combobox(
+            ui_log_level_frame,
+            values=Constants.UI_LOG_LEVELS,
+            width=10
+        )
+        self.combo_ui_log_level.set(
+            Context.get_ui_log_level_name()
+        )
+        self.combo_ui_log_level.config(state="readonly")
+        self.combo_ui_log_level.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.combo_ui_log_level.bind(
+            "<<ComboboxSelected>>",
+            self.__on_entry_changed
+        )
+
+        # Create combo for the profiling of executions
+        profiling_frame = tk.Frame(self.general_frame)
+        profiling_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.label_profiling = tk.Label(
+            profiling_frame
+        )
+        self.label_profiling.pack(
+            side=tk.LEFT
+        )
+        self.combo_profiling = ttk.Combobox(
+            profiling_frame,
+            width=30
+        )
+        self.combo_profiling.config(state="readonly")
+        self.combo_profiling.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.combo_profiling.bind(
+            "<<ComboboxSelected>>",
+            self.__on_entry_changed
+        )
+
     def __create_softwares_components(self):
         """Create softwares components"""
 
@@ -778,6 +980,59 @@ class SetupDialog:
             )
         )
 
+        self.label_deferred_deletion.config(
+            text=Context.get_text(
+                'deferred_deletion',
+                lang=self.__lang_code
+            )
+        )
+
+        self.label_trash_retention_days.config(
+            text=Context.get_text(
+                'trash_retention_days',
+                lang=self.__lang_code
+            )
+        )
+
+        self.label_deduplicated_media.config(
+            text=Context.get_text(
+                'deduplicated_media',
+                lang=self.__lang_code
+            )
+        )
+
+        self.label_verify_bandwidth_mbps.config(
+            text=Context.get_text(
+                'verify_bandwidth_mbps',
+                lang=self.__lang_code
+            )
+        )
+
+        self.label_ui_log_level.config(
+            text=Context.get_text(
+                'ui_log_level',
+                lang=self.__lang_code
+            )
+        )
+
+        self.label_profiling.config(
+            text=Context.get_text(
+                'profiling',
+                lang=self.__lang_code
+            )
+        )
+        selected_profiling = self.__retrieve_selected_profiling() \
+            if self.combo_profiling.get() else Context.get_profiling()
+        self.combo_profiling.config(
+            values=[
+                Context.get_text(profiling.value, lang=self.__lang_code)
+                for profiling in Profiling
+            ]
+        )
+        self.combo_profiling.set(
+            Context.get_text(selected_profiling.value, lang=self.__lang_code)
+        )
+
         self.softwares_frame.config(
             text=Context.get_text(
                 'setup_softwares',
@@ -3,39 +3,90 @@
 
 from abc import ABC, abstractmethod
 import threading
-import tkinter as tk
-from tkinter import ttk
 
-from libraries.constants.constants import Action, Category, Constants
+from executor.execution_journal import ExecutionJournal
+from libraries.constants.constants import Action, Category, Component, Constants, MetricsPhase
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.event.event_bus import EventBus, EventType
+from libraries.file.file_helper import FileHelper
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.execution_metrics import ExecutionMetrics
+from libraries.profiling.profiling_helper import ProfilingHelper
+from libraries.storage.metadata_cache import MetadataCache
+from libraries.text.text_helper import TextHelper
+from libraries.xml.xml_helper import XmlHelper
+from manager.abstract_manager import AbstractManager
 
+# pylint: disable=too-many-instance-attributes
 
 class AbstractExecutor(ABC):
     """Abstract Executor (Common for all executors)"""
 
     def __init__(
-        self
+        self,
+        execution_context: ExecutionContext = None
     ):
-        """Initialize executor"""
+        """Initialize executor for an execution context (created from the context if not
+        specified)"""
 
+        # Keep a snapshot of the selection (the context may change during execution)
+        self._execution_context = execution_context if execution_context is not None \
+            else ExecutionContext.create()
         self.__execution_finished: bool = False
         self.__stop_execution = threading.Event()
-        self.__progress_bar = None
-        self.__progress_label = None
-        self.__button_close = None
+        self.__event_bus: EventBus = None
+        self.__log_event_bus: EventBus = None
+        self.__journal: ExecutionJournal = None
+        self._metrics = ExecutionMetrics(
+            total_items=len(self._execution_context.rows)
+        )
+        self.__shared_metrics: bool = False
+
+    def set_event_bus(
+        self,
+        event_bus: EventBus
+    ):
+        """Set the event bus to post progress (and log if no event bus is set for log)"""
+
+        self.__event_bus = event_bus
+
+    def set_log_event_bus(
+        self,
+        event_bus: EventBus
+    ):
+        """Set the event bus to post log of the execution"""
+
+        self.__log_event_bus = event_bus
 
-    def set_ui_components(
+    def get_metrics(self) -> ExecutionMetrics:
+        """Get metrics of the execution"""
+
+        return self._metrics
+
+    def set_metrics(
         self,
-        progress_bar: ttk.Progressbar,
-        progress_label: tk.Label,
-        button_close: tk.Button
+        metrics: ExecutionMetrics
     ):
-        """Set UI Components"""
+        """Set metrics shared with other executors (summary logged by their owner)"""
+
+        self._metrics = metrics
+        self.__shared_metrics = True
+
+    def get_execution_context(self) -> ExecutionContext:
+        """Get execution context"""
+
+        return self._execution_context
 
-        self.__progress_bar = progress_bar
-        self.__progress_label = progress_label
-        self.__button_close = button_close
+    def get_rows(self) -> list:
+        """Get rows to execute"""
+
+        return list(self._execution_context.rows)
+
+    def get_components(self) -> list[Component]:
+        """Get components to execute"""
+
+        return list(self._execution_context.components)
 
     def stop_execution(self):
         """Stop execution"""
@@ -47,55 +98,155 @@ class AbstractExecutor(ABC):
 
         return self.__execution_finished
 
-    # pylint: disable=unused-argument
-    def confirm_execution(self, parent: any) -> True:
-        """Confirm for execution"""
+    def retrieve_confirmation_message(self) -> str:
+        """Retrieve the message to confirm before execution (None if no confirmation)"""
 
         # No confirmation by default
-        return True
+        return None
 
     def execute(self):
-        """Execute"""
+        """Execute (with the execution context bound to the current thread)"""
 
-        if self.__progress_bar is None or \
-            self.__progress_label is None or \
-                self.__button_close is None:
-            raise Exception('Missing UI components!')
+        if self.__event_bus is None:
+            raise Exception('Missing event bus!')
 
-        # Fix text Stop for button to close
-        self.__button_close.config(
-            text=Context.get_text('stop')
+        self._execution_context.bind()
+        self._metrics.bind()
+        LoggingHelper.bind_event_bus(
+            event_bus=self.__log_event_bus if self.__log_event_bus is not None
+            else self.__event_bus
         )
+        profiled = ProfilingHelper.start(
+            profiling=self._execution_context.profiling,
+            classes=[FileHelper, XmlHelper, LoggingHelper, AbstractManager] +
+            AbstractManager.__subclasses__()
+        )
+        try:
+            # Start metrics when the execution starts (not when queued or confirmed)
+            if not self.__shared_metrics:
+                self._metrics.start()
+
+            # Cache folders' listings and files' stats during the execution
+            with MetadataCache.scope():
+                self.__execute_rows()
+        finally:
+            self._finish_execution()
+            if profiled:
+                self.__write_profiling_report()
+            if not self.__shared_metrics:
+                self._log_metrics_summary()
+            LoggingHelper.unbind_event_bus()
+            ExecutionMetrics.unbind()
+            ExecutionContext.unbind()
+
+    def __write_profiling_report(self):
+        """Stop profiling and log the path of the report (written by the first execution
+        profiled if several are executed in parallel)"""
+
+        report_path = ProfilingHelper.stop(
+            name=f'{self.get_category().name}_{self.get_action().name}'.lower()
+        )
+        if report_path is not None:
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'profiling_report_written',
+                    file=report_path
+                )
+            )
+
+    def _log_metrics_summary(self):
+        """Log the summary of metrics (items, files, bytes and time by phase)"""
+
+        snapshot = self._metrics.snapshot()
+        phases = snapshot[ExecutionMetrics.KEY_PHASES]
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'execution_metrics_summary',
+                item_current_counter=snapshot[ExecutionMetrics.KEY_ITEMS],
+                item_total_counter=snapshot[ExecutionMetrics.KEY_TOTAL_ITEMS],
+                files=snapshot[ExecutionMetrics.KEY_FILES],
+                bytes=TextHelper.format_bytes(snapshot[ExecutionMetrics.KEY_BYTES]),
+                duration=TextHelper.format_duration(snapshot[ExecutionMetrics.KEY_ELAPSED]),
+                read=f'{phases[MetricsPhase.READ]:.1f}',
+                write=f'{phases[MetricsPhase.WRITE]:.1f}',
+                xml=f'{phases[MetricsPhase.XML]:.1f}'
+            )
+        )
+
+    def __execute_rows(self):
+        """Execute rows"""
 
         # Show message for execution started
         LoggingHelper.log_info(
             message=Context.get_text(
                 'execution_started',
                 action=Context.get_text(
-                    Context.get_selected_action().value,
+                    self.get_action().value,
                     category=Context.get_text(
-                        Context.get_selected_category().value
+                        self.get_category().value
                     )
                 )
             )
         )
 
-        # Retrieve selected rows
-        rows = Context.get_selected_rows()
+        # Retrieve rows
+        rows = self._execution_context.rows
+
+        # Load journal to resume a previous execution
+        self.__journal = ExecutionJournal(
+            key=self.build_journal_key(rows=rows)
+        )
+        if self.__journal.count_completed_items() > 0:
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'execution_resumed',
+                    item_counter=self.__journal.count_completed_items()
+                )
+            )
 
-        # Initialize progress bar
-        self.__progress_bar.config(maximum=len(rows))
+        # Prepare execution for all rows
+        self._prepare_execution(rows=rows)
 
         item_current_counter = 1
+        batch: list[dict] = []
         for row in rows:
 
-            # Continue if execution stopped
+            # Continue if execution stopped (journal kept to resume, items of the batch not
+            # executed)
             if self.__stop_execution.is_set():
+                self.__journal.close()
                 return
 
-            # Increment progress bar
-            self.__progress_bar['value'] = item_current_counter
-            self.__progress_label.config(
+            # Execute again from the start an item completed by a previous execution but not
+            # applied anymore
+            if self.__journal.is_item_completed(
+                item_id=row[Constants.UI_TABLE_KEY_COL_ID]
+            ) and not self.verify_execution(item=row):
+                self.__journal.reset_item(
+                    item_id=row[Constants.UI_TABLE_KEY_COL_ID]
+                )
+
+            # Skip item if completed by a previous execution
+            if self.__journal.is_item_completed(
+                item_id=row[Constants.UI_TABLE_KEY_COL_ID]
+            ):
+                LoggingHelper.log_info(
+                    message=Context.get_text(
+                        'execution_skipped',
+                        item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
+                        item_current_counter=item_current_counter,
+                        item_total_counter=len(rows)
+                    )
+                )
+                self._metrics.add_item(skipped=True)
+                item_current_counter += 1
+                continue
+
+            # Post progress
+            self.__event_bus.post(
+                EventType.PROGRESS,
+                value=item_current_counter,
+                maximum=len(rows),
                 text=Context.get_text(
                     'execution_in_progress',
                     item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
@@ -114,30 +265,22 @@ class AbstractExecutor(ABC):
                 )
             )
 
-            # Do execution for the current item
-            try:
-                self.do_execution(item=row)
-            except Exception as exc:
-                LoggingHelper.log_error(
-                    Context.get_text(
-                        'error_execution',
-                        item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
-                        error=str(exc)
-                    ),
-                    exc
-                )
+            item_current_counter += 1
 
-                # Stop execution if error
-                self.__execution_finished = True
+            # Do execution for the batch of the current item when full
+            batch.append(row)
+            if len(batch) < self._get_batch_size():
+                continue
+            if not self.__execute_batch(items=batch):
                 return
+            batch = []
 
-            item_current_counter += 1
+        # Do execution for the last batch
+        if len(batch) > 0 and not self.__execute_batch(items=batch):
+            return
 
-        # Finish progression
-        self.__progress_bar['value'] = item_current_counter
-        self.__progress_label.config(
-            text=Context.get_text('execution_finished')
-        )
+        # Delete journal as all items are completed
+        self.__journal.delete()
 
         # Show message for execution finished
         LoggingHelper.log_info(
@@ -145,11 +288,102 @@ class AbstractExecutor(ABC):
         )
         self.__execution_finished = True
 
-        # Fix text Close for button to close
-        self.__button_close.config(
-            text=Context.get_text('close')
+        # Post end of execution
+        self.__event_bus.post(
+            EventType.FINISHED,
+            value=len(rows),
+            maximum=len(rows),
+            text=Context.get_text('execution_finished')
         )
 
+    def __execute_batch(self, items: list[dict]) -> bool:
+        """Do execution for a batch of items and mark them as completed in journal, return False
+        if an error stopped the execution"""
+
+        try:
+            self.do_execution_many(items=items)
+        except Exception as exc:
+            LoggingHelper.log_error(
+                Context.get_text(
+                    'error_execution',
+                    item_name=', '.join(
+                        item[Constants.UI_TABLE_KEY_COL_NAME] for item in items
+                    ),
+                    error=str(exc)
+                ),
+                exc
+            )
+
+            # Stop execution if error (journal kept to resume)
+            self.__journal.close()
+            self.__execution_finished = True
+            return False
+
+        # Mark items as completed in journal
+        for item in items:
+            self.__journal.mark_item_completed(
+                item_id=item[Constants.UI_TABLE_KEY_COL_ID]
+            )
+            self._metrics.add_item()
+
+        return True
+
+    def build_journal_key(self, rows: list) -> dict:
+        """Build the key identifying an execution in journals"""
+
+        # A simulated execution doesn't resume a real one (and vice versa)
+        return {
+            'category': self.get_category().name,
+            'action': self.get_action().name,
+            'simulated': self._execution_context.simulated,
+            'components': sorted(
+                component.name for component in self._execution_context.components
+            ),
+            'items': sorted(
+                row[Constants.UI_TABLE_KEY_COL_ID] for row in rows
+            )
+        }
+
+    # pylint: disable=unused-argument
+    def _prepare_execution(self, rows: list):
+        """Prepare execution for rows before executing items (nothing by default)"""
+
+    def _finish_execution(self):
+        """Finish execution after executing items, even if stopped (nothing by default)"""
+
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        return True
+
+    def _get_batch_size(self) -> int:
+        """Get the number of items executed at once (one by default)"""
+
+        return 1
+
+    def do_execution_many(self, items: list[dict]):
+        """Do execution for a batch of items (each item executed by default)"""
+
+        for item in items:
+            self.do_execution(item=item)
+
+    def _is_step_done(self, item: dict, step: str) -> bool:
+        """Specify if a step is done for an item (by a previous execution)"""
+
+        return self.__journal is not None and self.__journal.is_step_done(
+            item_id=item[Constants.UI_TABLE_KEY_COL_ID],
+            step=step
+        )
+
+    def _mark_step_done(self, item: dict, step: str):
+        """Mark a step as done for an item"""
+
+        if self.__journal is not None:
+            self.__journal.mark_step_done(
+                item_id=item[Constants.UI_TABLE_KEY_COL_ID],
+                step=step
+            )
+
     @abstractmethod
     def get_category(self) -> Category:
         """Get Category"""
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""Execution Journal"""
+
+import hashlib
+import json
+import os
+
+from libraries.context.context import Context
+
+
+class ExecutionJournal:
+    """Journal on disk recording completed items and steps of an execution to resume it"""
+
+    __KEY_ITEM = 'item'
+    __KEY_STEP = 'step'
+    __KEY_COMPLETED = 'completed'
+    __KEY_RESET = 'reset'
+
+    def __init__(
+        self,
+        key: dict
+    ):
+        """Initialize journal for an execution identified by its key"""
+
+        digest = hashlib.sha1(
+            json.dumps(key, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        self.__file_path = os.path.join(
+            Context.get_journals_path(),
+            f'{digest}.jsonl'
+        )
+        self.__file = None
+        self.__completed_items: set[str] = set()
+        self.__done_steps: dict[str, set[str]] = {}
+
+        # Load the journal from a previous execution
+        if os.path.isfile(self.__file_path):
+            with open(self.__file_path, mode='r', encoding='UTF-8') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Ignore a line partially written when stopped
+                        continue
+                    item_id = entry[self.__KEY_ITEM]
+                    if entry.get(self.__KEY_RESET, False):
+                        self.__completed_items.discard(item_id)
+                        self.__done_steps.pop(item_id, None)
+                    elif entry.get(self.__KEY_COMPLETED, False):
+                        self.__completed_items.add(item_id)
+                    else:
+                        self.__done_steps.setdefault(item_id, set()).add(
+                            entry[self.__KEY_STEP]
+                        )
+
+    def __write(self, entry: dict):
+        """Write an entry in the journal"""
+
+        if self.__file is None:
+            os.makedirs(os.path.dirname(self.__file_path), exist_ok=True)
+            self.__file = open(  # pylint: disable=consider-using-with
+                self.__file_path,
+                mode='a',
+                encoding='UTF-8'
+            )
+        self.__file.write(json.dumps(entry) + '\n')
+        self.__file.flush()
+
+    def count_completed_items(self) -> int:
+        """Count completed items"""
+
+        return len(self.__completed_items)
+
+    def is_item_completed(self, item_id: str) -> bool:
+        """Specify if an item is completed"""
+
+        return item_id in self.__completed_items
+
+    def mark_item_completed(self, item_id: str):
+        """Mark an item as completed"""
+
+        self.__completed_items.add(item_id)
+        self.__write({
+            self.__KEY_ITEM: item_id,
+            self.__KEY_COMPLETED: True
+        })
+
+    def reset_item(self, item_id: str):
+        """Reset an item (not completed anymore and no step done)"""
+
+        self.__completed_items.discard(item_id)
+        self.__done_steps.pop(item_id, None)
+        self.__write({
+            self.__KEY_ITEM: item_id,
+            self.__KEY_RESET: True
+        })
+
+    def is_step_done(self, item_id: str, step: str) -> bool:
+        """Specify if a step is done for an item"""
+
+        return step in self.__done_steps.get(item_id, set())
+
+    def mark_step_done(self, item_id: str, step: str):
+        """Mark a step as done for an item"""
+
+        self.__done_steps.setdefault(item_id, set()).add(step)
+        self.__write({
+            self.__KEY_ITEM: item_id,
+            self.__KEY_STEP: step
+        })
+
+    def close(self):
+        """Close the journal (kept on disk to resume the execution)"""
+
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def delete(self):
+        """Delete the journal (execution finished)"""
+
+        self.close()
+        if os.path.isfile(self.__file_path):
+            os.remove(self.__file_path)
@@ -2,12 +2,23 @@
 """Executor Factory"""
 
 from executor.abstract_executor import AbstractExecutor
+from executor.games.clean_media.clean_media_games_executor import CleanMediaGamesExecutor
+from executor.games.compact.compact_games_executor import CompactGamesExecutor
+from executor.games.deduplicate.deduplicate_games_executor import DeduplicateGamesExecutor
 from executor.games.delete.delete_games_executor import DeleteGamesExecutor
 from executor.games.export.export_games_executor import ExportGamesExecutor
+from executor.games.hash.hash_games_executor import HashGamesExecutor
 from executor.games.install.install_games_executor import InstallGamesExecutor
+from executor.games.restore.restore_games_executor import RestoreGamesExecutor
+from executor.games.sync.sync_games_executor import SyncGamesExecutor
 from executor.games.uninstall.uninstall_games_executor import UninstallGamesExecutor
-from libraries.constants.constants import Action, Category
+from executor.games.verify.verify_games_executor import VerifyGamesExecutor
+from executor.platforms_scheduler import PlatformsScheduler
+from libraries.constants.constants import Action, Category, Constants, Platform
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+
+# pylint: disable=too-many-return-statements
 
 
 class ExecutorFactory:
@@ -15,17 +26,64 @@ class ExecutorFactory:
 
     @staticmethod
     def create() -> AbstractExecutor:
-        """Create Executor"""
+        """Create Executor for selected rows (executed in parallel if several platforms)"""
+
+        # Take a snapshot of the context for the execution
+        execution_context = ExecutionContext.create()
+
+        if len(Context.get_selected_platforms()) <= 1:
+            return ExecutorFactory.create_for_context(
+                execution_context=execution_context
+            )
+
+        # Create an executor per platform with its rows
+        executors: dict[Platform, AbstractExecutor] = {}
+        for platform in Context.get_selected_platforms():
+            platform_rows = [
+                row for row in execution_context.rows
+                if row.get(Constants.UI_TABLE_KEY_COL_PLATFORM, None) == platform.value
+            ]
+            if len(platform_rows) == 0:
+                continue
+            executors[platform] = ExecutorFactory.create_for_context(
+                execution_context=execution_context.replace(
+                    platform=platform,
+                    rows=platform_rows
+                )
+            )
+
+        return PlatformsScheduler(
+            execution_context=execution_context,
+            executors=executors
+        )
+
+    @staticmethod
+    def create_for_context(execution_context: ExecutionContext) -> AbstractExecutor:
+        """Create Executor for an execution context"""
 
-        if Context.get_selected_category() == Category.GAMES:
-            match(Context.get_selected_action()):
+        if execution_context.category == Category.GAMES:
+            match(execution_context.action):
                 case Action.EXPORT:
-                    return ExportGamesExecutor()
+                    return ExportGamesExecutor(execution_context=execution_context)
                 case Action.INSTALL:
-                    return InstallGamesExecutor()
+                    return InstallGamesExecutor(execution_context=execution_context)
                 case Action.UNINSTALL:
-                    return UninstallGamesExecutor()
+                    return UninstallGamesExecutor(execution_context=execution_context)
                 case Action.DELETE:
-                    return DeleteGamesExecutor()
+                    return DeleteGamesExecutor(execution_context=execution_context)
+                case Action.SYNC:
+                    return SyncGamesExecutor(execution_context=execution_context)
+                case Action.HASH:
+                    return HashGamesExecutor(execution_context=execution_context)
+                case Action.DEDUPLICATE:
+                    return DeduplicateGamesExecutor(execution_context=execution_context)
+                case Action.VERIFY:
+                    return VerifyGamesExecutor(execution_context=execution_context)
+                case Action.CLEAN_MEDIA:
+                    return CleanMediaGamesExecutor(execution_context=execution_context)
+                case Action.COMPACT:
+                    return CompactGamesExecutor(execution_context=execution_context)
+                case Action.RESTORE:
+                    return RestoreGamesExecutor(execution_context=execution_context)
 
         return None
@@ -1,9 +1,12 @@
 #!/usr/bin/python3
 """Abstract Games Executor"""
 
+import os
+
 from executor.abstract_executor import AbstractExecutor
-from libraries.constants.constants import Category
+from libraries.constants.constants import Category, Constants
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
 from manager.manager_factory import ManagerFactory
 
 # pylint: disable=too-many-branches
@@ -16,18 +19,39 @@ class AbstractGamesExecutor(AbstractExecutor):
     MEDIA_FOLDER_NAME = 'media'
 
     def __init__(
-        self
+        self,
+        execution_context: ExecutionContext = None
     ):
-        """Initialize executor"""
+        """Initialize executor for an execution context (created from the context if not
+        specified)"""
 
-        super().__init__()
+        super().__init__(execution_context=execution_context)
 
         # Retrieve software manager
         self._software_manager = ManagerFactory.create(
-            software=Context.get_selected_software()
+            software=self._execution_context.software
         )
 
     def get_category(self) -> Category:
         """Get Category"""
 
         return Category.GAMES
+
+    def build_journal_key(self, rows: list) -> dict:
+        """Build the key identifying an execution in journals"""
+
+        result = super().build_journal_key(rows=rows)
+        software = self._execution_context.software
+        result['software'] = software.name if software is not None else None
+        result['platform'] = self._execution_context.platform.name
+
+        return result
+
+    def _retrieve_game_folder_path(self, item: dict) -> str:
+        """Retrieve the game's folder in the games store"""
+
+        return os.path.join(
+            Context.get_games_path(),
+            self._execution_context.platform.value,
+            item[Constants.UI_TABLE_KEY_COL_ID]
+        )
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+"""Executor to clean media of Games"""
+
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from executor.games.clean_media.media_scanner import MediaScanner
+from libraries.constants.constants import Action, Constants
+from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.storage.storage_helper import StorageHelper
+from libraries.text.text_helper import TextHelper
+
+
+class CleanMediaGamesExecutor(AbstractGamesExecutor):
+    """Executor to delete orphaned media files selected in a Software (media are scanned again
+    before deleting so that only files still referenced by no game are deleted, missing media
+    files are reported)"""
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext = None
+    ):
+        """Initialize executor for an execution context (created from the context if not
+        specified)"""
+
+        super().__init__(execution_context=execution_context)
+
+        # Orphaned and missing media files scanned (by item's id), files deleted with their size
+        self.__orphaned_files: dict[str, str] = {}
+        self.__missing_files: dict[str, str] = {}
+        self.__deleted_files = 0
+        self.__deleted_bytes = 0
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return Action.CLEAN_MEDIA
+
+    def _prepare_execution(self, rows: list):
+        """Scan media again (files referenced since rows were built are kept)"""
+
+        scanner = MediaScanner(
+            software_manager=self._software_manager,
+            platform=self._execution_context.platform
+        )
+        orphaned_files, missing_files = scanner.scan()
+        self.__orphaned_files = {
+            scanner.build_item_id(file_path=file_path): file_path for file_path in orphaned_files
+        }
+        self.__missing_files = {
+            scanner.build_item_id(file_path=file_path): file_path for file_path in missing_files
+        }
+
+    def _finish_execution(self):
+        """Log the summary of the cleaning"""
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'media_clean_summary',
+                files=self.__deleted_files,
+                bytes=TextHelper.format_bytes(self.__deleted_bytes)
+            )
+        )
+
+    def do_execution(self, item: dict):
+        """Do execution for an item"""
+
+        # Report missing media files (referenced by a game)
+        item_id = item[Constants.UI_TABLE_KEY_COL_ID]
+        if item_id in self.__missing_files:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'media_missing_file',
+                    file=self.__missing_files[item_id]
+                )
+            )
+            return
+
+        # Keep media files not orphaned anymore
+        file_path = self.__orphaned_files.get(item_id, None)
+        if file_path is None:
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'media_not_orphaned',
+                    file=item_id
+                )
+            )
+            return
+
+        # Delete orphaned media file
+        try:
+            size = StorageHelper.get_storage().get_size(file_path)
+        except OSError:
+            # File deleted since scanned
+            return
+        if FileHelper.delete_file(
+            file_path=file_path
+        ):
+            self.__deleted_files += 1
+            self.__deleted_bytes += size
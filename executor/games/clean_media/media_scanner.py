@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""Scanner of media of Games"""
+
+import os
+
+from libraries.constants.constants import Constants, Platform
+from libraries.context.context import Context
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.storage.storage_helper import StorageHelper
+from libraries.text.text_helper import TextHelper
+from manager.abstract_manager import AbstractManager
+
+
+class MediaScanner:
+    """Scanner of media of a Software for a platform finding orphaned media files (referenced by
+    no game) and missing media files (referenced by a game but not found), the list of games is
+    read once and media's folders are walked once"""
+
+    def __init__(
+        self,
+        software_manager: AbstractManager,
+        platform: Platform
+    ):
+        """Initialize scanner"""
+
+        self.__software_manager = software_manager
+        self.__platform = platform
+
+    def scan(self) -> tuple[list[str], list[str]]:
+        """Scan media, return orphaned and missing media files (none if media can't be
+        scanned)"""
+
+        result = self.__software_manager.scan_media(
+            platform=self.__platform
+        )
+        if result is None:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'media_scan_unavailable',
+                    software=self.__software_manager.get_enum().value,
+                    platform=self.__platform.value
+                )
+            )
+            return [], []
+
+        return result
+
+    def build_item_id(self, file_path: str) -> str:
+        """Build the id of an item for a media file (its path in the software's folder)"""
+
+        return os.path.relpath(
+            file_path,
+            Context.get_software_path(
+                software=self.__software_manager.get_enum()
+            )
+        )
+
+    def build_rows(self) -> list[dict]:
+        """Build rows for orphaned media files (to delete) and missing media files"""
+
+        # Initialize result
+        result = []
+
+        orphaned_files, missing_files = self.scan()
+        orphaned_bytes = 0
+        for file_path in orphaned_files:
+            try:
+                orphaned_bytes += StorageHelper.get_storage().get_size(file_path)
+            except OSError:
+                # File deleted since listed
+                continue
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'media_scan_summary',
+                platform=self.__platform.value,
+                orphaned=len(orphaned_files),
+                bytes=TextHelper.format_bytes(orphaned_bytes),
+                missing=len(missing_files)
+            )
+        )
+
+        for file_paths, status, color in [
+            (orphaned_files, 'media_status_orphaned', Constants.ITEM_COLOR_ORANGE),
+            (missing_files, 'media_status_missing', Constants.ITEM_COLOR_RED)
+        ]:
+            for file_path in file_paths:
+                # Build row
+                row = {}
+                row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                row[Constants.UI_TABLE_KEY_COL_ID] = self.build_item_id(
+                    file_path=file_path
+                )
+                row[Constants.UI_TABLE_KEY_COL_NAME] = os.path.basename(file_path)
+                row[Constants.UI_TABLE_KEY_COL_MEDIA_STATUS] = Context.get_text(status)
+                row[Constants.UI_TABLE_KEY_COLOR] = color
+
+                # Append row
+                result.append(row)
+
+        return result
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+"""Executor to compact lists of Games"""
+
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Action
+from libraries.context.context import Context
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.storage.storage_helper import StorageHelper
+from libraries.text.text_helper import TextHelper
+
+
+class CompactGamesExecutor(AbstractGamesExecutor):
+    """Executor to compact the file listing games of a platform in a Software (duplicate entries
+    of a rom and entries without rom are deleted, whitespace is normalized, the file is streamed
+    and replaced at once)"""
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return Action.COMPACT
+
+    def do_execution(self, item: dict):
+        """Do execution for an item"""
+
+        games_list_file = self._software_manager.retrieve_games_list_file(
+            platform=self._execution_context.platform
+        )
+        size = StorageHelper.get_storage().get_size(games_list_file)
+
+        result = self._software_manager.compact_games_list(
+            platform=self._execution_context.platform
+        )
+        if result is None:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'games_list_not_compacted',
+                    file=games_list_file
+                )
+            )
+            return
+
+        duplicate_count, stale_count, compacted_size = result
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'games_list_compacted',
+                file=games_list_file,
+                duplicates=duplicate_count,
+                stale=stale_count,
+                bytes=TextHelper.format_bytes(max(size - compacted_size, 0))
+            )
+        )
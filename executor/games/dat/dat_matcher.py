@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+"""Matcher of Games with DAT files"""
+
+import os
+
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Constants, DatStatus, Platform
+from libraries.context.context import Context
+from libraries.dat.dat_index import DatIndex
+from libraries.index.hash_index import HashIndex
+
+
+class DatMatcher:
+    """Class to match roms of games in the games store with the DAT files of a platform (roms
+    are matched by their hashes already indexed, they are not hashed while matching, zip files
+    are matched by the CRC32 of their members read from their central directory)"""
+
+    __ZIP_EXTENSION = '.zip'
+
+    def __init__(
+        self,
+        platform: Platform
+    ):
+        """Initialize matcher for a platform"""
+
+        self.__platform = platform
+        self.__dat_index = DatIndex(
+            platform=platform
+        )
+        self.__hash_index = HashIndex.get_index(
+            folder_path=os.path.join(
+                Context.get_games_path(),
+                platform.value
+            )
+        )
+
+    def has_dats(self) -> bool:
+        """Specify if the platform has DAT files"""
+
+        return self.__dat_index.has_dats()
+
+    def match_rows(self, rows: list[dict]):
+        """Add the DAT status and the DAT game's name to rows"""
+
+        has_dats = self.has_dats()
+        zips_members: dict[str, list[dict]] = {}
+        if has_dats:
+            self.__dat_index.refresh()
+
+            # List members of zip files in parallel (read once, then kept in the index)
+            zips_members = self.__hash_index.list_zip_members_many(
+                file_paths=[
+                    self.__build_rom_file_path(row=row) for row in rows
+                    if row[Constants.UI_TABLE_KEY_COL_ROM].lower().endswith(self.__ZIP_EXTENSION)
+                ]
+            )
+
+        for row in rows:
+            row[Constants.UI_TABLE_KEY_COL_DAT_STATUS] = DatStatus.NO_DAT
+            row[Constants.UI_TABLE_KEY_COL_DAT_NAME] = ''
+            members = zips_members.get(self.__build_rom_file_path(row=row), None)
+            if has_dats and not self.__match_zip_members(row=row, members=members):
+                self.__match_rom(
+                    row=row,
+                    identified=members is not None
+                )
+            row[Constants.UI_TABLE_KEY_COL_DAT_STATUS] = Context.get_text(
+                row[Constants.UI_TABLE_KEY_COL_DAT_STATUS].value
+            )
+
+    def __build_rom_file_path(self, row: dict) -> str:
+        """Build the path of the rom of a row in the games store (the game's folder is the id
+        if not specified)"""
+
+        return os.path.join(
+            Context.get_games_path(),
+            self.__platform.value,
+            row.get(Constants.UI_TABLE_KEY_GAME_FOLDER, row[Constants.UI_TABLE_KEY_COL_ID]),
+            AbstractGamesExecutor.ROM_FOLDER_NAME,
+            row[Constants.UI_TABLE_KEY_COL_ROM]
+        )
+
+    def __match_zip_members(self, row: dict, members: list[dict]) -> bool:
+        """Match the members of a zipped rom (all members must be roms of the same game in DAT
+        files), return False if not matched"""
+
+        if not members:
+            return False
+
+        game_names = set()
+        misnamed = False
+        for member in members:
+            dat_rom = self.__dat_index.find_rom(
+                hashes={HashIndex.KEY_CRC32: member[HashIndex.KEY_CRC32]}
+            )
+            if dat_rom is None:
+                return False
+            game_name, rom_name = dat_rom
+            game_names.add(game_name)
+            misnamed = misnamed or rom_name != os.path.basename(member[HashIndex.KEY_NAME])
+        if len(game_names) != 1:
+            return False
+
+        game_name = game_names.pop()
+        misnamed = misnamed or os.path.splitext(row[Constants.UI_TABLE_KEY_COL_ROM])[0] != \
+            game_name
+        row[Constants.UI_TABLE_KEY_COL_DAT_NAME] = game_name
+        row[Constants.UI_TABLE_KEY_COL_DAT_STATUS] = DatStatus.MISNAMED if misnamed \
+            else DatStatus.VERIFIED
+
+        return True
+
+    def __match_rom(self, row: dict, identified: bool):
+        """Match the rom of a row by its hashes (unknown if not hashed but identified by its zip
+        members)"""
+
+        hashes = self.__hash_index.find(
+            file_path=self.__build_rom_file_path(row=row)
+        )
+        if hashes is None:
+            row[Constants.UI_TABLE_KEY_COL_DAT_STATUS] = DatStatus.UNKNOWN if identified \
+                else DatStatus.NOT_HASHED
+            return
+
+        dat_rom = self.__dat_index.find_rom(hashes=hashes)
+        if dat_rom is None:
+            row[Constants.UI_TABLE_KEY_COL_DAT_STATUS] = DatStatus.UNKNOWN
+            return
+
+        game_name, rom_name = dat_rom
+        row[Constants.UI_TABLE_KEY_COL_DAT_NAME] = game_name
+        row[Constants.UI_TABLE_KEY_COL_DAT_STATUS] = DatStatus.VERIFIED \
+            if rom_name == row[Constants.UI_TABLE_KEY_COL_ROM] else DatStatus.MISNAMED
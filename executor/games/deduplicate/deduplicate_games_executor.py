@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+"""Executor to delete duplicate Games"""
+
+import os
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Action, Constants
+from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.storage.blob_store import BlobStore
+
+
+class DeduplicateGamesExecutor(AbstractGamesExecutor):
+    """Executor to delete duplicate roms selected (the rom to keep in a group is never deleted, a
+    game's folder is deleted from the games store only when all its roms are deleted as
+    duplicates)"""
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext = None
+    ):
+        """Initialize executor for an execution context (created from the context if not
+        specified)"""
+
+        super().__init__(execution_context=execution_context)
+
+        # Roms deleted (kept on disk if simulated)
+        self.__deleted_roms: set[str] = set()
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return Action.DEDUPLICATE
+
+    def _retrieve_game_folder_path(self, item: dict) -> str:
+        """Retrieve the game's folder in the games store"""
+
+        return os.path.join(
+            Context.get_games_path(),
+            self._execution_context.platform.value,
+            item[Constants.UI_TABLE_KEY_GAME_FOLDER]
+        )
+
+    def __retrieve_rom_file_path(self, item: dict) -> str:
+        """Retrieve the rom's file in the games store"""
+
+        return os.path.join(
+            self._retrieve_game_folder_path(item=item),
+            self.ROM_FOLDER_NAME,
+            item[Constants.UI_TABLE_KEY_COL_ROM]
+        )
+
+    @staticmethod
+    def __is_rom_kept(item: dict) -> bool:
+        """Specify if the rom of an item is the one to keep in its group (green row)"""
+
+        return item[Constants.UI_TABLE_KEY_COLOR] == Constants.ITEM_COLOR_GREEN
+
+    def retrieve_confirmation_message(self) -> str:
+        """Retrieve the message to confirm before execution (None if no confirmation)"""
+
+        # No confirmation if no rom is deleted
+        kept_count = sum(
+            1 for row in self._execution_context.rows if self.__is_rom_kept(item=row)
+        )
+        if kept_count == len(self._execution_context.rows):
+            return None
+
+        return Context.get_text(
+            'confirm_deduplicate_execution',
+            roms=len(self._execution_context.rows) - kept_count,
+            kept=kept_count
+        )
+
+    def _finish_execution(self):
+        """Purge blobs of media of deleted games (if media are stored by content)"""
+
+        blob_store = BlobStore()
+        if blob_store.is_used():
+            blob_store.purge()
+
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        if self.__is_rom_kept(item=item):
+            return True
+
+        return not FileHelper.is_file_exists(
+            file_path=self.__retrieve_rom_file_path(item=item)
+        )
+
+    def do_execution(self, item: dict):
+        """Do execution for an item"""
+
+        # Keep the rom to keep in its group (even if selected)
+        if self.__is_rom_kept(item=item):
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'duplicate_rom_kept',
+                    rom=item[Constants.UI_TABLE_KEY_COL_ID]
+                )
+            )
+            return
+
+        # Delete the duplicate rom
+        rom_file_path = self.__retrieve_rom_file_path(item=item)
+        if FileHelper.delete_file(
+            file_path=rom_file_path
+        ):
+            self.__deleted_roms.add(rom_file_path)
+
+        # Delete the game if it has no rom left
+        game_folder_path = self._retrieve_game_folder_path(item=item)
+        rom_folder_path = os.path.join(
+            game_folder_path,
+            self.ROM_FOLDER_NAME
+        )
+        if all(
+            os.path.join(rom_folder_path, relative_path) in self.__deleted_roms
+            for relative_path in FileHelper.list_relative_paths(
+                folder_path=rom_folder_path,
+                file_name='*',
+                error_if_not_found=False
+            )
+        ):
+            FileHelper.delete_folder(
+                folder_path=game_folder_path
+            )
@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+"""Finder of duplicate Games"""
+
+from datetime import datetime
+import json
+import os
+
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Constants, Platform
+from libraries.context.context import Context
+from libraries.index.hash_index import HashIndex
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.storage.storage_helper import StorageHelper
+from libraries.text.text_helper import TextHelper
+
+
+class DuplicateFinder:
+    """Class to find identical roms in the games store across platforms by stages from the
+    cheapest to the most expensive, so that only a fraction of bytes is read: roms are grouped by
+    size, then by the hash of their first and last blocks, then by their full hash (zip files are
+    grouped by their members read from their central directory), hashes are kept in indexes"""
+
+    __ZIP_EXTENSION = '.zip'
+
+    __STAGE_ROMS = 'roms'
+    __STAGE_ZIP_MEMBERS = 'zip_members'
+    __STAGE_SIZE = 'size'
+    __STAGE_PARTIAL_HASH = 'partial_hash'
+    __STAGE_FULL_HASH = 'full_hash'
+
+    def __init__(self):
+        """Initialize finder"""
+
+        # Roms of the games store (platform, game's id and size by file)
+        self.__roms: dict[str, tuple[Platform, str, int]] = {}
+
+        # Groups of identical roms (sorted by platform and path) and files kept by stage
+        self.__groups: list[list[str]] = []
+        self.__stages: dict[str, int] = {}
+        self.__indexes: dict[Platform, HashIndex] = {}
+
+    def __list_roms(self):
+        """List roms of all platforms in the games store with their size"""
+
+        storage = StorageHelper.get_storage()
+        for platform in Platform:
+            platform_path = os.path.join(Context.get_games_path(), platform.value)
+            if not storage.is_folder(platform_path):
+                continue
+            for game_entry in storage.scan_folder(platform_path):
+                rom_folder_path = os.path.join(
+                    game_entry.path,
+                    AbstractGamesExecutor.ROM_FOLDER_NAME
+                )
+                if not game_entry.is_dir() or not storage.is_folder(rom_folder_path):
+                    continue
+                for entry in storage.scan_folder(rom_folder_path):
+                    if entry.is_file():
+                        self.__roms[entry.path] = (platform, game_entry.name, entry.stat().st_size)
+
+    def __apply(self, function, file_paths: list[str]) -> dict:
+        """Apply a function of indexes to files grouped by platform, return results by file"""
+
+        # Initialize result
+        result = {}
+
+        platforms_files: dict[Platform, list[str]] = {}
+        for file_path in file_paths:
+            platforms_files.setdefault(self.__roms[file_path][0], []).append(file_path)
+        for platform, platform_files in platforms_files.items():
+            if platform not in self.__indexes:
+                self.__indexes[platform] = HashIndex.get_index(
+                    folder_path=os.path.join(Context.get_games_path(), platform.value)
+                )
+            result.update(function(self.__indexes[platform], platform_files))
+
+        return result
+
+    @staticmethod
+    def __group(values: dict[str, object]) -> list[list[str]]:
+        """Group files with the same value (groups of a single file are ignored)"""
+
+        groups: dict[object, list[str]] = {}
+        for file_path, value in values.items():
+            groups.setdefault(value, []).append(file_path)
+
+        return [file_paths for file_paths in groups.values() if len(file_paths) > 1]
+
+    def find(self) -> list[list[str]]:
+        """Find groups of identical roms"""
+
+        self.__list_roms()
+        self.__stages[self.__STAGE_ROMS] = len(self.__roms)
+
+        # Group zip files by their members (no read but their central directory)
+        zips_members = self.__apply(
+            function=lambda index, file_paths: index.list_zip_members_many(file_paths=file_paths),
+            file_paths=[
+                file_path for file_path in self.__roms
+                if file_path.lower().endswith(self.__ZIP_EXTENSION)
+            ]
+        )
+        zips_groups = self.__group({
+            file_path: tuple(sorted(
+                (member[HashIndex.KEY_SIZE], member[HashIndex.KEY_CRC32]) for member in members
+            ))
+            for file_path, members in zips_members.items() if len(members) > 0
+        })
+        self.__stages[self.__STAGE_ZIP_MEMBERS] = sum(len(group) for group in zips_groups)
+
+        # Group other files by size
+        candidates = [
+            file_path for group in self.__group({
+                file_path: size for file_path, (_, _, size) in self.__roms.items()
+                if not zips_members.get(file_path, None)
+            }) for file_path in group
+        ]
+        self.__stages[self.__STAGE_SIZE] = len(candidates)
+
+        # Group by the hash of the first and last blocks
+        candidates = [
+            file_path for group in self.__group({
+                file_path: (self.__roms[file_path][2], partial_hash)
+                for file_path, partial_hash in self.__apply(
+                    function=lambda index, file_paths: index.partial_hash_files(
+                        file_paths=file_paths
+                    ),
+                    file_paths=candidates
+                ).items()
+            }) for file_path in group
+        ]
+        self.__stages[self.__STAGE_PARTIAL_HASH] = len(candidates)
+
+        # Group by the full hash
+        content_groups = self.__group({
+            file_path: hashes[HashIndex.KEY_SHA1]
+            for file_path, hashes in self.__apply(
+                function=lambda index, file_paths: index.hash_files(file_paths=file_paths),
+                file_paths=candidates
+            ).items()
+        })
+        self.__stages[self.__STAGE_FULL_HASH] = sum(len(group) for group in content_groups)
+
+        # Sort groups (the first rom of a group is the one to keep), groups with several roms in
+        # a game's folder are skipped (a rom of the game would be deleted with its copy)
+        self.__groups = sorted(
+            [
+                sorted(group, key=lambda file_path: (self.__roms[file_path][0].value, file_path))
+                for group in zips_groups + content_groups
+                if len({self.__roms[file_path][:2] for file_path in group}) == len(group)
+            ],
+            key=lambda group: (self.__roms[group[0]][0].value, group[0])
+        )
+
+        return self.__groups
+
+    def write_report(self) -> str:
+        """Write the report of groups found in the logs folder and log a summary, return the
+        report's path"""
+
+        wasted_bytes = sum(
+            self.__roms[group[0]][2] * (len(group) - 1) for group in self.__groups
+        )
+        report_path = os.path.join(
+            Context.get_logs_path(),
+            f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_duplicates.json'
+        )
+        os.makedirs(Context.get_logs_path(), exist_ok=True)
+        with open(report_path, mode='w', encoding='UTF-8') as file:
+            json.dump(
+                {
+                    'stages': self.__stages,
+                    'wasted_bytes': wasted_bytes,
+                    'groups': [
+                        {
+                            'size': self.__roms[group[0]][2],
+                            'files': group
+                        }
+                        for group in self.__groups
+                    ]
+                },
+                file,
+                indent=2
+            )
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'duplicates_found',
+                groups=len(self.__groups),
+                files=sum(len(group) for group in self.__groups),
+                bytes=TextHelper.format_bytes(wasted_bytes),
+                file=report_path
+            )
+        )
+
+        return report_path
+
+    def build_rows(self, platform: Platform, games_names: dict[str, str]) -> list[dict]:
+        """Build rows of a platform's roms having duplicates (the rom to keep in a group is green,
+        the others are orange), games' names are by rom, a row's id is the path of its rom in the
+        platform's folder (a game may have several roms)"""
+
+        # Initialize result
+        result = []
+
+        for group in self.__groups:
+            for file_idx, file_path in enumerate(group):
+                rom_platform, game_id, _ = self.__roms[file_path]
+                if rom_platform != platform:
+                    continue
+
+                # Build row
+                rom = os.path.basename(file_path)
+                row = {}
+                row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                row[Constants.UI_TABLE_KEY_COL_ID] = os.path.join(
+                    game_id,
+                    AbstractGamesExecutor.ROM_FOLDER_NAME,
+                    rom
+                )
+                row[Constants.UI_TABLE_KEY_GAME_FOLDER] = game_id
+                row[Constants.UI_TABLE_KEY_COL_NAME] = games_names.get(
+                    rom,
+                    os.path.splitext(rom)[0]
+                )
+                row[Constants.UI_TABLE_KEY_COL_ROM] = rom
+                row[Constants.UI_TABLE_KEY_COL_DUPLICATES] = ', '.join(
+                    f'{self.__roms[other_file_path][0].value}/{self.__roms[other_file_path][1]}'
+                    for other_file_path in group if other_file_path != file_path
+                )
+                row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN if file_idx == 0 \
+                    else Constants.ITEM_COLOR_ORANGE
+
+                # Append row
+                result.append(row)
+
+        return result
@@ -3,9 +3,9 @@
 
 import os
 from executor.games.abstract_games_executor import AbstractGamesExecutor
-from libraries.constants.constants import Action, Component, Constants
-from libraries.context.context import Context
+from libraries.constants.constants import Action, Component
 from libraries.file.file_helper import FileHelper
+from libraries.storage.blob_store import BlobStore
 
 
 class DeleteGamesExecutor(AbstractGamesExecutor):
@@ -14,27 +14,44 @@ class DeleteGamesExecutor(AbstractGamesExecutor):
     def get_action(self) -> Action:
         """Get Action"""
 
-        return Action.UNINSTALL
+        return Action.DELETE
+
+    def _finish_execution(self):
+        """Purge blobs of media of deleted games (if media are stored by content)"""
+
+        blob_store = BlobStore()
+        if blob_store.is_used():
+            blob_store.purge()
+
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        game_folder = self._retrieve_game_folder_path(item=item)
+        if Component.ROM not in self._execution_context.components:
+            game_folder = os.path.join(
+                game_folder,
+                self.MEDIA_FOLDER_NAME
+            )
+
+        return not FileHelper.is_folder_exists(
+            folder_path=game_folder
+        )
 
     def do_execution(self, item: dict):
         """Do execution for an item"""
 
         # Retrieve game folder
-        game_folder = os.path.join(
-            Context.get_games_path(),
-            Context.get_selected_platform().value,
-            item[Constants.UI_TABLE_KEY_COL_ID]
-        )
+        game_folder = self._retrieve_game_folder_path(item=item)
 
         # Delete game if all components requested
-        if Component.ROM in Context.get_selected_components():
+        if Component.ROM in self._execution_context.components:
             FileHelper.delete_folder(
                 folder_path=game_folder
             )
             return
 
         # Delete media if requested
-        if Component.MEDIA in Context.get_selected_components():
+        if Component.MEDIA in self._execution_context.components:
             FileHelper.delete_folder(
                 folder_path=os.path.join(
                     game_folder,
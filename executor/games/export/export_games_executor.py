@@ -1,34 +1,174 @@
 #!/usr/bin/python3
 """Executor to export Games"""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
 from executor.games.abstract_games_executor import AbstractGamesExecutor
-from libraries.constants.constants import Action, Component, Constants
+from libraries.constants.constants import Action, Component, Constants, Media
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
 from libraries.file.file_helper import FileHelper
+from libraries.index.hash_index import HashIndex
+from libraries.index.hash_manifest import HashManifest
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.storage.blob_store import BlobStore
+from libraries.storage.storage_helper import StorageHelper
 
 
 class ExportGamesExecutor(AbstractGamesExecutor):
-    """Executor to export Games"""
+    """Executor to export Games (files of exported games are hashed in parallel to write the
+    manifest of the platform used to verify the games store)"""
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext = None
+    ):
+        """Initialize executor for an execution context (created from the context if not
+        specified)"""
+
+        super().__init__(execution_context=execution_context)
+
+        # Media files and game info retrieved for all rows (by game's id)
+        self.__media_files: dict[str, dict[Media, str]] = {}
+        self.__games_info: dict[str, str] = {}
+
+        # Sizes and hashes of exported files computed in parallel (by game's id) for the manifest
+        self.__pool: ThreadPoolExecutor = None
+        self.__files_hashes: dict[str, dict[str, Future]] = {}
+        self.__hash_index: HashIndex = None
+        self.__manifest: HashManifest = None
+
+        # Store of media by content (None if media are copied for each game)
+        self.__blob_store: BlobStore = None
 
     def get_action(self) -> Action:
         """Get Action"""
 
         return Action.EXPORT
 
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        return FileHelper.is_folder_exists(
+            folder_path=self._retrieve_game_folder_path(item=item)
+        )
+
+    def _prepare_execution(self, rows: list):
+        """Retrieve media files and game info of all rows at once, prepare hashing of exported
+        files"""
+
+        if Component.MEDIA in self._execution_context.components:
+            self.__media_files = self._software_manager.retrieve_media_files_many(
+                platform=self._execution_context.platform,
+                game_items=list(rows)
+            )
+            if Context.is_deduplicated_media():
+                self.__blob_store = BlobStore()
+
+        if Component.INFO in self._execution_context.components:
+            self.__games_info = self._software_manager.retrieve_game_info_many(
+                platform=self._execution_context.platform,
+                game_items=list(rows)
+            )
+
+        # Prepare hashing of exported files for the manifest
+        if not ExecutionContext.is_simulated_execution():
+            platform_folder_path = os.path.join(
+                Context.get_games_path(),
+                self._execution_context.platform.value
+            )
+            self.__hash_index = HashIndex.get_index(
+                folder_path=platform_folder_path
+            )
+            self.__manifest = HashManifest(
+                folder_path=platform_folder_path
+            )
+            self.__pool = ThreadPoolExecutor(
+                max_workers=Constants.HASH_MAX_CONCURRENCY,
+                initializer=self._metrics.bind
+            )
+
+    def _finish_execution(self):
+        """Save hashes of media stored by content (and purge blobs of media replaced), wait for
+        hashes of exported files and write the manifest"""
+
+        if self.__blob_store is not None:
+            self.__blob_store.save()
+            self.__blob_store.purge()
+
+        if self.__pool is None:
+            return
+
+        self.__pool.shutdown()
+        for game_id, futures in self.__files_hashes.items():
+            files = {}
+            for file_path, future in futures.items():
+                # Log files which failed to be hashed (left out of the manifest)
+                if future.exception() is not None:
+                    LoggingHelper.log_error(
+                        message=Context.get_text(
+                            'error_hash_manifest_file',
+                            file=file_path
+                        ),
+                        exc=future.exception()
+                    )
+                    continue
+                if future.result() is not None:
+                    files[self.__manifest.build_key(file_path)] = future.result()
+            self.__manifest.set_game_files(
+                game_id=game_id,
+                files=files
+            )
+        self.__manifest.save()
+        self.__hash_index.save()
+
+    def __hash_file(self, file_path: str) -> dict:
+        """Hash an exported file, return its size and hash for the manifest (None if not
+        found)"""
+
+        hashes = self.__hash_index.hash_file(
+            file_path=file_path
+        )
+        if hashes is None:
+            return None
+
+        return {
+            HashManifest.KEY_SIZE: StorageHelper.get_storage().get_size(file_path),
+            HashManifest.KEY_SHA1: hashes[HashIndex.KEY_SHA1]
+        }
+
+    def __hash_game_files(self, item: dict):
+        """Hash files of an exported game in parallel (roms and media)"""
+
+        if self.__pool is None:
+            return
+
+        game_folder_path = self._retrieve_game_folder_path(item=item)
+        futures: dict[str, Future] = {}
+        for folder_name in [self.ROM_FOLDER_NAME, self.MEDIA_FOLDER_NAME]:
+            for relative_path in FileHelper.list_relative_paths(
+                folder_path=os.path.join(game_folder_path, folder_name),
+                file_name='*',
+                error_if_not_found=False
+            ):
+                file_path = os.path.join(game_folder_path, folder_name, relative_path)
+                futures[file_path] = self.__pool.submit(self.__hash_file, file_path)
+        self.__files_hashes[item[Constants.UI_TABLE_KEY_COL_ID]] = futures
+
     def do_execution(self, item: dict):
         """Do execution for an item"""
 
-        # Copy files for media
-        if Component.MEDIA in Context.get_selected_components():
-            for media, file_path in self._software_manager.retrieve_media_files(
-                platform=Context.get_selected_platform(),
-                game_item=item
+        # Copy files for media (if not done by a previous execution)
+        if Component.MEDIA in self._execution_context.components and \
+                not self._is_step_done(item=item, step=Component.MEDIA.name):
+            for media, file_path in self.__media_files.get(
+                item[Constants.UI_TABLE_KEY_COL_ID],
+                {}
             ).items():
                 # Retrieve destination's file
                 destination_file_path = os.path.join(
                     Context.get_games_path(),
-                    Context.get_selected_platform().value,
+                    self._execution_context.platform.value,
                     item[Constants.UI_TABLE_KEY_COL_ID],
                     self.MEDIA_FOLDER_NAME,
                     f'{media.value}{FileHelper.retrieve_file_extension(
@@ -42,16 +182,25 @@ class ExportGamesExecutor(AbstractGamesExecutor):
                     delete_all_extensions=True
                 )
 
-                # Copy file in destination's folder
-                FileHelper.copy_file(
-                    source_file_path=file_path,
-                    destination_file_path=destination_file_path
-                )
+                # Copy file in destination's folder (through the store of media by content)
+                if self.__blob_store is not None:
+                    self.__blob_store.copy_file(
+                        source_file_path=file_path,
+                        destination_file_path=destination_file_path
+                    )
+                else:
+                    FileHelper.copy_file(
+                        source_file_path=file_path,
+                        destination_file_path=destination_file_path
+                    )
+
+            self._mark_step_done(item=item, step=Component.MEDIA.name)
 
-        # Copy rom
-        if Component.ROM in Context.get_selected_components():
+        # Copy rom (if not done by a previous execution)
+        if Component.ROM in self._execution_context.components and \
+                not self._is_step_done(item=item, step=Component.ROM.name):
             rom_file = self._software_manager.retrieve_rom_file(
-                platform=Context.get_selected_platform(),
+                platform=self._execution_context.platform,
                 game_item=item
             )
             if rom_file is not None or FileHelper.is_file_exists(
@@ -60,7 +209,7 @@ class ExportGamesExecutor(AbstractGamesExecutor):
                 # Retrieve destination's file
                 destination_file_path = os.path.join(
                     Context.get_games_path(),
-                    Context.get_selected_platform().value,
+                    self._execution_context.platform.value,
                     item[Constants.UI_TABLE_KEY_COL_ID],
                     self.ROM_FOLDER_NAME,
                     FileHelper.retrieve_file_name(rom_file)
@@ -78,11 +227,17 @@ class ExportGamesExecutor(AbstractGamesExecutor):
                     destination_file_path=destination_file_path
                 )
 
-        # Retrieve game's info
-        if Component.INFO in Context.get_selected_components():
-            game_info = self._software_manager.retrieve_game_info(
-                platform=Context.get_selected_platform(),
-                game_item=item
+            self._mark_step_done(item=item, step=Component.ROM.name)
+
+        # Hash files of the game for the manifest
+        self.__hash_game_files(item=item)
+
+        # Retrieve game's info (if not done by a previous execution)
+        if Component.INFO in self._execution_context.components and \
+                not self._is_step_done(item=item, step=Component.INFO.name):
+            game_info = self.__games_info.get(
+                item[Constants.UI_TABLE_KEY_COL_ID],
+                ''
             )
 
             # If no game info found, finish the export
@@ -93,9 +248,11 @@ class ExportGamesExecutor(AbstractGamesExecutor):
             FileHelper.write_file(
                 file_path=os.path.join(
                     Context.get_games_path(),
-                    Context.get_selected_platform().value,
+                    self._execution_context.platform.value,
                     item[Constants.UI_TABLE_KEY_COL_ID],
                     f'{self._software_manager.get_id()}{Constants.XML_EXTENSION}'
                 ),
                 content=game_info
             )
+
+            self._mark_step_done(item=item, step=Component.INFO.name)
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""Executor to hash Games"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Action, Constants
+from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
+from libraries.index.hash_index import HashIndex
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class HashGamesExecutor(AbstractGamesExecutor):
+    """Executor to hash roms of Games (in the software and in the games store), hashes are kept
+    in indexes so only new or changed roms are hashed"""
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext = None
+    ):
+        """Initialize executor for an execution context (created from the context if not
+        specified)"""
+
+        super().__init__(execution_context=execution_context)
+
+        # Hashes of rom files computed in parallel (by game's id) and indexes by folder
+        self.__pool: ThreadPoolExecutor = None
+        self.__hashes: dict[str, dict[str, Future]] = {}
+        self.__indexes: dict[str, HashIndex] = {}
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return Action.HASH
+
+    def __get_index(self, folder_path: str) -> HashIndex:
+        """Get the index of hashes for a folder"""
+
+        if folder_path not in self.__indexes:
+            self.__indexes[folder_path] = HashIndex.get_index(
+                folder_path=folder_path
+            )
+
+        return self.__indexes[folder_path]
+
+    def __retrieve_rom_files(self, item: dict) -> dict[str, HashIndex]:
+        """Retrieve rom files of a game with the index of their hashes (rom in the software and
+        roms in the games store)"""
+
+        # Initialize result
+        result: dict[str, HashIndex] = {}
+
+        # Software's rom is indexed with the roms of its folder
+        rom_file = self._software_manager.retrieve_rom_file(
+            platform=self._execution_context.platform,
+            game_item=item
+        )
+        if rom_file is not None:
+            result[rom_file] = self.__get_index(
+                folder_path=os.path.dirname(rom_file)
+            )
+
+        # Games store's roms are indexed with the roms of the platform
+        rom_folder_path = os.path.join(
+            self._retrieve_game_folder_path(item=item),
+            self.ROM_FOLDER_NAME
+        )
+        for relative_path in FileHelper.list_relative_paths(
+            folder_path=rom_folder_path,
+            file_name='*',
+            error_if_not_found=False
+        ):
+            result[os.path.join(rom_folder_path, relative_path)] = self.__get_index(
+                folder_path=os.path.join(
+                    Context.get_games_path(),
+                    self._execution_context.platform.value
+                )
+            )
+
+        return result
+
+    def _prepare_execution(self, rows: list):
+        """Hash rom files of all rows in parallel (items wait for their hashes)"""
+
+        self.__pool = ThreadPoolExecutor(
+            max_workers=Constants.HASH_MAX_CONCURRENCY,
+            initializer=self._metrics.bind
+        )
+        for row in rows:
+            self.__hashes[row[Constants.UI_TABLE_KEY_COL_ID]] = {
+                file_path: self.__pool.submit(index.hash_file, file_path)
+                for file_path, index in self.__retrieve_rom_files(item=row).items()
+            }
+
+    def _finish_execution(self):
+        """Stop hashing and save indexes"""
+
+        if self.__pool is not None:
+            self.__pool.shutdown(cancel_futures=True)
+        for index in self.__indexes.values():
+            index.save()
+
+    def do_execution(self, item: dict):
+        """Do execution for an item"""
+
+        for file_path, future in self.__hashes.pop(
+            item[Constants.UI_TABLE_KEY_COL_ID],
+            {}
+        ).items():
+            hashes = future.result()
+            if hashes is None:
+                continue
+
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'rom_hashes',
+                    file=file_path,
+                    crc32=hashes[HashIndex.KEY_CRC32],
+                    md5=hashes[HashIndex.KEY_MD5],
+                    sha1=hashes[HashIndex.KEY_SHA1]
+                )
+            )
@@ -3,8 +3,9 @@
 
 import os
 from executor.games.abstract_games_executor import AbstractGamesExecutor
-from libraries.constants.constants import Action, Constants, Media, Software
+from libraries.constants.constants import Action, Component, Constants, Media, Software
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
 from libraries.file.file_helper import FileHelper
 from manager.manager_factory import ManagerFactory
 
@@ -17,15 +18,70 @@ class InstallGamesExecutor(AbstractGamesExecutor):
 
         return Action.INSTALL
 
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        if Component.ROM not in self._execution_context.components:
+            return True
+
+        return self._software_manager.retrieve_rom_file(
+            platform=self._execution_context.platform,
+            game_item=item
+        ) is not None
+
+    def _get_batch_size(self) -> int:
+        """Get the number of items executed at once"""
+
+        return Constants.EXECUTION_BATCH_SIZE
+
     def do_execution(self, item: dict):
         """Do execution for an item"""
 
+        self.do_execution_many(items=[item])
+
+    def do_execution_many(self, items: list[dict]):
+        """Do execution for a batch of items"""
+
+        self._install_games(
+            items=items,
+            execution_context=self._execution_context
+        )
+
+    def _install_games(self, items: list[dict], execution_context: ExecutionContext):
+        """Install games from the games store with the components of an execution context (the
+        file listing games is read and written once)"""
+
+        # Retrieve files of games
+        media_files: dict[str, dict[Media, str]] = {}
+        game_info_files: dict[str, dict[Software, str]] = {}
+        rom_files: dict[str, str] = {}
+        for item in items:
+            game_id = item[Constants.UI_TABLE_KEY_COL_ID]
+            media_files[game_id], game_info_files[game_id], rom_files[game_id] = \
+                self.__retrieve_game_files(item=item)
+
+        # Install games
+        self._software_manager.install_games(
+            platform=self._execution_context.platform,
+            game_items=items,
+            media_files=media_files,
+            game_info_files=game_info_files,
+            rom_files=rom_files,
+            execution_context=execution_context
+        )
+
+    def __retrieve_game_files(
+        self,
+        item: dict
+    ) -> tuple[dict[Media, str], dict[Software, str], str]:
+        """Retrieve media files, game info files and rom file of a game in the games store"""
+
         # Retrieve media files
         media_files: dict[Media, str] = {}
         for media in Media:
             folder_path = os.path.join(
                 Context.get_games_path(),
-                Context.get_selected_platform().value,
+                self._execution_context.platform.value,
                 item[Constants.UI_TABLE_KEY_COL_ID],
                 self.MEDIA_FOLDER_NAME
             )
@@ -49,7 +105,7 @@ class InstallGamesExecutor(AbstractGamesExecutor):
             )
             file_path = os.path.join(
                 Context.get_games_path(),
-                Context.get_selected_platform().value,
+                self._execution_context.platform.value,
                 item[Constants.UI_TABLE_KEY_COL_ID],
                 f'{software_manager.get_id()}{Constants.XML_EXTENSION}'
             )
@@ -62,7 +118,7 @@ class InstallGamesExecutor(AbstractGamesExecutor):
         rom_file = None
         folder_path = os.path.join(
             Context.get_games_path(),
-            Context.get_selected_platform().value,
+            self._execution_context.platform.value,
             item[Constants.UI_TABLE_KEY_COL_ID],
             self.ROM_FOLDER_NAME
         )
@@ -77,11 +133,4 @@ class InstallGamesExecutor(AbstractGamesExecutor):
                 relative_paths[0]
             )
 
-        # Install game
-        self._software_manager.install_game(
-            platform=Context.get_selected_platform(),
-            game_item=item,
-            media_files=media_files,
-            game_info_files=game_info_files,
-            rom_file=rom_file
-        )
+        return media_files, game_info_files, rom_file
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+"""Executor to restore Games"""
+
+import os
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Action, Component
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class RestoreGamesExecutor(AbstractGamesExecutor):
+    """Executor to restore Games deleted in the trash (the game's folder if rom is selected, its
+    media's folder otherwise, as deleted)"""
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return Action.RESTORE
+
+    def __retrieve_folder_path(self, item: dict) -> str:
+        """Retrieve the folder to restore in the games store"""
+
+        game_folder = self._retrieve_game_folder_path(item=item)
+        if Component.ROM in self._execution_context.components:
+            return game_folder
+
+        return os.path.join(
+            game_folder,
+            self.MEDIA_FOLDER_NAME
+        )
+
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        return FileHelper.is_folder_exists(
+            folder_path=self.__retrieve_folder_path(item=item)
+        )
+
+    def do_execution(self, item: dict):
+        """Do execution for an item"""
+
+        # Restore the folder of the game (or of its media) from the trash
+        folder_path = self.__retrieve_folder_path(item=item)
+        if not FileHelper.restore_folder(
+            folder_path=folder_path
+        ):
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'restore_folder_not_found',
+                    folder=folder_path
+                )
+            )
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""Executor to synchronize Games"""
+
+from executor.games.install.install_games_executor import InstallGamesExecutor
+from executor.games.sync.sync_games_planner import SyncGamesPlanner
+from libraries.constants.constants import Action, Component, Operation
+from libraries.context.context import Context
+
+
+class SyncGamesExecutor(InstallGamesExecutor):
+    """Executor to synchronize Games"""
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return Action.SYNC
+
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        if SyncGamesPlanner.retrieve_operation(item) == Operation.REMOVE:
+            return self._software_manager.retrieve_rom_file(
+                platform=self._execution_context.platform,
+                game_item=item
+            ) is None
+
+        return super().verify_execution(item=item)
+
+    def retrieve_confirmation_message(self) -> str:
+        """Retrieve the message to confirm before execution (None if no confirmation)"""
+
+        # Count operations for selected rows
+        operations_counters = {operation: 0 for operation in Operation}
+        for row in self._execution_context.rows:
+            operations_counters[SyncGamesPlanner.retrieve_operation(row)] += 1
+
+        return Context.get_text(
+            'confirm_sync_execution',
+            install=operations_counters[Operation.INSTALL],
+            update=operations_counters[Operation.UPDATE],
+            metadata=operations_counters[Operation.METADATA],
+            remove=operations_counters[Operation.REMOVE]
+        )
+
+    def do_execution_many(self, items: list[dict]):
+        """Do execution for a batch of items (grouped by operation)"""
+
+        # Group items by operation
+        operations_items: dict[Operation, list[dict]] = {operation: [] for operation in Operation}
+        for item in items:
+            operations_items[SyncGamesPlanner.retrieve_operation(item)].append(item)
+
+        if len(operations_items[Operation.REMOVE]) > 0:
+            self._software_manager.uninstall_games(
+                platform=self._execution_context.platform,
+                game_items=operations_items[Operation.REMOVE],
+                execution_context=self._execution_context
+            )
+
+        install_items = operations_items[Operation.INSTALL] + operations_items[Operation.UPDATE]
+        if len(install_items) > 0:
+            self._install_games(
+                items=install_items,
+                execution_context=self._execution_context
+            )
+
+        if len(operations_items[Operation.METADATA]) > 0:
+            # Keep the roms already installed
+            self._install_games(
+                items=operations_items[Operation.METADATA],
+                execution_context=self._execution_context.replace(
+                    components=[
+                        component for component in self._execution_context.components
+                        if component != Component.ROM
+                    ]
+                )
+            )
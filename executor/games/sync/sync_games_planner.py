@@ -0,0 +1,210 @@
+#!/usr/bin/python3
+"""Planner to synchronize Games"""
+
+import os
+
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Constants, Operation, Platform
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.storage.storage_helper import StorageHelper
+from libraries.text.text_helper import TextHelper
+from manager.abstract_manager import AbstractManager
+
+
+class SyncGamesPlanner:
+    """Planner computing the minimal changes to synchronize a Software with the games store"""
+
+    # Tolerance for modification times (FAT file systems store them with a 2 seconds precision)
+    MTIME_TOLERANCE = 2
+
+    __OPERATION_COLORS = {
+        Operation.INSTALL: Constants.ITEM_COLOR_GREEN,
+        Operation.UPDATE: Constants.ITEM_COLOR_ORANGE,
+        Operation.METADATA: Constants.ITEM_COLOR_ORANGE,
+        Operation.REMOVE: Constants.ITEM_COLOR_RED,
+        Operation.NONE: Constants.ITEM_COLOR_BLACK
+    }
+
+    def __init__(
+        self,
+        software_manager: AbstractManager,
+        platform: Platform
+    ):
+        """Initialize planner"""
+
+        self.__software_manager = software_manager
+        self.__platform = platform
+
+    def __list_store_games(self) -> dict[str, tuple[str, str]]:
+        """List games in the store in a dictionary where the key is the rom
+        and the value is the game's folder with the rom's path"""
+
+        # Initialize result
+        result: dict[str, tuple[str, str]] = {}
+
+        platform_path = os.path.join(
+            Context.get_games_path(),
+            self.__platform.value
+        )
+        for game_folder in FileHelper.list_sub_directories(
+            folder_path=platform_path
+        ):
+            # Try to find the rom file
+            rom_folder_path = os.path.join(
+                platform_path,
+                game_folder,
+                AbstractGamesExecutor.ROM_FOLDER_NAME
+            )
+            rom_files = FileHelper.list_relative_paths(
+                folder_path=rom_folder_path,
+                file_name='*',
+                error_if_not_found=False
+            )
+            if len(rom_files) == 0:
+                continue
+
+            result[FileHelper.retrieve_file_name(rom_files[0])] = (
+                game_folder,
+                os.path.join(rom_folder_path, rom_files[0])
+            )
+
+        return result
+
+    def __retrieve_store_info_timestamp(self, game_folder: str) -> float:
+        """Retrieve the last modification's timestamp for info and media of a game in the store
+        (entries of the game's folder are stated, not walked, as media are replaced in their
+        folder, never modified in place)"""
+
+        result = 0.0
+        game_path = os.path.join(
+            Context.get_games_path(),
+            self.__platform.value,
+            game_folder
+        )
+        for entry in StorageHelper.get_storage().scan_folder(game_path):
+            # Skip the rom's folder
+            if entry.name == AbstractGamesExecutor.ROM_FOLDER_NAME:
+                continue
+
+            result = max(result, entry.stat().st_mtime)
+
+        return result
+
+    def __is_same_rom(self, store_rom_file: str, software_rom_file: str) -> bool:
+        """Specify if roms are identical (hash only computed if stats are not enough)"""
+
+        store_stat = StorageHelper.get_storage().get_stat(store_rom_file)
+        software_stat = StorageHelper.get_storage().get_stat(software_rom_file)
+
+        # Different sizes mean different roms
+        if store_stat.st_size != software_stat.st_size:
+            return False
+
+        # Same size and same modification time mean same roms
+        if abs(store_stat.st_mtime - software_stat.st_mtime) <= self.MTIME_TOLERANCE:
+            return True
+
+        # Compare contents
+        return FileHelper.compute_file_hash(
+            file_path=store_rom_file
+        ) == FileHelper.compute_file_hash(
+            file_path=software_rom_file
+        )
+
+    def __compute_plan(
+        self,
+        store_games: dict[str, tuple[str, str]],
+        software_games: dict[str, str]
+    ) -> dict[str, Operation]:
+        """Compute the plan from games in the store and games in the software"""
+
+        # Initialize result
+        result: dict[str, Operation] = {}
+
+        software_info_timestamp = self.__software_manager.retrieve_games_info_timestamp(
+            platform=self.__platform
+        )
+
+        # Games in the store
+        for rom, (game_folder, store_rom_file) in store_games.items():
+            if rom not in software_games:
+                result[rom] = Operation.INSTALL
+                continue
+
+            software_rom_file = self.__software_manager.retrieve_rom_file(
+                platform=self.__platform,
+                game_item={
+                    Constants.UI_TABLE_KEY_COL_ID: game_folder,
+                    Constants.UI_TABLE_KEY_COL_ROM: rom
+                }
+            )
+            if software_rom_file is None or not self.__is_same_rom(
+                store_rom_file=store_rom_file,
+                software_rom_file=software_rom_file
+            ):
+                result[rom] = Operation.UPDATE
+            elif software_info_timestamp is not None and \
+                    self.__retrieve_store_info_timestamp(
+                        game_folder=game_folder
+                    ) > software_info_timestamp + self.MTIME_TOLERANCE:
+                result[rom] = Operation.METADATA
+            else:
+                result[rom] = Operation.NONE
+
+        # Games only in the software
+        for rom in software_games:
+            if rom not in store_games:
+                result[rom] = Operation.REMOVE
+
+        return result
+
+    def build_rows(self) -> list[dict]:
+        """Build rows for the plan"""
+
+        # Initialize result
+        result = []
+
+        store_games = self.__list_store_games()
+        software_games = self.__software_manager.list_games_with_rom(
+            platform=self.__platform
+        )
+
+        for rom, operation in self.__compute_plan(
+            store_games=store_games,
+            software_games=software_games
+        ).items():
+            # Retrieve game's id and name
+            game_id = FileHelper.retrieve_file_basename(rom)
+            if rom in store_games:
+                game_id = store_games[rom][0]
+            name = software_games.get(rom, None)
+            if TextHelper.is_none(name) or len(name) == 0:
+                name = FileHelper.retrieve_file_basename(rom)
+
+            # Build row
+            row = {}
+            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+            row[Constants.UI_TABLE_KEY_COL_ID] = game_id
+            row[Constants.UI_TABLE_KEY_COL_NAME] = name
+            row[Constants.UI_TABLE_KEY_COL_ROM] = rom
+            row[Constants.UI_TABLE_KEY_COL_OPERATION] = Context.get_text(
+                operation.value
+            )
+            row[Constants.UI_TABLE_KEY_OPERATION] = operation.name
+            row[Constants.UI_TABLE_KEY_COLOR] = self.__OPERATION_COLORS[operation]
+
+            # Append row
+            result.append(row)
+
+        return result
+
+    @staticmethod
+    def retrieve_operation(row: dict) -> Operation:
+        """Retrieve the operation for a row (stored by name, independent of the language)"""
+
+        try:
+            return Operation[row[Constants.UI_TABLE_KEY_OPERATION]]
+        except KeyError:
+            # Row built without operation
+            return Operation.NONE
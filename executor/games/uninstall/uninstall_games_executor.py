@@ -2,8 +2,7 @@
 """Executor to uninstall Games"""
 
 from executor.games.abstract_games_executor import AbstractGamesExecutor
-from libraries.constants.constants import Action
-from libraries.context.context import Context
+from libraries.constants.constants import Action, Component, Constants
 
 
 class UninstallGamesExecutor(AbstractGamesExecutor):
@@ -14,11 +13,33 @@ class UninstallGamesExecutor(AbstractGamesExecutor):
 
         return Action.UNINSTALL
 
+    def verify_execution(self, item: dict) -> bool:
+        """Verify that execution completed by a previous execution is still applied for an item"""
+
+        if Component.ROM not in self._execution_context.components:
+            return True
+
+        return self._software_manager.retrieve_rom_file(
+            platform=self._execution_context.platform,
+            game_item=item
+        ) is None
+
+    def _get_batch_size(self) -> int:
+        """Get the number of items executed at once"""
+
+        return Constants.EXECUTION_BATCH_SIZE
+
     def do_execution(self, item: dict):
         """Do execution for an item"""
 
-        # Install game
-        self._software_manager.uninstall_game(
-            platform=Context.get_selected_platform(),
-            game_item=item
+        self.do_execution_many(items=[item])
+
+    def do_execution_many(self, items: list[dict]):
+        """Do execution for a batch of items (the file listing games is read and written once)"""
+
+        # Uninstall games
+        self._software_manager.uninstall_games(
+            platform=self._execution_context.platform,
+            game_items=items,
+            execution_context=self._execution_context
         )
@@ -0,0 +1,193 @@
+#!/usr/bin/python3
+"""Executor to verify Games"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from libraries.constants.constants import Action, Component, Constants
+from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
+from libraries.index.hash_index import HashIndex
+from libraries.index.hash_manifest import HashManifest
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.rate_limiter import RateLimiter
+from libraries.storage.storage_helper import StorageHelper
+
+
+class VerifyGamesExecutor(AbstractGamesExecutor):
+    """Executor to verify files of Games in the games store against the manifest of the platform
+    written when exported (files are hashed again in parallel, reads are limited by the bandwidth
+    in setup), missing, changed and extra files are reported"""
+
+    __STATUS_VERIFIED = 'verified'
+    __STATUS_MISSING = 'missing'
+    __STATUS_CHANGED = 'changed'
+    __STATUS_EXTRA = 'extra'
+
+    # Folders of games verified by component
+    __COMPONENTS_FOLDERS = {
+        Component.ROM: AbstractGamesExecutor.ROM_FOLDER_NAME,
+        Component.MEDIA: AbstractGamesExecutor.MEDIA_FOLDER_NAME
+    }
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext = None
+    ):
+        """Initialize executor for an execution context (created from the context if not
+        specified)"""
+
+        super().__init__(execution_context=execution_context)
+
+        # Files listed and checks of files computed in parallel (by game's id), files counted by
+        # status
+        self.__pool: ThreadPoolExecutor = None
+        self.__games_files: dict[str, tuple[dict[str, dict], set[str]]] = {}
+        self.__checks: dict[str, dict[str, Future]] = {}
+        self.__counters: dict[str, int] = {
+            status: 0 for status in [
+                self.__STATUS_VERIFIED,
+                self.__STATUS_MISSING,
+                self.__STATUS_CHANGED,
+                self.__STATUS_EXTRA
+            ]
+        }
+        self.__manifest: HashManifest = None
+        self.__rate_limiter: RateLimiter = None
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return Action.VERIFY
+
+    def __list_game_files(self, item: dict) -> tuple[dict[str, dict], set[str]]:
+        """List files of a game in the manifest (with their size and hash) and in the games store
+        for selected components (by key in the manifest)"""
+
+        # Initialize result
+        manifest_files: dict[str, dict] = {}
+        store_files: set[str] = set()
+
+        game_folder_path = self._retrieve_game_folder_path(item=item)
+        game_manifest_files = self.__manifest.list_game_files(
+            game_id=item[Constants.UI_TABLE_KEY_COL_ID]
+        )
+        for component, folder_name in self.__COMPONENTS_FOLDERS.items():
+            if component not in self._execution_context.components:
+                continue
+
+            # Files of the component's folder in the manifest
+            prefix = self.__manifest.build_key(os.path.join(game_folder_path, folder_name))
+            manifest_files.update({
+                key: entry for key, entry in game_manifest_files.items()
+                if key.startswith(f'{prefix}{HashManifest.SEPARATOR}')
+            })
+
+            # Files of the component's folder in the games store
+            for relative_path in FileHelper.list_relative_paths(
+                folder_path=os.path.join(game_folder_path, folder_name),
+                file_name='*',
+                error_if_not_found=False
+            ):
+                store_files.add(self.__manifest.build_key(
+                    os.path.join(game_folder_path, folder_name, relative_path)
+                ))
+
+        return manifest_files, store_files
+
+    def __check_file(self, file_path: str, entry: dict) -> bool:
+        """Check that a file has the size and the hash of the manifest (hashed only if same
+        size)"""
+
+        try:
+            if StorageHelper.get_storage().get_size(file_path) != entry[HashManifest.KEY_SIZE]:
+                return False
+        except OSError:
+            # File deleted since listed
+            return False
+
+        hashes = FileHelper.compute_file_hashes(
+            file_path=file_path,
+            rate_limiter=self.__rate_limiter
+        )
+
+        return hashes is not None and hashes[HashIndex.KEY_SHA1] == entry[HashManifest.KEY_SHA1]
+
+    def _prepare_execution(self, rows: list):
+        """Check files of all rows in parallel (items wait for their checks)"""
+
+        self.__manifest = HashManifest(
+            folder_path=os.path.join(
+                Context.get_games_path(),
+                self._execution_context.platform.value
+            )
+        )
+        self.__rate_limiter = RateLimiter(
+            bytes_per_second=Context.get_verify_bandwidth_mbps() * 1024 * 1024
+        )
+        self.__pool = ThreadPoolExecutor(
+            max_workers=Constants.HASH_MAX_CONCURRENCY,
+            initializer=self._metrics.bind
+        )
+        for row in rows:
+            manifest_files, store_files = self.__list_game_files(item=row)
+            self.__games_files[row[Constants.UI_TABLE_KEY_COL_ID]] = manifest_files, store_files
+            self.__checks[row[Constants.UI_TABLE_KEY_COL_ID]] = {
+                key: self.__pool.submit(
+                    self.__check_file,
+                    self.__manifest.build_file_path(key=key),
+                    entry
+                )
+                for key, entry in manifest_files.items() if key in store_files
+            }
+
+    def _finish_execution(self):
+        """Stop checking and log the summary of the verification"""
+
+        if self.__pool is None:
+            return
+
+        self.__pool.shutdown(cancel_futures=True)
+        message = Context.get_text(
+            'verify_summary',
+            verified=self.__counters[self.__STATUS_VERIFIED],
+            missing=self.__counters[self.__STATUS_MISSING],
+            changed=self.__counters[self.__STATUS_CHANGED],
+            extra=self.__counters[self.__STATUS_EXTRA]
+        )
+        if self.__counters[self.__STATUS_VERIFIED] == sum(self.__counters.values()):
+            LoggingHelper.log_info(message=message)
+        else:
+            LoggingHelper.log_warning(message=message)
+
+    def __report_file(self, key: str, status: str):
+        """Count a file by its status and report it if not verified"""
+
+        self.__counters[status] += 1
+        if status != self.__STATUS_VERIFIED:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    f'verify_file_{status}',
+                    file=self.__manifest.build_file_path(key=key)
+                )
+            )
+
+    def do_execution(self, item: dict):
+        """Do execution for an item"""
+
+        manifest_files, store_files = self.__games_files.pop(
+            item[Constants.UI_TABLE_KEY_COL_ID]
+        )
+        checks = self.__checks.pop(item[Constants.UI_TABLE_KEY_COL_ID])
+
+        for key in sorted(manifest_files.keys() | store_files):
+            if key not in store_files:
+                status = self.__STATUS_MISSING
+            elif key not in manifest_files:
+                status = self.__STATUS_EXTRA
+            elif checks[key].result():
+                status = self.__STATUS_VERIFIED
+            else:
+                status = self.__STATUS_CHANGED
+            self.__report_file(key=key, status=status)
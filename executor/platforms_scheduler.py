@@ -0,0 +1,227 @@
+#!/usr/bin/python3
+"""Scheduler executing several Platforms in parallel"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from executor.abstract_executor import AbstractExecutor
+from libraries.constants.constants import Action, Category, Constants, Platform
+from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.event.event_bus import EventBus, EventType
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class PlatformsScheduler(AbstractExecutor):
+    """Scheduler executing an executor per Platform in parallel (each platform has its own
+    software's game list and folders), reporting progress per platform and for all platforms"""
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext,
+        executors: dict[Platform, AbstractExecutor]
+    ):
+        """Initialize scheduler for an execution context and executors of platforms"""
+
+        super().__init__(
+            execution_context=execution_context.replace(
+                platform=None,
+                rows=[row for executor in executors.values() for row in executor.get_rows()]
+            )
+        )
+
+        self.__executors = executors
+        self.__event_bus: EventBus = None
+        self.__execution_finished: bool = False
+
+    def set_event_bus(
+        self,
+        event_bus: EventBus
+    ):
+        """Set the event bus to post progress"""
+
+        self.__event_bus = event_bus
+
+    def stop_execution(self):
+        """Stop execution"""
+
+        super().stop_execution()
+        for executor in self.__executors.values():
+            executor.stop_execution()
+
+    def is_execution_finished(self) -> bool:
+        """Specify if execution finished"""
+
+        return self.__execution_finished
+
+    def retrieve_confirmation_message(self) -> str:
+        """Retrieve the message to confirm before execution (None if no confirmation)"""
+
+        messages = []
+        for platform, executor in self.__executors.items():
+            message = executor.retrieve_confirmation_message()
+            if message is not None:
+                messages.append(f'{platform.value}: {message}')
+
+        if len(messages) == 0:
+            return None
+
+        return '\n\n'.join(messages)
+
+    def get_category(self) -> Category:
+        """Get Category"""
+
+        return self._execution_context.category
+
+    def get_action(self) -> Action:
+        """Get Action"""
+
+        return self._execution_context.action
+
+    def do_execution(self, item: dict):
+        """Do execution for an item (done by executors of platforms)"""
+
+        raise Exception('Items are executed by executors of platforms!')
+
+    @staticmethod
+    def __count_executed_items(
+        event_bus: EventBus,
+        executed_items: int
+    ) -> int:
+        """Count executed items of a platform from events posted since the last call"""
+
+        # Initialize result
+        result = executed_items
+
+        for event_type, data in event_bus.drain():
+            if event_type == EventType.PROGRESS:
+                result = data['value'] - 1
+            elif event_type == EventType.FINISHED:
+                result = data['maximum']
+
+        return result
+
+    def execute(self):
+        """Execute platforms in parallel"""
+
+        if self.__event_bus is None:
+            raise Exception('Missing event bus!')
+
+        # Post log of all platforms to the event bus of the execution
+        LoggingHelper.bind_event_bus(
+            event_bus=self.__event_bus
+        )
+        try:
+            # Start metrics of all platforms when the execution starts (not when queued or
+            # confirmed)
+            self._metrics.start()
+            self.__execute_platforms()
+        finally:
+            LoggingHelper.unbind_event_bus()
+
+    def __execute_platforms(self):
+        """Execute platforms in parallel (log posted to the event bus of the execution)"""
+
+        # Show message for execution started
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'execution_platforms_started',
+                platforms=', '.join(platform.value for platform in self.__executors)
+            )
+        )
+
+        # Set an event bus per platform to follow its progress
+        events_buses: dict[Platform, EventBus] = {}
+        executed_items: dict[Platform, int] = {}
+        for platform, executor in self.__executors.items():
+            events_buses[platform] = EventBus()
+            executed_items[platform] = 0
+            executor.set_event_bus(
+                event_bus=events_buses[platform]
+            )
+            executor.set_log_event_bus(
+                event_bus=self.__event_bus
+            )
+
+            # Metrics of all platforms are counted together
+            executor.set_metrics(
+                metrics=self._metrics
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=Constants.PLATFORMS_MAX_CONCURRENCY
+        ) as pool:
+            futures = {
+                pool.submit(executor.execute): platform
+                for platform, executor in self.__executors.items()
+            }
+
+            # Post progress for all platforms until all are done
+            done_futures = set()
+            while len(done_futures) < len(futures):
+                done_futures, _ = wait(
+                    futures,
+                    timeout=Constants.UI_EVENTS_INTERVAL_MS / 1000
+                )
+                for platform, event_bus in events_buses.items():
+                    executed_items[platform] = self.__count_executed_items(
+                        event_bus=event_bus,
+                        executed_items=executed_items[platform]
+                    )
+                # Value is the item in progress like for executors
+                self.__event_bus.post(
+                    EventType.PROGRESS,
+                    value=min(sum(executed_items.values()) + 1, len(self._execution_context.rows)),
+                    maximum=len(self._execution_context.rows),
+                    text=Context.get_text(
+                        'execution_platforms_in_progress',
+                        platforms=', '.join(
+                            f'{platform.value} {executed_items[platform]}/'
+                            f'{len(executor.get_rows())}'
+                            for platform, executor in self.__executors.items()
+                        ),
+                        item_current_counter=sum(executed_items.values()),
+                        item_total_counter=len(self._execution_context.rows)
+                    )
+                )
+
+        # Show totals per platform
+        all_finished = True
+        for future, platform in futures.items():
+            executor = self.__executors[platform]
+            if future.exception() is not None:
+                LoggingHelper.log_error(
+                    message=Context.get_text(
+                        'error_execution_platform',
+                        platform=platform.value,
+                        error=str(future.exception())
+                    ),
+                    exc=future.exception()
+                )
+            finished = future.exception() is None and \
+                executed_items[platform] == len(executor.get_rows())
+            all_finished = all_finished and finished
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'execution_platform_summary',
+                    platform=platform.value,
+                    item_current_counter=executed_items[platform],
+                    item_total_counter=len(executor.get_rows()),
+                    status=Context.get_text(
+                        'execution_finished' if finished else 'execution_not_finished'
+                    )
+                )
+            )
+        self.__execution_finished = True
+        self._log_metrics_summary()
+
+        # Post end of execution if all platforms finished
+        if all_finished:
+            LoggingHelper.log_info(
+                message=Context.get_text('execution_finished')
+            )
+            self.__event_bus.post(
+                EventType.FINISHED,
+                value=len(self._execution_context.rows),
+                maximum=len(self._execution_context.rows),
+                text=Context.get_text('execution_finished')
+            )
@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+"""Operation Job"""
+
+import threading
+import time
+
+from executor.abstract_executor import AbstractExecutor
+from libraries.constants.constants import JobState
+from libraries.context.context import Context
+from libraries.event.event_bus import EventBus, EventType
+from libraries.logging.logging_helper import LoggingHelper
+
+# pylint: disable=too-many-instance-attributes
+
+
+class OperationJob:
+    """Job of the operation queue executing an executor (with its own snapshot of the selection)"""
+
+    def __init__(
+        self,
+        executor: AbstractExecutor,
+        name: str
+    ):
+        """Initialize job"""
+
+        self.__executor = executor
+        self.__name = name
+        self.__state = JobState.QUEUED
+        self.__executed_items = 0
+        self.__total_items = len(executor.get_rows())
+        self.__execution_finished = False
+        self.__stop_requested = False
+        self.__started_time: float = None
+        self.__ended_time: float = None
+        self.__lock = threading.Lock()
+
+        # Follow progress of the executor
+        self.__event_bus = EventBus()
+        self.__executor.set_event_bus(
+            event_bus=self.__event_bus
+        )
+
+    def get_name(self) -> str:
+        """Get name"""
+
+        return self.__name
+
+    def get_state(self) -> JobState:
+        """Get state"""
+
+        return self.__state
+
+    def get_executed_items(self) -> int:
+        """Get the number of executed items"""
+
+        return self.__executed_items
+
+    def get_total_items(self) -> int:
+        """Get the total number of items"""
+
+        return self.__total_items
+
+    def compute_throughput(self) -> float:
+        """Compute the throughput in items per second (None if not started)"""
+
+        if self.__started_time is None:
+            return None
+
+        elapsed_time = (self.__ended_time or time.time()) - self.__started_time
+        if elapsed_time <= 0:
+            return None
+
+        return self.__executed_items / elapsed_time
+
+    def compute_eta(self) -> float:
+        """Compute the estimated remaining time in seconds (None if unknown)"""
+
+        if self.__state != JobState.RUNNING:
+            return None
+
+        throughput = self.compute_throughput()
+        if throughput is None or throughput == 0:
+            return None
+
+        return (self.__total_items - self.__executed_items) / throughput
+
+    def refresh(self):
+        """Refresh progress from events posted by the executor"""
+
+        with self.__lock:
+            for event_type, data in self.__event_bus.drain():
+                if event_type == EventType.PROGRESS:
+                    self.__executed_items = data['value'] - 1
+                elif event_type == EventType.FINISHED:
+                    self.__executed_items = data['maximum']
+                    self.__execution_finished = True
+
+    def is_ended(self) -> bool:
+        """Specify if the job ended (finished, stopped or failed)"""
+
+        return self.__state in [
+            JobState.FINISHED,
+            JobState.STOPPED,
+            JobState.FAILED
+        ]
+
+    def run(self):
+        """Run the job (in the thread of the operation queue)"""
+
+        with self.__lock:
+            if self.__state != JobState.QUEUED:
+                return
+            self.__state = JobState.RUNNING
+            self.__started_time = time.time()
+
+        try:
+            self.__executor.execute()
+        except Exception as exc:
+            LoggingHelper.log_error(
+                message=Context.get_text(
+                    'error_job',
+                    job=self.__name,
+                    error=str(exc)
+                ),
+                exc=exc
+            )
+
+        # Update state from the end of execution
+        self.refresh()
+        with self.__lock:
+            self.__ended_time = time.time()
+            if self.__execution_finished:
+                self.__state = JobState.FINISHED
+            elif self.__stop_requested:
+                self.__state = JobState.STOPPED
+            else:
+                self.__state = JobState.FAILED
+
+    def stop(self):
+        """Stop the job (cancelled if not started)"""
+
+        with self.__lock:
+            self.__stop_requested = True
+            if self.__state == JobState.QUEUED:
+                self.__state = JobState.STOPPED
+                return
+
+        self.__executor.stop_execution()
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""Operation Queue"""
+
+import threading
+
+from executor.abstract_executor import AbstractExecutor
+from executor.queue.operation_job import OperationJob
+from libraries.constants.constants import JobState
+
+
+class OperationQueue:
+    """Class to queue jobs executed one after the other in background"""
+
+    __lock = threading.Lock()
+    __jobs: list[OperationJob] = []
+    __worker_thread: threading.Thread = None
+
+    @staticmethod
+    def add_job(executor: AbstractExecutor, name: str) -> OperationJob:
+        """Add a job for an executor (started when previous jobs ended)"""
+
+        job = OperationJob(
+            executor=executor,
+            name=name
+        )
+
+        with OperationQueue.__lock:
+            OperationQueue.__jobs.append(job)
+
+            # Start the worker if not already running
+            if OperationQueue.__worker_thread is None:
+                OperationQueue.__worker_thread = threading.Thread(
+                    target=OperationQueue.__run_jobs,
+                    daemon=True
+                )
+                OperationQueue.__worker_thread.start()
+
+        return job
+
+    @staticmethod
+    def list_jobs() -> list[OperationJob]:
+        """List jobs with refreshed progress"""
+
+        with OperationQueue.__lock:
+            result = list(OperationQueue.__jobs)
+
+        for job in result:
+            job.refresh()
+
+        return result
+
+    @staticmethod
+    def has_pending_jobs() -> bool:
+        """Specify if some jobs are queued or running"""
+
+        with OperationQueue.__lock:
+            return any(not job.is_ended() for job in OperationQueue.__jobs)
+
+    @staticmethod
+    def remove_ended_jobs():
+        """Remove ended jobs from the queue"""
+
+        with OperationQueue.__lock:
+            OperationQueue.__jobs = [
+                job for job in OperationQueue.__jobs if not job.is_ended()
+            ]
+
+    @staticmethod
+    def stop_all_jobs():
+        """Stop all jobs (queued jobs are cancelled)"""
+
+        with OperationQueue.__lock:
+            jobs = list(OperationQueue.__jobs)
+
+        for job in jobs:
+            if not job.is_ended():
+                job.stop()
+
+    @staticmethod
+    def __run_jobs():
+        """Run queued jobs one after the other while there are some"""
+
+        while True:
+            with OperationQueue.__lock:
+                queued_jobs = [
+                    job for job in OperationQueue.__jobs
+                    if job.get_state() == JobState.QUEUED
+                ]
+                if len(queued_jobs) == 0:
+                    OperationQueue.__worker_thread = None
+                    return
+
+            queued_jobs[0].run()
@@ -0,0 +1,420 @@
+#!/usr/bin/python3
+"""Builder of rows to select for an execution"""
+
+import os
+
+from executor.games.abstract_games_executor import AbstractGamesExecutor
+from executor.games.clean_media.media_scanner import MediaScanner
+from executor.games.dat.dat_matcher import DatMatcher
+from executor.games.deduplicate.duplicate_finder import DuplicateFinder
+from executor.games.sync.sync_games_planner import SyncGamesPlanner
+from manager.manager_factory import ManagerFactory
+from libraries.constants.constants import Action, Category, Component, Constants, Platform, Software
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.index.hash_manifest import HashManifest
+from libraries.storage.metadata_cache import MetadataCache
+from libraries.trash.trash_helper import TrashHelper
+
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-statements
+# pylint: disable=too-many-locals
+
+
+class RowsBuilder:
+    """Class to build rows (items and components) for the selection in context"""
+
+    @staticmethod
+    def __build_platform_rows(
+        platform: Platform,
+        duplicate_finder: DuplicateFinder = None
+    ) -> list[dict]:
+        """Build rows of items for a platform (duplicates found across platforms by a finder)"""
+
+        # Initialize result
+        result = []
+
+        if Context.get_selected_category() == Category.GAMES:
+            # List games for selected Software
+            selected_software_games = ManagerFactory.create(
+                software=Context.get_selected_software()
+            ).list_games_with_rom(
+                platform=platform
+            )
+
+            # List games for data (games of softwares listed once)
+            data_games = {}
+            softwares_games: dict[Software, dict[str, str]] = {}
+            for game_folder in FileHelper.list_sub_directories(
+                folder_path=os.path.join(
+                    Context.get_games_path(),
+                    platform.value
+                )
+            ):
+                # Try to find the rom file
+                rom_files = FileHelper.list_relative_paths(
+                    folder_path=os.path.join(
+                        Context.get_games_path(),
+                        platform.value,
+                        game_folder,
+                        AbstractGamesExecutor.ROM_FOLDER_NAME
+                    ),
+                    file_name='*',
+                    error_if_not_found=False
+                )
+
+                if len(rom_files) == 0:
+                    continue
+
+                rom_file = rom_files[0]
+
+                # Try to extract the name from software if possible
+                game_name = FileHelper.retrieve_file_basename(rom_file)
+                for software in Context.list_available_softwares():
+                    if software not in softwares_games:
+                        softwares_games[software] = ManagerFactory.create(
+                            software
+                        ).list_games_with_rom(
+                            platform=platform
+                        )
+                    software_games = softwares_games[software]
+                    if rom_file not in software_games:
+                        continue
+                    if len(software_games[rom_file]) == 0:
+                        continue
+                    game_name = software_games[rom_file]
+                    break
+
+                data_games[FileHelper.retrieve_file_name(rom_file)] = game_name
+
+            match(Context.get_selected_action()):
+                case Action.EXPORT | Action.HASH:
+                    for rom, name in selected_software_games.items():
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
+                            rom
+                        )
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
+                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
+
+                        # Check if unique
+                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
+                            data_games.values()
+                        ).count(name) == 1
+
+                        # Retrieve color
+                        if row[Constants.UI_TABLE_KEY_COL_ROM] not in data_games:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_RED
+                        elif not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
+                        else:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
+
+                        # Append row
+                        result.append(row)
+
+                case Action.INSTALL:
+                    for rom, name in data_games.items():
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
+                            rom
+                        )
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
+                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
+
+                        # Check if unique
+                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
+                            data_games.values()
+                        ).count(name) == 1
+
+                        # Retrieve color
+                        if row[Constants.UI_TABLE_KEY_COL_ROM] not in selected_software_games:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_RED
+                        elif not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
+                        else:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
+
+                        # Append row
+                        result.append(row)
+
+                case Action.UNINSTALL:
+                    for rom, name in data_games.items():
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
+                            rom
+                        )
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
+                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
+
+                        # Check if unique
+                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
+                            data_games.values()
+                        ).count(name) == 1
+
+                        # Retrieve color
+                        if row[Constants.UI_TABLE_KEY_COL_ROM] in selected_software_games:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_RED
+                        elif not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
+                        else:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
+
+                        # Append row
+                        result.append(row)
+
+                case Action.DELETE:
+                    for rom, name in data_games.items():
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
+                            rom
+                        )
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
+                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
+
+                        # Check if unique
+                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
+                            data_games.values()
+                        ).count(name) == 1
+
+                        # Retrieve color
+                        if not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
+                        else:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
+
+                        # Append row
+                        result.append(row)
+
+                case Action.SYNC:
+                    result = SyncGamesPlanner(
+                        software_manager=ManagerFactory.create(
+                            software=Context.get_selected_software()
+                        ),
+                        platform=platform
+                    ).build_rows()
+
+                case Action.VERIFY:
+                    # Games in the manifest of the platform (written when exported)
+                    manifest_games = HashManifest(
+                        folder_path=os.path.join(
+                            Context.get_games_path(),
+                            platform.value
+                        )
+                    ).list_games()
+
+                    for rom, name in data_games.items():
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
+                            rom
+                        )
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
+                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
+
+                        # Retrieve color (orange if not in the manifest)
+                        if row[Constants.UI_TABLE_KEY_COL_ID] not in manifest_games:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
+                        else:
+                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
+
+                        # Append row
+                        result.append(row)
+
+                    # Games in the manifest but not in the games store are red
+                    for game_id in sorted(manifest_games - {
+                        row[Constants.UI_TABLE_KEY_COL_ID] for row in result
+                    }):
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = game_id
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = game_id
+                        row[Constants.UI_TABLE_KEY_COL_ROM] = ''
+                        row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_RED
+
+                        # Append row
+                        result.append(row)
+
+                case Action.DEDUPLICATE:
+                    result = duplicate_finder.build_rows(
+                        platform=platform,
+                        games_names=data_games
+                    )
+
+                case Action.CLEAN_MEDIA:
+                    result = MediaScanner(
+                        software_manager=ManagerFactory.create(
+                            software=Context.get_selected_software()
+                        ),
+                        platform=platform
+                    ).build_rows()
+
+                case Action.COMPACT:
+                    # File listing games of the platform in the selected Software
+                    games_list_file = ManagerFactory.create(
+                        software=Context.get_selected_software()
+                    ).retrieve_games_list_file(
+                        platform=platform
+                    )
+                    if FileHelper.is_file_exists(games_list_file):
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = os.path.relpath(
+                            games_list_file,
+                            Context.get_software_path(
+                                software=Context.get_selected_software()
+                            )
+                        )
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = platform.value
+                        row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
+
+                        # Append row
+                        result.append(row)
+
+                case Action.RESTORE:
+                    # Games (or their media) of the platform in the trash, green if the game was
+                    # deleted, orange if only its media
+                    platform_path = os.path.join(
+                        Context.get_games_path(),
+                        platform.value
+                    )
+                    games_ids: dict[str, str] = {}
+                    for folder_path in TrashHelper.list_trashed_folders(
+                        folder_path=platform_path
+                    ):
+                        game_id = os.path.relpath(folder_path, platform_path).split(os.sep)[0]
+                        if games_ids.get(game_id, None) != Constants.ITEM_COLOR_GREEN:
+                            games_ids[game_id] = Constants.ITEM_COLOR_ORANGE \
+                                if FileHelper.is_folder_exists(
+                                    folder_path=os.path.join(platform_path, game_id)
+                                ) else Constants.ITEM_COLOR_GREEN
+
+                    for game_id, color in games_ids.items():
+                        # Build row
+                        row = {}
+                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                        row[Constants.UI_TABLE_KEY_COL_ID] = game_id
+                        row[Constants.UI_TABLE_KEY_COL_NAME] = game_id
+                        row[Constants.UI_TABLE_KEY_COLOR] = color
+
+                        # Append row
+                        result.append(row)
+
+        return result
+
+    @staticmethod
+    def build_rows() -> list[dict]:
+        """Build rows of items for selected platforms sorted by color and name"""
+
+        # Initialize result
+        result = []
+
+        platforms = [None]
+        if Context.get_selected_category() == Category.GAMES:
+            platforms = Context.get_selected_platforms()
+
+        # Find duplicates once across all platforms (a rom may be duplicated in another platform)
+        duplicate_finder = None
+        if Context.get_selected_category() == Category.GAMES and \
+                Context.get_selected_action() == Action.DEDUPLICATE:
+            duplicate_finder = DuplicateFinder()
+            duplicate_finder.find()
+            duplicate_finder.write_report()
+
+        platforms_rows: dict[Platform, list[dict]] = {}
+        for platform in platforms:
+            # Cache folders' listings and files' stats while listing games of the platform
+            with MetadataCache.scope():
+                platform_rows = RowsBuilder.__build_platform_rows(
+                    platform=platform,
+                    duplicate_finder=duplicate_finder
+                )
+
+            # Show the platform of rows if several platforms are selected
+            if len(platforms) > 1:
+                for row in platform_rows:
+                    row[Constants.UI_TABLE_KEY_COL_PLATFORM] = platform.value
+
+            platforms_rows[platform] = platform_rows
+            result.extend(platform_rows)
+
+        # Match roms with DAT files if a platform has DAT files (rows of all platforms have the
+        # same columns)
+        if Context.get_selected_category() == Category.GAMES and \
+                Context.get_selected_action() not in [
+                    Action.SYNC,
+                    Action.CLEAN_MEDIA,
+                    Action.COMPACT,
+                    Action.RESTORE
+                ]:
+            matchers = {
+                platform: DatMatcher(platform=platform) for platform in platforms_rows
+            }
+            if any(matcher.has_dats() for matcher in matchers.values()):
+                for platform, platform_rows in platforms_rows.items():
+                    matchers[platform].match_rows(rows=platform_rows)
+
+        # Sort rows depending on UI_TABLE_KEY_COLOR (desc) and Constants.UI_TABLE_KEY_COL_NAME (asc)
+        return sorted(
+            result,
+            key=lambda x: (-ord(
+                x[Constants.UI_TABLE_KEY_COLOR][0]),
+                x[Constants.UI_TABLE_KEY_COL_NAME]
+            )
+        )
+
+    @staticmethod
+    def build_components_rows() -> list[dict]:
+        """Build rows of components"""
+
+        # List components depending on category and action
+        components = []
+        match(Context.get_selected_category()):
+            case Category.GAMES:
+                if Context.get_selected_action() not in [
+                    Action.INSTALL,
+                    Action.UNINSTALL,
+                    Action.DELETE,
+                    Action.SYNC,
+                    Action.HASH,
+                    Action.DEDUPLICATE,
+                    Action.VERIFY,
+                    Action.CLEAN_MEDIA,
+                    Action.RESTORE
+                ]:
+                    components.append(Component.INFO)
+                if Context.get_selected_action() not in [Action.CLEAN_MEDIA, Action.COMPACT]:
+                    components.append(Component.ROM)
+                if Context.get_selected_action() not in [
+                    Action.HASH,
+                    Action.DEDUPLICATE,
+                    Action.COMPACT
+                ]:
+                    components.append(Component.MEDIA)
+
+            case Category.CONFIGS:
+                components.append(Component.FILES)
+                components.append(Component.REGISTRY)
+
+        # Initialize result
+        result = []
+        for component in components:
+            result.append({
+                Constants.UI_TABLE_KEY_COL_SELECTION: False,
+                Constants.UI_TABLE_KEY_COL_ID: Context.get_text(component.value),
+                Constants.UI_TABLE_KEY_COL_NAME: Context.get_text(component.value),
+                Constants.UI_TABLE_KEY_COLOR: Constants.ITEM_COLOR_BLACK
+            })
+
+        return result
@@ -5,6 +5,7 @@ import os
 import subprocess
 
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
 from libraries.logging.logging_helper import LoggingHelper
 
 
@@ -21,7 +22,7 @@ class CmdHelper:
     ):
         """Run a command"""
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'run_cmd_simulation',
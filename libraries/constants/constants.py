@@ -30,6 +30,33 @@ class Action(Enum):
     COPY = 'action_copy'
     EDIT = 'action_edit'
     DELETE = 'action_delete'
+    SYNC = 'action_sync'
+    HASH = 'action_hash'
+    DEDUPLICATE = 'action_deduplicate'
+    VERIFY = 'action_verify'
+    CLEAN_MEDIA = 'action_clean_media'
+    COMPACT = 'action_compact'
+    RESTORE = 'action_restore'
+
+
+class Operation(Enum):
+    """Operation"""
+
+    INSTALL = 'operation_install'
+    UPDATE = 'operation_update'
+    METADATA = 'operation_metadata'
+    REMOVE = 'operation_remove'
+    NONE = 'operation_none'
+
+
+class JobState(Enum):
+    """Job's state in the operation queue"""
+
+    QUEUED = 'job_state_queued'
+    RUNNING = 'job_state_running'
+    FINISHED = 'job_state_finished'
+    STOPPED = 'job_state_stopped'
+    FAILED = 'job_state_failed'
 
 
 class Software(Enum):
@@ -41,6 +68,39 @@ class Software(Enum):
     SKRAPER = 'Skraper'
 
 
+class DatStatus(Enum):
+    """Status of a game's rom compared to DAT files"""
+
+    VERIFIED = 'dat_status_verified'
+    MISNAMED = 'dat_status_misnamed'
+    UNKNOWN = 'dat_status_unknown'
+    NOT_HASHED = 'dat_status_not_hashed'
+    NO_DAT = 'dat_status_no_dat'
+
+
+class MetricsPhase(Enum):
+    """Phase measured in metrics of executions"""
+
+    READ = 'metrics_phase_read'
+    WRITE = 'metrics_phase_write'
+    XML = 'metrics_phase_xml'
+
+
+class Profiling(Enum):
+    """Profiling of executions"""
+
+    OFF = 'profiling_off'
+    TIMERS = 'profiling_timers'
+    FULL = 'profiling_full'
+
+
+class Storage(Enum):
+    """Storage backend used by FileHelper"""
+
+    LOCAL = 'local'
+    SLOW_LOCAL = 'slow_local'
+
+
 class Platform(Enum):
     """Platform"""
 
@@ -78,6 +138,7 @@ class Constants:
     # Constants for paths
     RESOURCES_PATH = 'resources'
     GAMES_PATH = 'games'
+    TRASH_PATH = '.trash'
 
     # Constants for extensions
     XML_EXTENSION = '.xml'
@@ -89,20 +150,67 @@ class Constants:
         'Thumbs'
     ]
 
+    # Constants for execution (items executed by batches by executors supporting it, files
+    # listing games are read and written once by batch)
+    EXECUTION_BATCH_SIZE = 50
+
+    # Constants for concurrency (platforms executed in parallel and I/O operations in parallel)
+    PLATFORMS_MAX_CONCURRENCY = 4
+    IO_MAX_CONCURRENCY = 2
+
+    # Constants for hashing (files hashed in parallel, hashlib and zlib release the GIL on large
+    # buffers, changes of indexes of hashes are appended periodically to their log while hashing)
+    HASH_MAX_CONCURRENCY = 4
+    HASH_CHUNK_SIZE = 8 * 1024 * 1024
+    HASH_INDEX_SAVE_INTERVAL = 500
+    HASH_PARTIAL_BLOCK_SIZE = 64 * 1024
+
+    # Constants for metrics (throughputs and ETA are computed on a moving window)
+    METRICS_WINDOW_SECONDS = 30
+
+    # Constants for storage (environment variables, a slow storage reproduces a network share)
+    ENV_STORAGE = 'RETROBOX_MANAGER_STORAGE'
+    ENV_STORAGE_LATENCY_MS = 'RETROBOX_MANAGER_STORAGE_LATENCY_MS'
+    ENV_STORAGE_BANDWIDTH_KBPS = 'RETROBOX_MANAGER_STORAGE_BANDWIDTH_KBPS'
+
     # Constants for UI
     UI_PAD_SMALL = 5
     UI_PAD_BIG = 10
+    UI_EVENTS_INTERVAL_MS = 50
+    UI_QUEUE_INTERVAL_MS = 500
+    UI_LOG_MAX_LINES = 2000
+    UI_LOG_LEVELS = ['INFO', 'WARNING', 'ERROR']
     UI_TABLE_KEY_COL_SELECTION = 'column_title_selection'
     UI_TABLE_KEY_COL_ID = 'column_title_id'
     UI_TABLE_KEY_COL_NAME = 'column_title_name'
     UI_TABLE_KEY_COL_ROM = 'column_title_rom'
     UI_TABLE_KEY_COL_UNIQUE = 'column_title_unique'
+    UI_TABLE_KEY_COL_OPERATION = 'column_title_operation'
+    UI_TABLE_KEY_COL_PLATFORM = 'column_title_platform'
+    UI_TABLE_KEY_COL_DAT_STATUS = 'column_title_dat_status'
+    UI_TABLE_KEY_COL_DAT_NAME = 'column_title_dat_name'
+    UI_TABLE_KEY_COL_DUPLICATES = 'column_title_duplicates'
+    UI_TABLE_KEY_COL_MEDIA_STATUS = 'column_title_media_status'
+    UI_TABLE_KEY_GAME_FOLDER = 'game_folder'
+    UI_TABLE_KEY_OPERATION = 'operation'
     UI_TABLE_KEY_COLOR = 'color'
+    UI_TABLE_HIDDEN_KEYS = [
+        UI_TABLE_KEY_COL_ID,
+        UI_TABLE_KEY_GAME_FOLDER,
+        UI_TABLE_KEY_OPERATION,
+        UI_TABLE_KEY_COLOR
+    ]
 
     # Constants for setup
     SETUP_LANG_CODE = 'lang_code'
     SETUP_MONITOR = 'monitor'
     SETUP_SIMULATED = 'simulated'
+    SETUP_DEFERRED_DELETION = 'deferred_deletion'
+    SETUP_TRASH_RETENTION_DAYS = 'trash_retention_days'
+    SETUP_VERIFY_BANDWIDTH_MBPS = 'verify_bandwidth_mbps'
+    SETUP_DEDUPLICATED_MEDIA = 'deduplicated_media'
+    SETUP_UI_LOG_LEVEL = 'ui_log_level'
+    SETUP_PROFILING = 'profiling'
     SETUP_AVAILABLE_SOFTWARES = 'available_softwares'
     SETUP_SOFTWARE_BATOCERA_PATH = 'software_batocera_path'
     SETUP_SOFTWARE_LAUNCHBOX_PATH = 'software_launchbox_path'
@@ -8,8 +8,10 @@ import re
 import socket
 import configparser
 import locale
+import logging
 
 from libraries.constants.constants import Action, Category, Component, Constants, Platform, Software
+from libraries.constants.constants import Profiling, Storage
 
 # pylint: disable=unnecessary-comprehension
 # pylint: disable=too-many-public-methods
@@ -27,12 +29,21 @@ class Context:
     __monitor: int = None
     __texts_by_lang_code = {}
     __simulated: bool = False
+    __deferred_deletion: bool = False
+    __trash_retention_days: int = 0
+    __verify_bandwidth_mbps: int = 0
+    __deduplicated_media: bool = False
+    __profiling: Profiling = Profiling.OFF
+    __storage: Storage = Storage.LOCAL
+    __storage_latency_ms: int = 0
+    __storage_bandwidth_kbps: int = 0
+    __ui_log_level: str = Constants.UI_LOG_LEVELS[0]
     __working_path = None
     __base_path = None
     __packaged = False
     __selected_category: Category = None
     __selected_action: Action = None
-    __selected_platform: Platform = None
+    __selected_platforms: list[Platform] = []
     __selected_software: Software = None
     __available_softwares: list[Software] = []
     __softwares_paths: dict[Software, Path] = {}
@@ -58,6 +69,11 @@ class Context:
         else:
             Context.__working_path = os.getcwd()
 
+        # Define storage (a slow storage is used to benchmark network shares)
+        Context.__storage = Storage(os.getenv(Constants.ENV_STORAGE, Storage.LOCAL.value))
+        Context.__storage_latency_ms = int(os.getenv(Constants.ENV_STORAGE_LATENCY_MS, '0'))
+        Context.__storage_bandwidth_kbps = int(os.getenv(Constants.ENV_STORAGE_BANDWIDTH_KBPS, '0'))
+
         # Define base path depending on DEV or package
         try:
             Context.__base_path = sys._MEIPASS
@@ -106,6 +122,22 @@ class Context:
         # Initialize boolean simulated
         Context.__simulated = False
 
+        # Initialize deletion
+        Context.__deferred_deletion = False
+        Context.__trash_retention_days = 0
+
+        # Initialize bandwidth of verifications (unlimited)
+        Context.__verify_bandwidth_mbps = 0
+
+        # Initialize media of the games store (a copy by game)
+        Context.__deduplicated_media = False
+
+        # Initialize log level shown in UI
+        Context.__ui_log_level = Constants.UI_LOG_LEVELS[0]
+
+        # Initialize profiling
+        Context.__profiling = Profiling.OFF
+
         # Specify that context is initialized
         Context.__initialized = True
 
@@ -214,6 +246,42 @@ class Context:
             'logs'
         ))
 
+    @staticmethod
+    def get_journals_path() -> Path:
+        """Get journals path"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Path(os.path.join(
+            Context.get_working_path(),
+            'journals'
+        ))
+
+    @staticmethod
+    def get_indexes_path() -> Path:
+        """Get indexes path"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Path(os.path.join(
+            Context.get_working_path(),
+            'indexes'
+        ))
+
+    @staticmethod
+    def get_dats_path() -> Path:
+        """Get DAT files path (a folder by platform)"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Path(os.path.join(
+            Context.get_working_path(),
+            'dats'
+        ))
+
     @staticmethod
     def get_games_path() -> Path:
         """Get games path"""
@@ -244,6 +312,103 @@ class Context:
 
         return Context.__simulated
 
+    @staticmethod
+    def is_deferred_deletion() -> bool:
+        """Specify if deleted folders are moved to a trash"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__deferred_deletion
+
+    @staticmethod
+    def get_trash_retention_days() -> int:
+        """Get the number of days before purging folders in trash"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__trash_retention_days
+
+    @staticmethod
+    def get_verify_bandwidth_mbps() -> int:
+        """Get the bandwidth in MB/s of reads to verify files (unlimited if 0)"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__verify_bandwidth_mbps
+
+    @staticmethod
+    def is_deduplicated_media() -> bool:
+        """Specify if media of the games store are stored once by content (games' media are
+        hardlinks to blobs)"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__deduplicated_media
+
+    @staticmethod
+    def get_profiling() -> Profiling:
+        """Get the profiling of executions"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__profiling
+
+    @staticmethod
+    def set_profiling(profiling: Profiling):
+        """Set the profiling of executions"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        Context.__profiling = profiling
+
+    @staticmethod
+    def get_storage() -> Storage:
+        """Get the storage backend"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__storage
+
+    @staticmethod
+    def get_storage_latency_ms() -> int:
+        """Get the latency in milliseconds of each operation on a slow storage"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__storage_latency_ms
+
+    @staticmethod
+    def get_storage_bandwidth_kbps() -> int:
+        """Get the bandwidth in KB/s of a slow storage (unlimited if 0)"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__storage_bandwidth_kbps
+
+    @staticmethod
+    def get_ui_log_level_name() -> str:
+        """Get the name of the minimal log level shown in UI"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__ui_log_level
+
+    @staticmethod
+    def get_ui_log_level() -> int:
+        """Get the minimal log level shown in UI"""
+
+        return logging.getLevelName(Context.get_ui_log_level_name())
+
     @staticmethod
     def get_selected_category() -> Category:
         """Get selected category"""
@@ -282,21 +447,41 @@ class Context:
 
     @staticmethod
     def get_selected_platform() -> Platform:
-        """Get selected platform"""
+        """Get selected platform (None if several platforms are selected)"""
 
         if not Context.__initialized:
             Context.init()
 
-        return Context.__selected_platform
+        if len(Context.__selected_platforms) != 1:
+            return None
+
+        return Context.__selected_platforms[0]
 
     @staticmethod
     def set_selected_platform(platform: Platform):
         """Set selected platform"""
 
+        Context.set_selected_platforms(
+            [platform] if platform is not None else []
+        )
+
+    @staticmethod
+    def get_selected_platforms() -> list[Platform]:
+        """Get selected platforms"""
+
         if not Context.__initialized:
             Context.init()
 
-        Context.__selected_platform = platform
+        return Context.__selected_platforms
+
+    @staticmethod
+    def set_selected_platforms(platforms: list[Platform]):
+        """Set selected platforms"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        Context.__selected_platforms = platforms
 
     @staticmethod
     def get_selected_software() -> Software:
@@ -414,6 +599,38 @@ class Context:
                     Constants.SETUP_SIMULATED
                 ] == 'True'
 
+            if Constants.SETUP_DEFERRED_DELETION in setup_items:
+                Context.__deferred_deletion = setup_items[
+                    Constants.SETUP_DEFERRED_DELETION
+                ] == 'True'
+
+            if Constants.SETUP_TRASH_RETENTION_DAYS in setup_items:
+                Context.__trash_retention_days = int(setup_items[
+                    Constants.SETUP_TRASH_RETENTION_DAYS
+                ])
+
+            if Constants.SETUP_VERIFY_BANDWIDTH_MBPS in setup_items:
+                Context.__verify_bandwidth_mbps = int(setup_items[
+                    Constants.SETUP_VERIFY_BANDWIDTH_MBPS
+                ])
+
+            if Constants.SETUP_DEDUPLICATED_MEDIA in setup_items:
+                Context.__deduplicated_media = setup_items[
+                    Constants.SETUP_DEDUPLICATED_MEDIA
+                ] == 'True'
+
+            if Constants.SETUP_UI_LOG_LEVEL in setup_items and \
+                    setup_items[Constants.SETUP_UI_LOG_LEVEL] in Constants.UI_LOG_LEVELS:
+                Context.__ui_log_level = setup_items[
+                    Constants.SETUP_UI_LOG_LEVEL
+                ]
+
+            if Constants.SETUP_PROFILING in setup_items and \
+                    setup_items[Constants.SETUP_PROFILING] in Profiling.__members__:
+                Context.__profiling = Profiling[
+                    setup_items[Constants.SETUP_PROFILING]
+                ]
+
             if Constants.SETUP_AVAILABLE_SOFTWARES in setup_items:
                 Context.__available_softwares = []
                 for software in Software:
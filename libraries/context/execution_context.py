@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""Execution Context"""
+
+import dataclasses
+import threading
+
+from libraries.constants.constants import Action, Category, Component, Platform, Profiling, Software
+from libraries.context.context import Context
+
+# pylint: disable=too-many-instance-attributes
+
+
+@dataclasses.dataclass(frozen=True)
+class ExecutionContext:
+    """Immutable snapshot of the context for an execution (safe to use from several threads)"""
+
+    category: Category
+    action: Action
+    software: Software
+    platform: Platform
+    components: tuple[Component, ...]
+    rows: tuple[dict, ...]
+    simulated: bool
+    deferred_deletion: bool
+    profiling: Profiling
+
+    # Execution context bound to the thread executing it
+    __current = threading.local()
+
+    @staticmethod
+    def create(
+        platform: Platform = None,
+        rows: list = None
+    ) -> 'ExecutionContext':
+        """Create an execution context from the context (selected platform and rows if not
+        specified)"""
+
+        return ExecutionContext(
+            category=Context.get_selected_category(),
+            action=Context.get_selected_action(),
+            software=Context.get_selected_software(),
+            platform=platform if platform is not None else Context.get_selected_platform(),
+            components=tuple(Context.get_selected_components()),
+            rows=tuple(rows if rows is not None else Context.get_selected_rows()),
+            simulated=Context.is_simulated(),
+            deferred_deletion=Context.is_deferred_deletion(),
+            profiling=Context.get_profiling()
+        )
+
+    def replace(self, **changes) -> 'ExecutionContext':
+        """Create a copy of the execution context with changes"""
+
+        if 'components' in changes:
+            changes['components'] = tuple(changes['components'])
+        if 'rows' in changes:
+            changes['rows'] = tuple(changes['rows'])
+
+        return dataclasses.replace(self, **changes)
+
+    def bind(self):
+        """Bind the execution context to the current thread"""
+
+        ExecutionContext.__current.execution_context = self
+
+    @staticmethod
+    def unbind():
+        """Unbind the execution context from the current thread"""
+
+        ExecutionContext.__current.execution_context = None
+
+    @staticmethod
+    def get_current() -> 'ExecutionContext':
+        """Get the execution context bound to the current thread (None if not bound)"""
+
+        return getattr(ExecutionContext.__current, 'execution_context', None)
+
+    @staticmethod
+    def is_simulated_execution() -> bool:
+        """Specify if the current execution is simulated (context is used if no execution)"""
+
+        execution_context = ExecutionContext.get_current()
+        if execution_context is None:
+            return Context.is_simulated()
+
+        return execution_context.simulated
+
+    @staticmethod
+    def is_deferred_deletion_execution() -> bool:
+        """Specify if deleted folders are moved to a trash for the current execution (context is
+        used if no execution)"""
+
+        execution_context = ExecutionContext.get_current()
+        if execution_context is None:
+            return Context.is_deferred_deletion()
+
+        return execution_context.deferred_deletion
@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+"""DAT Index"""
+
+import hashlib
+import json
+import os
+import threading
+
+from libraries.constants.constants import Platform
+from libraries.context.context import Context
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.xml.xml_helper import XmlHelper
+
+
+class DatIndex:
+    """Index on disk of roms of a platform's DAT files (Logiqx XML like No-Intro or Redump) by
+    SHA1 and CRC32, imported again only if a DAT file changed"""
+
+    __VERSION = 1
+
+    __DAT_EXTENSIONS = ['.dat', '.xml']
+    __GAME_TAGS = ['game', 'machine']
+    __ROM_TAG = 'rom'
+
+    __KEY_VERSION = 'version'
+    __KEY_DATS = 'dats'
+    __KEY_GAMES = 'games'
+    __KEY_ROMS = 'roms'
+    __KEY_SHA1 = 'sha1'
+    __KEY_CRC32 = 'crc32'
+
+    # Attributes of roms' hashes by key of the index
+    __HASH_ATTRIBUTES = {
+        __KEY_SHA1: 'sha1',
+        __KEY_CRC32: 'crc'
+    }
+
+    # Lock by index file (an index may be used by several threads)
+    __locks: dict[str, threading.Lock] = {}
+    __locks_lock = threading.Lock()
+
+    def __init__(
+        self,
+        platform: Platform
+    ):
+        """Initialize index for a platform (loaded and refreshed when first used)"""
+
+        self.__folder_path = os.path.join(
+            Context.get_dats_path(),
+            platform.value
+        )
+        digest = hashlib.sha1(platform.value.encode('utf-8')).hexdigest()
+        self.__file_path = os.path.join(
+            Context.get_indexes_path(),
+            f'{digest}_dat.json'
+        )
+        self.__content: dict = None
+
+        with DatIndex.__locks_lock:
+            self.__lock = DatIndex.__locks.setdefault(self.__file_path, threading.Lock())
+
+    def __list_dats(self) -> dict[str, list[int]]:
+        """List DAT files of the platform with their size and modification time"""
+
+        # Initialize result
+        result: dict[str, list[int]] = {}
+
+        if not os.path.isdir(self.__folder_path):
+            return result
+
+        with os.scandir(self.__folder_path) as entries:
+            for entry in entries:
+                if entry.is_file() and \
+                        os.path.splitext(entry.name)[1].lower() in self.__DAT_EXTENSIONS:
+                    stat = entry.stat()
+                    result[entry.name] = [stat.st_size, stat.st_mtime_ns]
+
+        return result
+
+    def has_dats(self) -> bool:
+        """Specify if the platform has DAT files"""
+
+        return len(self.__list_dats()) > 0
+
+    def refresh(self):
+        """Refresh the index (DAT files are imported again if one of them changed)"""
+
+        with self.__lock:
+            dats = self.__list_dats()
+            if self.__content is None:
+                self.__content = self.__load()
+            if self.__content.get(self.__KEY_DATS, None) == dats:
+                return
+
+            self.__content = self.__import(dats=dats)
+            self.__save()
+
+    def __import(self, dats: dict[str, list[int]]) -> dict:
+        """Import DAT files streamed (roms are indexed by their hashes in lower case, the first
+        rom is kept for a hash)"""
+
+        # Initialize result
+        result = {
+            self.__KEY_VERSION: self.__VERSION,
+            self.__KEY_DATS: dats,
+            self.__KEY_GAMES: [],
+            self.__KEY_ROMS: [],
+            self.__KEY_SHA1: {},
+            self.__KEY_CRC32: {}
+        }
+
+        for dat_name in sorted(dats):
+            dat_file_path = os.path.join(self.__folder_path, dat_name)
+            try:
+                self.__import_dat(
+                    dat_file_path=dat_file_path,
+                    content=result
+                )
+            except Exception as exc:
+                # Ignore a DAT file which can't be parsed
+                LoggingHelper.log_error(
+                    message=Context.get_text(
+                        'error_dat_import',
+                        file=dat_file_path,
+                        error=str(exc)
+                    ),
+                    exc=exc
+                )
+
+        return result
+
+    def __import_dat(self, dat_file_path: str, content: dict):
+        """Import games and roms of a DAT file in the content of the index"""
+
+        for node in XmlHelper.iterate_tags(
+            xml_file_path=dat_file_path,
+            tags=self.__GAME_TAGS
+        ):
+            game_idx = len(content[self.__KEY_GAMES])
+            content[self.__KEY_GAMES].append(node.get('name'))
+            for rom in node.iter(self.__ROM_TAG):
+                rom_idx = len(content[self.__KEY_ROMS])
+                content[self.__KEY_ROMS].append([game_idx, rom.get('name')])
+                for key, attribute in self.__HASH_ATTRIBUTES.items():
+                    if rom.get(attribute):
+                        content[key].setdefault(rom.get(attribute).lower(), rom_idx)
+
+    def find_rom(self, hashes: dict[str, str]) -> tuple[str, str]:
+        """Find a rom by its hashes (SHA1 first, then CRC32), return its game's name and its
+        name (None if not found)"""
+
+        if self.__content is None:
+            self.refresh()
+
+        for key in [self.__KEY_SHA1, self.__KEY_CRC32]:
+            if hashes.get(key, None) is None:
+                continue
+            rom_idx = self.__content[key].get(hashes[key].lower(), None)
+            if rom_idx is not None:
+                game_idx, rom_name = self.__content[self.__KEY_ROMS][rom_idx]
+                return self.__content[self.__KEY_GAMES][game_idx], rom_name
+
+        return None
+
+    def __load(self) -> dict:
+        """Load the index saved on disk (empty if not saved or obsolete)"""
+
+        if not os.path.isfile(self.__file_path):
+            return {}
+
+        try:
+            with open(self.__file_path, mode='r', encoding='UTF-8') as file:
+                content = json.load(file)
+        except ValueError:
+            # Ignore an index partially written
+            return {}
+
+        if content.get(self.__KEY_VERSION, None) != self.__VERSION:
+            return {}
+
+        return content
+
+    def __save(self):
+        """Save the index on disk (replaced at once)"""
+
+        os.makedirs(os.path.dirname(self.__file_path), exist_ok=True)
+        temporary_file_path = f'{self.__file_path}.tmp'
+        with open(temporary_file_path, mode='w', encoding='UTF-8') as file:
+            json.dump(self.__content, file)
+        os.replace(temporary_file_path, self.__file_path)
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""Event Bus"""
+
+from enum import Enum
+import queue
+
+
+class EventType(Enum):
+    """Event type"""
+
+    PROGRESS = 'progress'
+    LOG = 'log'
+    FINISHED = 'finished'
+
+
+class EventBus:
+    """Bus to post events from any thread and to drain them from the UI's thread"""
+
+    def __init__(self):
+        """Initialize event bus"""
+
+        self.__events = queue.SimpleQueue()
+
+    def post(self, event_type: EventType, **data):
+        """Post an event (thread-safe)"""
+
+        self.__events.put((event_type, data))
+
+    def drain(self) -> list[tuple[EventType, dict]]:
+        """Drain posted events, only the last progress is kept between 2 drains"""
+
+        # Initialize result
+        result: list[tuple[EventType, dict]] = []
+
+        last_progress_idx = None
+        while True:
+            try:
+                event_type, data = self.__events.get_nowait()
+            except queue.Empty:
+                break
+
+            # Replace the previous progress by the new one
+            if event_type == EventType.PROGRESS:
+                if last_progress_idx is not None:
+                    result[last_progress_idx] = None
+                last_progress_idx = len(result)
+
+            result.append((event_type, data))
+
+        return [event for event in result if event is not None]
@@ -2,35 +2,99 @@
 """File Helper"""
 
 import os
+import contextlib
 import fnmatch
+import hashlib
 from pathlib import Path
-import shutil
+import threading
+import zipfile
+import zlib
 
+from libraries.constants.constants import Constants, MetricsPhase
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.execution_metrics import ExecutionMetrics
+from libraries.metrics.rate_limiter import RateLimiter
+from libraries.storage.metadata_cache import MetadataCache
+from libraries.storage.storage_helper import StorageHelper
+from libraries.trash.trash_helper import TrashHelper
+
+# pylint: disable=too-many-public-methods
 
 
 class FileHelper:
     """Class to help usage of File"""
 
+    # Limit of I/O operations in parallel (when platforms are executed in parallel)
+    __io_semaphore = threading.BoundedSemaphore(Constants.IO_MAX_CONCURRENCY)
+
+    @staticmethod
+    def __get_metadata():
+        """Get the metadata cache of the current scan if any, else the storage"""
+
+        cache = MetadataCache.get_current()
+        if cache is not None:
+            return cache
+
+        return StorageHelper.get_storage()
+
+    @staticmethod
+    def __invalidate(
+        path: str,
+        folder: bool = False
+    ):
+        """Invalidate a path written in the metadata cache of the current scan if any"""
+
+        cache = MetadataCache.get_current()
+        if cache is not None:
+            cache.invalidate(
+                path=path,
+                folder=folder
+            )
+
     @staticmethod
     def is_folder_exists(
         folder_path: str
     ):
         """Check if a folder exists"""
-        return os.path.isdir(folder_path)
+        return FileHelper.__get_metadata().is_folder(folder_path)
 
     @staticmethod
     def delete_folder(
-        folder_path: str
+        folder_path: str,
+        deferred: bool = None
     ) -> bool:
-        """Delete a folder"""
+        """Delete a folder (moved to the trash if deferred, setup is used if not specified)"""
         if not FileHelper.is_folder_exists(
             folder_path=folder_path
         ):
             return False
 
-        if Context.is_simulated():
+        if deferred is None:
+            deferred = ExecutionContext.is_deferred_deletion_execution()
+
+        # Move the folder to the trash if deferred (fallback on deletion if impossible)
+        if deferred:
+            try:
+                FileHelper.__invalidate(
+                    path=folder_path,
+                    folder=True
+                )
+                if TrashHelper.move_folder_to_trash(
+                    folder_path=folder_path
+                ):
+                    return True
+            except OSError as exc:
+                LoggingHelper.log_error(
+                    message=Context.get_text(
+                        'error_trash_folder',
+                        folder=str(folder_path)
+                    ),
+                    exc=exc
+                )
+
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'delete_folder_simulation',
@@ -45,10 +109,33 @@ class FileHelper:
                 folder=str(folder_path)
             )
         )
-        shutil.rmtree(folder_path)
+        with FileHelper.__io_semaphore, ExecutionMetrics.measure(
+            phase=MetricsPhase.WRITE,
+            files=1
+        ):
+            StorageHelper.get_storage().delete_folder(folder_path)
+        FileHelper.__invalidate(
+            path=folder_path,
+            folder=True
+        )
 
         return True
 
+    @staticmethod
+    def restore_folder(
+        folder_path: str
+    ) -> bool:
+        """Restore a folder deleted in the trash (False if not found in the trash or existing)"""
+
+        FileHelper.__invalidate(
+            path=folder_path,
+            folder=True
+        )
+
+        return TrashHelper.restore_folder(
+            folder_path=folder_path
+        )
+
     @staticmethod
     def is_file_exists(
         file_path: str
@@ -57,9 +144,10 @@ class FileHelper:
         if file_path is None:
             return False
 
-        return os.path.isfile(file_path)
+        return FileHelper.__get_metadata().is_file(file_path)
 
     @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.READ)
     def compare_files(
         file1_path: str,
         file2_path: str
@@ -76,10 +164,148 @@ class FileHelper:
         ):
             return False
 
-        size_file1 = os.path.getsize(file1_path)
-        size_file2 = os.path.getsize(file2_path)
+        size_file1 = FileHelper.__get_metadata().get_size(file1_path)
+        size_file2 = FileHelper.__get_metadata().get_size(file2_path)
         return size_file1 == size_file2
 
+    @staticmethod
+    def compute_file_hash(
+        file_path: str,
+        algorithm: str = 'sha1',
+        chunk_size: int = 1024 * 1024
+    ) -> str:
+        """Compute the hash of a file's content"""
+        if not FileHelper.is_file_exists(
+            file_path=file_path
+        ):
+            return None
+
+        file_hash = hashlib.new(algorithm)
+        with ExecutionMetrics.measure(
+            phase=MetricsPhase.READ,
+            files=1
+        ), StorageHelper.get_storage().open_file(file_path, mode='rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                file_hash.update(chunk)
+                ExecutionMetrics.count_bytes(len(chunk))
+
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def compute_file_hashes(
+        file_path: str,
+        chunk_size: int = Constants.HASH_CHUNK_SIZE,
+        rate_limiter: RateLimiter = None,
+        copy_file_path: str = None
+    ) -> dict[str, str]:
+        """Compute CRC32, MD5 and SHA1 of a file's content in one read (None if not found), reads
+        are limited by a rate limiter if specified, the content is also written in a copy of the
+        file with its metadata if specified"""
+        if not FileHelper.is_file_exists(
+            file_path=file_path
+        ):
+            return None
+
+        crc32 = 0
+        md5_hash = hashlib.md5()
+        sha1_hash = hashlib.sha1()
+
+        # Open the copy of the file if any
+        copy_context = contextlib.nullcontext()
+        if copy_file_path is not None:
+            StorageHelper.get_storage().create_folders(os.path.dirname(copy_file_path))
+            copy_context = StorageHelper.get_storage().open_file(copy_file_path, mode='wb')
+
+        # Read chunks in the same buffer
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        with ExecutionMetrics.measure(
+            phase=MetricsPhase.READ,
+            files=1
+        ), StorageHelper.get_storage().open_file(file_path, mode='rb') as file, \
+                copy_context as copy_file:
+            while True:
+                size = file.readinto(buffer)
+                if not size:
+                    break
+                crc32 = zlib.crc32(view[:size], crc32)
+                md5_hash.update(view[:size])
+                sha1_hash.update(view[:size])
+                if copy_file is not None:
+                    copy_file.write(view[:size])
+                ExecutionMetrics.count_bytes(size)
+                if rate_limiter is not None:
+                    rate_limiter.wait(size=size)
+        if copy_file_path is not None:
+            StorageHelper.get_storage().copy_stat(file_path, copy_file_path)
+            FileHelper.__invalidate(
+                path=copy_file_path
+            )
+
+        return {
+            'crc32': f'{crc32:08x}',
+            'md5': md5_hash.hexdigest(),
+            'sha1': sha1_hash.hexdigest()
+        }
+
+    @staticmethod
+    def compute_file_partial_hash(
+        file_path: str,
+        block_size: int = Constants.HASH_PARTIAL_BLOCK_SIZE
+    ) -> str:
+        """Compute the SHA1 of the first and the last blocks of a file (the whole content if
+        smaller than two blocks), None if not found"""
+        if not FileHelper.is_file_exists(
+            file_path=file_path
+        ):
+            return None
+
+        file_hash = hashlib.sha1()
+        with ExecutionMetrics.measure(
+            phase=MetricsPhase.READ,
+            files=1
+        ), StorageHelper.get_storage().open_file(file_path, mode='rb') as file:
+            size = file.seek(0, os.SEEK_END)
+            file.seek(0)
+            if size <= 2 * block_size:
+                chunks = [file.read()]
+            else:
+                chunks = [file.read(block_size)]
+                file.seek(size - block_size)
+                chunks.append(file.read(block_size))
+            for chunk in chunks:
+                file_hash.update(chunk)
+                ExecutionMetrics.count_bytes(len(chunk))
+
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def list_zip_members(
+        file_path: str
+    ) -> list[tuple[str, int, str]]:
+        """List members of a zip file (name, size and CRC32) from its central directory without
+        extracting (None if not found or not a zip file)"""
+        if not FileHelper.is_file_exists(
+            file_path=file_path
+        ):
+            return None
+
+        try:
+            with ExecutionMetrics.measure(
+                phase=MetricsPhase.READ,
+                files=1
+            ), StorageHelper.get_storage().open_file(
+                file_path,
+                mode='rb'
+            ) as file, zipfile.ZipFile(file) as zip_file:
+                return [
+                    (info.filename, info.file_size, f'{info.CRC:08x}')
+                    for info in zip_file.infolist()
+                    if not info.is_dir()
+                ]
+        except zipfile.BadZipFile:
+            return None
+
     @staticmethod
     def list_sub_directories(
         folder_path: str
@@ -90,9 +316,10 @@ class FileHelper:
         ):
             return []
 
-        return os.listdir(folder_path)
+        return FileHelper.__get_metadata().list_folder(folder_path)
 
     @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.READ)
     def list_relative_paths(
         folder_path: str,
         file_name: str,
@@ -100,9 +327,11 @@ class FileHelper:
     ) -> list[str]:
         """List recursively relative paths for the specified name"""
         result = []
-        if not os.path.isdir(folder_path):
+        if not FileHelper.is_folder_exists(
+            folder_path=folder_path
+        ):
             return []
-        for root, dirs, files in os.walk(folder_path):
+        for root, dirs, files in StorageHelper.get_storage().walk(folder_path):
             # If a folder exists with the name of the file, add sub files
             if file_name in dirs:
                 sub_folder_path = os.path.join(
@@ -142,17 +371,69 @@ class FileHelper:
 
         return result
 
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.READ)
+    def index_relative_paths(
+        folder_path: str
+    ) -> dict[str, list[str]]:
+        """Index recursively relative paths by the names finding them with list_relative_paths
+        (the folder is walked once for all names)"""
+        result: dict[str, list[str]] = {}
+        if not FileHelper.is_folder_exists(
+            folder_path=folder_path
+        ):
+            return result
+        for root, dirs, files in StorageHelper.get_storage().walk(folder_path):
+            # Sub files of a folder are found with the name of the folder
+            for dir_name in dirs:
+                sub_folder_path = os.path.join(root, dir_name)
+                for sub_root, _, sub_files in StorageHelper.get_storage().walk(sub_folder_path):
+                    for file_path in sub_files:
+                        result.setdefault(dir_name, []).append(
+                            os.path.relpath(os.path.join(sub_root, file_path), folder_path)
+                        )
+            # Files are found with their name, basename or any prefix before a dot
+            for file_path in files:
+                if file_path == 'Thumbs.db':
+                    continue
+                relative_path = os.path.relpath(os.path.join(root, file_path), folder_path)
+                names = {file_path, FileHelper.retrieve_file_basename(file_path)}
+                names.update(
+                    file_path[:index] for index, char in enumerate(file_path) if char == '.'
+                )
+                for name in names:
+                    result.setdefault(name, []).append(relative_path)
+
+        return result
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.READ)
+    def list_file_paths(
+        folder_path: str
+    ) -> list[str]:
+        """List recursively paths of all files in a folder (the folder is walked once)"""
+        result = []
+        if not FileHelper.is_folder_exists(
+            folder_path=folder_path
+        ):
+            return result
+        for root, _, files in StorageHelper.get_storage().walk(folder_path):
+            for file_path in files:
+                result.append(os.path.join(root, file_path))
+
+        return result
+
     @staticmethod
     def copy_file(
         source_file_path: str,
         destination_file_path: str
     ) -> bool:
         """Copy a file from source to destination"""
-        if os.path.exists(destination_file_path):
+        if FileHelper.__get_metadata().exists(destination_file_path):
             if FileHelper.compare_files(source_file_path, destination_file_path):
                 return False
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'copy_file_simulation',
@@ -171,8 +452,16 @@ class FileHelper:
         )
 
         try:
-            os.makedirs(os.path.dirname(destination_file_path), exist_ok=True)
-            shutil.copy2(source_file_path, destination_file_path)
+            StorageHelper.get_storage().create_folders(os.path.dirname(destination_file_path))
+            with FileHelper.__io_semaphore, ExecutionMetrics.measure(
+                phase=MetricsPhase.WRITE,
+                files=1,
+                bytes_count=FileHelper.__get_metadata().get_size(source_file_path)
+            ):
+                StorageHelper.get_storage().copy_file(source_file_path, destination_file_path)
+            FileHelper.__invalidate(
+                path=destination_file_path
+            )
         except Exception as exc:
             LoggingHelper.log_error(
                 message=Context.get_text(
@@ -186,6 +475,73 @@ class FileHelper:
 
         return True
 
+    @staticmethod
+    def link_file(
+        source_file_path: str,
+        destination_file_path: str
+    ) -> bool:
+        """Link a file to a source file with a hardlink (copied if the file system has no
+        hardlinks), a destination's file not linked to the source is replaced"""
+        if FileHelper.__get_metadata().exists(destination_file_path):
+            source_stat = StorageHelper.get_storage().get_stat(source_file_path)
+            destination_stat = StorageHelper.get_storage().get_stat(destination_file_path)
+            if (source_stat.st_dev, source_stat.st_ino) == \
+                    (destination_stat.st_dev, destination_stat.st_ino):
+                return False
+
+        if ExecutionContext.is_simulated_execution():
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'link_file_simulation',
+                    source_file=str(source_file_path),
+                    destination_file=str(destination_file_path)
+                )
+            )
+            return True
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'link_file_in_progress',
+                source_file=str(source_file_path),
+                destination_file=str(destination_file_path)
+            )
+        )
+
+        try:
+            StorageHelper.get_storage().create_folders(os.path.dirname(destination_file_path))
+            with FileHelper.__io_semaphore, ExecutionMetrics.measure(
+                phase=MetricsPhase.WRITE,
+                files=1
+            ):
+                if FileHelper.__get_metadata().exists(destination_file_path):
+                    StorageHelper.get_storage().delete_file(destination_file_path)
+                try:
+                    StorageHelper.get_storage().link_file(source_file_path, destination_file_path)
+                except OSError:
+                    # Copy if the file system has no hardlinks
+                    StorageHelper.get_storage().copy_file(
+                        source_file_path,
+                        destination_file_path
+                    )
+                    ExecutionMetrics.count_bytes(
+                        StorageHelper.get_storage().get_size(source_file_path)
+                    )
+            FileHelper.__invalidate(
+                path=destination_file_path
+            )
+        except Exception as exc:
+            LoggingHelper.log_error(
+                message=Context.get_text(
+                    'error_link_file',
+                    source_file=str(source_file_path),
+                    destination_file=str(destination_file_path)
+                ),
+                exc=exc
+            )
+            return False
+
+        return True
+
     @staticmethod
     def move_file(
         source_file_path: str,
@@ -193,7 +549,7 @@ class FileHelper:
     ) -> bool:
         """Move a file from source to destination"""
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'move_file_simulation',
@@ -212,7 +568,18 @@ class FileHelper:
         )
 
         try:
-            shutil.move(source_file_path, destination_file_path)
+            StorageHelper.get_storage().create_folders(os.path.dirname(destination_file_path))
+            with FileHelper.__io_semaphore, ExecutionMetrics.measure(
+                phase=MetricsPhase.WRITE,
+                files=1
+            ):
+                StorageHelper.get_storage().move(source_file_path, destination_file_path)
+            FileHelper.__invalidate(
+                path=source_file_path
+            )
+            FileHelper.__invalidate(
+                path=destination_file_path
+            )
         except Exception as exc:
             LoggingHelper.log_error(
                 message=Context.get_text(
@@ -233,7 +600,7 @@ class FileHelper:
     ) -> bool:
         """Copy a folder from source to destination"""
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'copy_folder_simulation',
@@ -252,9 +619,16 @@ class FileHelper:
         )
 
         try:
-            os.makedirs(os.path.dirname(
-                destination_folder_path), exist_ok=True)
-            shutil.copytree(source_folder_path, destination_folder_path)
+            StorageHelper.get_storage().create_folders(os.path.dirname(destination_folder_path))
+            with FileHelper.__io_semaphore, ExecutionMetrics.measure(
+                phase=MetricsPhase.WRITE,
+                files=1
+            ):
+                StorageHelper.get_storage().copy_folder(source_folder_path, destination_folder_path)
+            FileHelper.__invalidate(
+                path=destination_folder_path,
+                folder=True
+            )
         except Exception as exc:
             LoggingHelper.log_error(
                 message=Context.get_text(
@@ -275,7 +649,7 @@ class FileHelper:
     ) -> bool:
         """Move a folder from source to destination"""
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'move_folder_simulation',
@@ -294,7 +668,19 @@ class FileHelper:
         )
 
         try:
-            shutil.move(source_folder_path, destination_folder_path)
+            with FileHelper.__io_semaphore, ExecutionMetrics.measure(
+                phase=MetricsPhase.WRITE,
+                files=1
+            ):
+                StorageHelper.get_storage().move(source_folder_path, destination_folder_path)
+            FileHelper.__invalidate(
+                path=source_folder_path,
+                folder=True
+            )
+            FileHelper.__invalidate(
+                path=destination_folder_path,
+                folder=True
+            )
         except Exception as exc:
             LoggingHelper.log_error(
                 message=Context.get_text(
@@ -314,7 +700,7 @@ class FileHelper:
     ):
         """Create a folder"""
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'create_folder_simulation',
@@ -330,7 +716,11 @@ class FileHelper:
             )
         )
 
-        os.makedirs(folder_path, exist_ok=True)
+        StorageHelper.get_storage().create_folders(folder_path)
+        FileHelper.__invalidate(
+            path=folder_path,
+            folder=True
+        )
 
         return True
 
@@ -375,7 +765,7 @@ class FileHelper:
         ):
             return False
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'delete_file',
@@ -393,7 +783,14 @@ class FileHelper:
                 )
             )
 
-            os.remove(file_path)
+            with ExecutionMetrics.measure(
+                phase=MetricsPhase.WRITE,
+                files=1
+            ):
+                StorageHelper.get_storage().delete_file(file_path)
+            FileHelper.__invalidate(
+                path=file_path
+            )
             return True
 
         # Delete recursively files with the same basename
@@ -426,12 +823,18 @@ class FileHelper:
         ):
             return ''
 
-        with open(
+        with ExecutionMetrics.measure(
+            phase=MetricsPhase.READ,
+            files=1
+        ), StorageHelper.get_storage().open_file(
             file_path,
             mode='r',
             encoding=encoding
         ) as file:
-            return file.read()
+            content = file.read()
+        ExecutionMetrics.count_bytes(len(content))
+
+        return content
 
     @staticmethod
     def write_file(
@@ -441,7 +844,7 @@ class FileHelper:
     ):
         """Write content in a file"""
 
-        if Context.is_simulated():
+        if ExecutionContext.is_simulated_execution():
             LoggingHelper.log_info(
                 message=Context.get_text(
                     'write_file_simulation',
@@ -457,12 +860,19 @@ class FileHelper:
             )
         )
 
-        with open(
+        with FileHelper.__io_semaphore, ExecutionMetrics.measure(
+            phase=MetricsPhase.WRITE,
+            files=1,
+            bytes_count=len(content)
+        ), StorageHelper.get_storage().open_file(
             file_path,
             mode='w',
             newline='\n',
             encoding=encoding
         ) as file:
             file.write(content)
+        FileHelper.__invalidate(
+            path=file_path
+        )
 
         return True
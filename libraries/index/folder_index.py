@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+"""Folder Index"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+from libraries.storage.storage_helper import StorageHelper
+
+
+class FolderIndex:
+    """Index on disk of files of a folder by normalized basename, refreshed only for sub folders
+    modified since the last refresh (a folder's modification time changes when a file is added,
+    deleted or renamed in it)"""
+
+    __VERSION = 1
+
+    __KEY_VERSION = 'version'
+    __KEY_FOLDER = 'folder'
+    __KEY_FOLDERS = 'folders'
+    __KEY_MTIME = 'mtime'
+    __KEY_FILES = 'files'
+    __KEY_SUB_FOLDERS = 'sub_folders'
+
+    __SPACES = re.compile(r'[\s_]+')
+
+    # Lock by index file (an index may be used by several threads)
+    __locks: dict[str, threading.Lock] = {}
+    __locks_lock = threading.Lock()
+
+    def __init__(
+        self,
+        folder_path: str
+    ):
+        """Initialize index for a folder (loaded and refreshed when first used)"""
+
+        self.__folder_path = os.path.normpath(folder_path)
+        digest = hashlib.sha1(self.__folder_path.encode('utf-8')).hexdigest()
+        self.__file_path = os.path.join(
+            Context.get_indexes_path(),
+            f'{digest}.json'
+        )
+        self.__folders: dict[str, dict] = None
+        self.__files: dict[str, str] = None
+
+        with FolderIndex.__locks_lock:
+            self.__lock = FolderIndex.__locks.setdefault(self.__file_path, threading.Lock())
+
+    @staticmethod
+    def normalize_name(file_name: str) -> str:
+        """Normalize a file's name to find it (without extension, case and repeated spaces)"""
+
+        return FolderIndex.__SPACES.sub(
+            ' ',
+            os.path.splitext(os.path.basename(file_name))[0]
+        ).strip().casefold()
+
+    def find(self, file_name: str) -> str:
+        """Find a file by its name normalized (None if not found)"""
+
+        if self.__files is None:
+            self.refresh()
+
+        relative_path = self.__files.get(self.normalize_name(file_name), None)
+        if relative_path is None:
+            return None
+
+        return os.path.join(self.__folder_path, relative_path)
+
+    def list_files(self) -> dict[str, str]:
+        """List files by their name normalized"""
+
+        if self.__files is None:
+            self.refresh()
+
+        return {
+            name: os.path.join(self.__folder_path, relative_path)
+            for name, relative_path in self.__files.items()
+        }
+
+    def refresh(self):
+        """Refresh the index (only sub folders modified since the last refresh are scanned)"""
+
+        with self.__lock:
+            previous_folders = self.__folders if self.__folders is not None else self.__load()
+            self.__folders = {}
+            self.__scan_folder(
+                relative_path='',
+                previous_folders=previous_folders
+            )
+
+            # Nothing to do if no folder changed since loaded
+            if self.__files is not None and self.__folders == previous_folders:
+                return
+
+            # Index files by name (the first file in name's order is kept for a name)
+            self.__files = {}
+            for relative_folder in sorted(self.__folders):
+                for file_name in sorted(self.__folders[relative_folder][self.__KEY_FILES]):
+                    self.__files.setdefault(
+                        self.normalize_name(file_name),
+                        os.path.join(relative_folder, file_name)
+                    )
+
+            # Save the index if some folders changed
+            if self.__folders != previous_folders:
+                self.__save()
+
+    def __scan_folder(
+        self,
+        relative_path: str,
+        previous_folders: dict[str, dict]
+    ):
+        """Scan a folder and its sub folders (kept from the previous index if not modified)"""
+
+        folder_path = os.path.join(self.__folder_path, relative_path)
+        try:
+            mtime = StorageHelper.get_storage().get_mtime(folder_path)
+        except OSError:
+            return
+
+        # Keep the folder if not modified, else list its entries
+        folder = previous_folders.get(relative_path, None)
+        if folder is None or folder[self.__KEY_MTIME] != mtime:
+            files = []
+            sub_folders = []
+            for entry in StorageHelper.get_storage().scan_folder(folder_path):
+                if entry.is_dir():
+                    sub_folders.append(entry.name)
+                elif os.path.splitext(entry.name)[0] not in Constants.CACHE_FILES_NAMES:
+                    files.append(entry.name)
+            folder = {
+                self.__KEY_MTIME: mtime,
+                self.__KEY_FILES: sorted(files),
+                self.__KEY_SUB_FOLDERS: sorted(sub_folders)
+            }
+        self.__folders[relative_path] = folder
+
+        for sub_folder in folder[self.__KEY_SUB_FOLDERS]:
+            self.__scan_folder(
+                relative_path=os.path.join(relative_path, sub_folder),
+                previous_folders=previous_folders
+            )
+
+    def __load(self) -> dict[str, dict]:
+        """Load folders of the index saved on disk (empty if not saved or obsolete)"""
+
+        if not os.path.isfile(self.__file_path):
+            return {}
+
+        try:
+            with open(self.__file_path, mode='r', encoding='UTF-8') as file:
+                content = json.load(file)
+        except ValueError:
+            # Ignore an index partially written
+            return {}
+
+        if content.get(self.__KEY_VERSION, None) != self.__VERSION or \
+                content.get(self.__KEY_FOLDER, None) != self.__folder_path:
+            return {}
+
+        return content[self.__KEY_FOLDERS]
+
+    def __save(self):
+        """Save the index on disk (replaced at once)"""
+
+        os.makedirs(os.path.dirname(self.__file_path), exist_ok=True)
+        temporary_file_path = f'{self.__file_path}.tmp'
+        with open(temporary_file_path, mode='w', encoding='UTF-8') as file:
+            json.dump(
+                {
+                    self.__KEY_VERSION: self.__VERSION,
+                    self.__KEY_FOLDER: self.__folder_path,
+                    self.__KEY_FOLDERS: self.__folders
+                },
+                file
+            )
+        os.replace(temporary_file_path, self.__file_path)
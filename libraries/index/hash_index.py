@@ -0,0 +1,360 @@
+#!/usr/bin/python3
+"""Hash Index"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+import threading
+
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.metrics.execution_metrics import ExecutionMetrics
+from libraries.storage.storage_helper import StorageHelper
+
+
+class HashIndex:
+    """Index on disk of hashes (CRC32, MD5 and SHA1) of files in a folder and of members of zip
+    files, a file is indexed again only if its size, its modification time or its inode
+    changed (changes are appended to a log until the index is saved)"""
+
+    KEY_CRC32 = 'crc32'
+    KEY_MD5 = 'md5'
+    KEY_SHA1 = 'sha1'
+    KEY_NAME = 'name'
+    KEY_SIZE = 'size'
+
+    __VERSION = 1
+
+    __KEY_VERSION = 'version'
+    __KEY_FOLDER = 'folder'
+    __KEY_FILES = 'files'
+    __KEY_SIZE = 'size'
+    __KEY_MTIME_NS = 'mtime_ns'
+    __KEY_INODE = 'inode'
+    __KEY_HASHES = 'hashes'
+    __KEY_MEMBERS = 'members'
+    __KEY_PARTIAL_HASH = 'partial_hash'
+
+    # Index by index file (an index may be used by several threads and executors)
+    __instances: dict[str, 'HashIndex'] = {}
+    __instances_lock = threading.Lock()
+
+    @staticmethod
+    def get_index(folder_path: str) -> 'HashIndex':
+        """Get the index of a folder (shared so that entries added by an executor aren't
+        overwritten when another one saves)"""
+
+        file_path = HashIndex.__build_file_path(os.path.normpath(folder_path))
+        with HashIndex.__instances_lock:
+            if file_path not in HashIndex.__instances:
+                HashIndex.__instances[file_path] = HashIndex(
+                    folder_path=folder_path
+                )
+
+            return HashIndex.__instances[file_path]
+
+    @staticmethod
+    def __build_file_path(folder_path: str) -> str:
+        """Build the path of the index file of a folder"""
+
+        digest = hashlib.sha1(folder_path.encode('utf-8')).hexdigest()
+
+        return os.path.join(
+            Context.get_indexes_path(),
+            f'{digest}_hashes.json'
+        )
+
+    def __init__(
+        self,
+        folder_path: str
+    ):
+        """Initialize index for a folder (loaded when first used, use get_index to share it)"""
+
+        self.__folder_path = os.path.normpath(folder_path)
+        self.__file_path = self.__build_file_path(self.__folder_path)
+        self.__log_file_path = f'{self.__file_path}.log'
+        self.__files: dict[str, dict] = None
+        self.__changed_keys: set[str] = set()
+        self.__logged = False
+        self.__lock = threading.Lock()
+
+    def get_folder_path(self) -> str:
+        """Get the folder indexed"""
+
+        return self.__folder_path
+
+    def __build_key(self, file_path: str) -> str:
+        """Build the key of a file in the index (its path relative to the folder)"""
+
+        relative_path = os.path.relpath(os.path.normpath(file_path), self.__folder_path)
+        if relative_path.startswith(os.pardir):
+            raise Exception(f'{file_path} is not in {self.__folder_path}!')
+
+        return relative_path
+
+    @staticmethod
+    def __build_signature(stat: os.stat_result) -> dict:
+        """Build the signature of a file (a file changed if its signature changed)"""
+
+        return {
+            HashIndex.__KEY_SIZE: stat.st_size,
+            HashIndex.__KEY_MTIME_NS: stat.st_mtime_ns,
+            HashIndex.__KEY_INODE: stat.st_ino
+        }
+
+    @staticmethod
+    def __is_entry_valid(entry: dict, signature: dict) -> bool:
+        """Specify if an entry exists for the signature of a file"""
+
+        return entry is not None and all(
+            entry[name] == signature_value for name, signature_value in signature.items()
+        )
+
+    def __get_files(self) -> dict[str, dict]:
+        """Get files of the index (loaded if not loaded yet)"""
+
+        if self.__files is None:
+            self.__files = self.__load()
+
+        return self.__files
+
+    def __find_entry(self, file_path: str) -> tuple[dict, dict]:
+        """Find the signature of a file and its entry if not changed since indexed (signature is
+        None if the file is not found, entry is None if not indexed)"""
+
+        try:
+            signature = self.__build_signature(
+                StorageHelper.get_storage().get_stat(file_path)
+            )
+        except OSError:
+            return None, None
+
+        with self.__lock:
+            entry = self.__get_files().get(self.__build_key(file_path), None)
+        if not self.__is_entry_valid(entry=entry, signature=signature):
+            return signature, None
+
+        return signature, entry
+
+    def __update_entry(self, file_path: str, signature: dict, field: str, value):
+        """Update a field of a file's entry (reset if the file changed), changes are appended
+        periodically to the log to keep them if interrupted"""
+
+        with self.__lock:
+            key = self.__build_key(file_path)
+            entry = self.__get_files().get(key, None)
+            if not self.__is_entry_valid(entry=entry, signature=signature):
+                entry = dict(signature)
+                self.__get_files()[key] = entry
+            entry[field] = value
+            self.__changed_keys.add(key)
+            if len(self.__changed_keys) >= Constants.HASH_INDEX_SAVE_INTERVAL:
+                self.__append_log()
+
+    def find(self, file_path: str) -> dict[str, str]:
+        """Find the hashes of a file if not changed since hashed (None if not hashed)"""
+
+        _, entry = self.__find_entry(file_path)
+        if entry is None or self.__KEY_HASHES not in entry:
+            return None
+
+        return dict(entry[self.__KEY_HASHES])
+
+    def hash_file(self, file_path: str, copy_file_path: str = None) -> dict[str, str]:
+        """Hash a file if changed since hashed, return its hashes (None if not found), the file
+        is copied while hashed if a copy is specified (not copied if not changed)"""
+
+        signature, entry = self.__find_entry(file_path)
+        if signature is None:
+            return None
+        if entry is not None and self.__KEY_HASHES in entry:
+            return dict(entry[self.__KEY_HASHES])
+
+        result = FileHelper.compute_file_hashes(
+            file_path=file_path,
+            copy_file_path=copy_file_path
+        )
+        if result is None:
+            return None
+        self.__update_entry(
+            file_path=file_path,
+            signature=signature,
+            field=self.__KEY_HASHES,
+            value=result
+        )
+
+        return dict(result)
+
+    def partial_hash_file(self, file_path: str) -> str:
+        """Hash the first and the last blocks of a file if changed since hashed, return the hash
+        (None if not found)"""
+
+        signature, entry = self.__find_entry(file_path)
+        if signature is None:
+            return None
+        if entry is not None and self.__KEY_PARTIAL_HASH in entry:
+            return entry[self.__KEY_PARTIAL_HASH]
+
+        result = FileHelper.compute_file_partial_hash(
+            file_path=file_path
+        )
+        if result is None:
+            return None
+        self.__update_entry(
+            file_path=file_path,
+            signature=signature,
+            field=self.__KEY_PARTIAL_HASH,
+            value=result
+        )
+
+        return result
+
+    def list_zip_members(self, file_path: str) -> list[dict]:
+        """List members of a zip file (name, size and CRC32 read from its central directory
+        without extracting) if changed since listed (None if not found or not a zip file)"""
+
+        signature, entry = self.__find_entry(file_path)
+        if signature is None:
+            return None
+        if entry is not None and self.__KEY_MEMBERS in entry:
+            return [dict(member) for member in entry[self.__KEY_MEMBERS]]
+
+        members = FileHelper.list_zip_members(
+            file_path=file_path
+        )
+        if members is None:
+            return None
+        result = [
+            {
+                self.KEY_NAME: name,
+                self.KEY_SIZE: size,
+                self.KEY_CRC32: crc32
+            }
+            for name, size, crc32 in members
+        ]
+        self.__update_entry(
+            file_path=file_path,
+            signature=signature,
+            field=self.__KEY_MEMBERS,
+            value=result
+        )
+
+        return [dict(member) for member in result]
+
+    def __map_files(self, function, file_paths: list[str]) -> dict:
+        """Apply a function to files in parallel and save the index, return results by file
+        (None results are ignored)"""
+
+        # Initialize result
+        result = {}
+
+        # Bind threads to the metrics of the current execution
+        metrics = ExecutionMetrics.get_current()
+        with ThreadPoolExecutor(
+            max_workers=Constants.HASH_MAX_CONCURRENCY,
+            initializer=metrics.bind if metrics is not None else None
+        ) as pool:
+            for file_path, value in zip(file_paths, pool.map(function, file_paths)):
+                if value is not None:
+                    result[file_path] = value
+        self.save()
+
+        return result
+
+    def hash_files(self, file_paths: list[str]) -> dict[str, dict[str, str]]:
+        """Hash files in parallel (only files changed since hashed), return hashes by file (files
+        not found are ignored)"""
+
+        return self.__map_files(
+            function=self.hash_file,
+            file_paths=file_paths
+        )
+
+    def partial_hash_files(self, file_paths: list[str]) -> dict[str, str]:
+        """Hash the first and the last blocks of files in parallel (only files changed since
+        hashed), return hashes by file (files not found are ignored)"""
+
+        return self.__map_files(
+            function=self.partial_hash_file,
+            file_paths=file_paths
+        )
+
+    def list_zip_members_many(self, file_paths: list[str]) -> dict[str, list[dict]]:
+        """List members of zip files in parallel (only files changed since listed), return
+        members by file (files not found or not zip files are ignored)"""
+
+        return self.__map_files(
+            function=self.list_zip_members,
+            file_paths=file_paths
+        )
+
+    def save(self):
+        """Save the index on disk if changed (the log is merged in it)"""
+
+        with self.__lock:
+            if len(self.__changed_keys) > 0 or self.__logged:
+                self.__save()
+
+    def __load(self) -> dict[str, dict]:
+        """Load files of the index saved on disk with changes of its log (empty if not saved or
+        obsolete)"""
+
+        # Initialize result
+        result: dict[str, dict] = {}
+
+        if os.path.isfile(self.__file_path):
+            try:
+                with open(self.__file_path, mode='r', encoding='UTF-8') as file:
+                    content = json.load(file)
+            except ValueError:
+                # Ignore an index partially written
+                content = {}
+            if content.get(self.__KEY_VERSION, None) == self.__VERSION and \
+                    content.get(self.__KEY_FOLDER, None) == self.__folder_path:
+                result = content[self.__KEY_FILES]
+
+        # Replay changes appended to the log since the index was saved
+        if os.path.isfile(self.__log_file_path):
+            self.__logged = True
+            with open(self.__log_file_path, mode='r', encoding='UTF-8') as file:
+                for line in file:
+                    try:
+                        result.update(json.loads(line))
+                    except ValueError:
+                        # Ignore a line partially written
+                        continue
+
+        return result
+
+    def __append_log(self):
+        """Append changed entries to the log of the index (written once per batch of changes)"""
+
+        os.makedirs(os.path.dirname(self.__log_file_path), exist_ok=True)
+        with open(self.__log_file_path, mode='a', encoding='UTF-8') as file:
+            file.write(json.dumps({
+                key: self.__files[key] for key in self.__changed_keys
+            }) + '\n')
+        self.__changed_keys.clear()
+        self.__logged = True
+
+    def __save(self):
+        """Save the index on disk (replaced at once) and remove its log"""
+
+        os.makedirs(os.path.dirname(self.__file_path), exist_ok=True)
+        temporary_file_path = f'{self.__file_path}.tmp'
+        with open(temporary_file_path, mode='w', encoding='UTF-8') as file:
+            json.dump(
+                {
+                    self.__KEY_VERSION: self.__VERSION,
+                    self.__KEY_FOLDER: self.__folder_path,
+                    self.__KEY_FILES: self.__files
+                },
+                file
+            )
+        os.replace(temporary_file_path, self.__file_path)
+        if self.__logged:
+            os.remove(self.__log_file_path)
+        self.__changed_keys.clear()
+        self.__logged = False
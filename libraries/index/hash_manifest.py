@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+"""Hash Manifest"""
+
+import json
+import os
+import threading
+
+from libraries.context.execution_context import ExecutionContext
+from libraries.storage.storage_helper import StorageHelper
+
+
+class HashManifest:
+    """Manifest of the sizes and hashes (SHA1) of games' files in a platform's folder of the games
+    store, written in the folder so it moves with the store (paths are relative to the folder
+    with '/' as separator)"""
+
+    FILE_NAME = 'manifest.json'
+
+    KEY_SIZE = 'size'
+    KEY_SHA1 = 'sha1'
+
+    SEPARATOR = '/'
+
+    __VERSION = 1
+
+    __KEY_VERSION = 'version'
+    __KEY_FILES = 'files'
+
+    def __init__(
+        self,
+        folder_path: str
+    ):
+        """Initialize manifest for a platform's folder (loaded when first used)"""
+
+        self.__folder_path = os.path.normpath(folder_path)
+        self.__file_path = os.path.join(
+            self.__folder_path,
+            self.FILE_NAME
+        )
+        self.__files: dict[str, dict] = None
+        self.__changed = False
+        self.__lock = threading.Lock()
+
+    def build_key(self, file_path: str) -> str:
+        """Build the key of a file in the manifest (its path relative to the folder)"""
+
+        relative_path = os.path.relpath(os.path.normpath(file_path), self.__folder_path)
+        if relative_path.startswith(os.pardir):
+            raise Exception(f'{file_path} is not in {self.__folder_path}!')
+
+        return relative_path.replace(os.sep, self.SEPARATOR)
+
+    def build_file_path(self, key: str) -> str:
+        """Build the path of a file from its key in the manifest"""
+
+        return os.path.join(
+            self.__folder_path,
+            *key.split(self.SEPARATOR)
+        )
+
+    def __get_files(self) -> dict[str, dict]:
+        """Get files of the manifest (loaded if not loaded yet)"""
+
+        if self.__files is None:
+            self.__files = self.__load()
+
+        return self.__files
+
+    def list_games(self) -> set[str]:
+        """List ids of games in the manifest"""
+
+        with self.__lock:
+            return {
+                key.split(self.SEPARATOR, 1)[0] for key in self.__get_files()
+            }
+
+    def list_game_files(self, game_id: str) -> dict[str, dict]:
+        """List files of a game in the manifest with their size and hash (by key)"""
+
+        prefix = f'{game_id}{self.SEPARATOR}'
+        with self.__lock:
+            return {
+                key: dict(entry) for key, entry in self.__get_files().items()
+                if key.startswith(prefix)
+            }
+
+    def set_game_files(self, game_id: str, files: dict[str, dict]):
+        """Set files of a game with their size and hash (by key), replacing its previous files"""
+
+        prefix = f'{game_id}{self.SEPARATOR}'
+        with self.__lock:
+            for key in [key for key in self.__get_files() if key.startswith(prefix)]:
+                del self.__files[key]
+            self.__files.update(files)
+            self.__changed = True
+
+    def save(self):
+        """Save the manifest in the folder if changed (replaced at once through the storage)"""
+
+        with self.__lock:
+            if not self.__changed or ExecutionContext.is_simulated_execution():
+                return
+
+            storage = StorageHelper.get_storage()
+            temporary_file_path = f'{self.__file_path}.tmp'
+            with storage.open_file(temporary_file_path, mode='w', encoding='UTF-8') as file:
+                json.dump(
+                    {
+                        self.__KEY_VERSION: self.__VERSION,
+                        self.__KEY_FILES: dict(sorted(self.__files.items()))
+                    },
+                    file,
+                    indent=1
+                )
+            storage.move(temporary_file_path, self.__file_path)
+            self.__changed = False
+
+    def __load(self) -> dict[str, dict]:
+        """Load files of the manifest written in the folder through the storage (empty if not
+        written or obsolete)"""
+
+        storage = StorageHelper.get_storage()
+        if not storage.is_file(self.__file_path):
+            return {}
+
+        try:
+            with storage.open_file(self.__file_path, mode='r', encoding='UTF-8') as file:
+                content = json.load(file)
+        except ValueError:
+            # Ignore a manifest partially written
+            return {}
+
+        if content.get(self.__KEY_VERSION, None) != self.__VERSION:
+            return {}
+
+        return content[self.__KEY_FILES]
@@ -1,123 +1,176 @@
 #!/usr/bin/python3
 """Logging Helper"""
 
+import atexit
 import logging
 import os
-import tkinter as tk
+import queue
+import threading
 
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from datetime import datetime
 
 from libraries.context.context import Context
+from libraries.event.event_bus import EventBus, EventType
 
 
 class LoggingHelper:
-    """Class to help usage of logging"""
+    """Class to help usage of logging (files are written by a background thread)"""
 
     __error_logger: logging.Logger = None
     __warning_logger: logging.Logger = None
     __info_logger: logging.Logger = None
-    __log_ui: tk.Text = None
+    __listener: QueueListener = None
+    __init_lock = threading.Lock()
 
-    @staticmethod
-    def __init_info_logger():
-        """Initialize __info_logger"""
+    # Event bus bound to the current thread to post log of an execution
+    __current = threading.local()
 
-        # Create the logs directory if it doesn't exist
-        if not os.path.exists(Context.get_logs_path()):
-            os.makedirs(Context.get_logs_path())
+    @staticmethod
+    def __create_file_handler(
+        logger_name: str,
+        level: int,
+        level_name: str
+    ) -> TimedRotatingFileHandler:
+        """Create a file handler for a logger with format like 2024-09-28_info.log"""
 
         # Get the current date to use in log file names
         current_date = datetime.now().strftime("%Y-%m-%d")
 
-        # Setup the logger for INFO level with format like 2024-09-28_info.log
-        LoggingHelper.__info_logger = logging.getLogger('info_logger')
-        LoggingHelper.__info_logger.setLevel(logging.INFO)
-        info_handler = TimedRotatingFileHandler(
-            f'{Context.get_logs_path()}/{current_date}_info.log',
+        handler = TimedRotatingFileHandler(
+            f'{Context.get_logs_path()}/{current_date}_{level_name}.log',
             when='midnight',
             interval=1,
             backupCount=30
         )
-        info_handler.suffix = "%Y-%m-%d"  # Suffix for rotating logs with the date
-        info_handler.setLevel(logging.INFO)
-        info_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s')
-        info_handler.setFormatter(info_formatter)
-        LoggingHelper.__info_logger.addHandler(info_handler)
+        handler.suffix = "%Y-%m-%d"  # Suffix for rotating logs with the date
+        handler.setLevel(level)
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s'))
+
+        # Only write records of the logger
+        handler.addFilter(logging.Filter(logger_name))
+
+        return handler
 
     @staticmethod
-    def __init_warning_logger():
-        """Initialize __warning_logger"""
+    def __create_logger(logger_name: str, level: int, log_queue: queue.Queue) -> logging.Logger:
+        """Create a logger putting its records in the queue"""
 
-        # Create the logs directory if it doesn't exist
-        if not os.path.exists(Context.get_logs_path()):
-            os.makedirs(Context.get_logs_path())
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(level)
+        logger.addHandler(QueueHandler(log_queue))
 
-        # Get the current date to use in log file names
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        return logger
 
-        # Setup the logger for WARNING level with format like 2024-09-28_warning.log
-        LoggingHelper.__warning_logger = logging.getLogger('warning_logger')
-        LoggingHelper.__warning_logger.setLevel(logging.WARNING)
-        warning_handler = TimedRotatingFileHandler(
-            f'{Context.get_logs_path()}/{current_date}_warning.log',
-            when='midnight',
-            interval=1,
-            backupCount=30
-        )
-        warning_handler.suffix = "%Y-%m-%d"  # Suffix for rotating logs with the date
-        warning_handler.setLevel(logging.WARNING)
-        warning_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s')
-        warning_handler.setFormatter(warning_formatter)
-        LoggingHelper.__warning_logger.addHandler(warning_handler)
+    @staticmethod
+    def __init_loggers():
+        """Initialize loggers with a listener writing files in background"""
+
+        with LoggingHelper.__init_lock:
+            # Already initialized by another thread
+            if LoggingHelper.__info_logger is not None:
+                return
+
+            # Create the logs directory if it doesn't exist
+            if not os.path.exists(Context.get_logs_path()):
+                os.makedirs(Context.get_logs_path())
+
+            # Setup the listener writing records in files for INFO, WARNING and ERROR levels
+            log_queue = queue.SimpleQueue()
+            LoggingHelper.__listener = QueueListener(
+                log_queue,
+                LoggingHelper.__create_file_handler(
+                    logger_name='info_logger',
+                    level=logging.INFO,
+                    level_name='info'
+                ),
+                LoggingHelper.__create_file_handler(
+                    logger_name='warning_logger',
+                    level=logging.WARNING,
+                    level_name='warning'
+                ),
+                LoggingHelper.__create_file_handler(
+                    logger_name='error_logger',
+                    level=logging.ERROR,
+                    level_name='error'
+                ),
+                respect_handler_level=True
+            )
+            LoggingHelper.__listener.start()
+
+            # Flush pending records when exiting
+            atexit.register(LoggingHelper.shutdown)
+
+            # Setup the loggers
+            LoggingHelper.__warning_logger = LoggingHelper.__create_logger(
+                logger_name='warning_logger',
+                level=logging.WARNING,
+                log_queue=log_queue
+            )
+            LoggingHelper.__error_logger = LoggingHelper.__create_logger(
+                logger_name='error_logger',
+                level=logging.ERROR,
+                log_queue=log_queue
+            )
+
+            # Info logger set last as it marks loggers as initialized
+            LoggingHelper.__info_logger = LoggingHelper.__create_logger(
+                logger_name='info_logger',
+                level=logging.INFO,
+                log_queue=log_queue
+            )
 
     @staticmethod
-    def __init_error_logger():
-        """Initialize __error_logger"""
+    def shutdown():
+        """Write pending records and stop the background writer"""
 
-        # Create the logs directory if it doesn't exist
-        if not os.path.exists(Context.get_logs_path()):
-            os.makedirs(Context.get_logs_path())
+        if LoggingHelper.__listener is not None:
+            LoggingHelper.__listener.stop()
+            LoggingHelper.__listener = None
 
-        # Get the current date to use in log file names
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @staticmethod
+    def bind_event_bus(event_bus: EventBus):
+        """Bind an event bus to the current thread to post log to show (log of other executions
+        isn't posted to it)"""
 
-        # Setup the logger for ERROR level with format like 2024-09-28_error.log
-        LoggingHelper.__error_logger = logging.getLogger('error_logger')
-        LoggingHelper.__error_logger.setLevel(logging.ERROR)
-        error_handler = TimedRotatingFileHandler(
-            f'{Context.get_logs_path()}/{current_date}_error.log',
-            when='midnight',
-            interval=1,
-            backupCount=30
-        )
-        error_handler.suffix = "%Y-%m-%d"  # Suffix for rotating logs with the date
-        error_handler.setLevel(logging.ERROR)
-        error_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s')
-        error_handler.setFormatter(error_formatter)
-        LoggingHelper.__error_logger.addHandler(error_handler)
+        LoggingHelper.__current.event_bus = event_bus
+
+    @staticmethod
+    def unbind_event_bus():
+        """Unbind the event bus from the current thread"""
+
+        LoggingHelper.__current.event_bus = None
+
+    @staticmethod
+    def get_event_bus() -> EventBus:
+        """Get the event bus bound to the current thread (None if not bound)"""
+
+        return getattr(LoggingHelper.__current, 'event_bus', None)
 
     @staticmethod
-    def set_log_ui(log_ui: tk.Text):
-        """Set a UI tk.Text to show log"""
+    def __post_log_event(level: int, message: str):
+        """Post a log event if an event bus is bound and the level is shown in UI"""
 
-        LoggingHelper.__log_ui = log_ui
+        event_bus = LoggingHelper.get_event_bus()
+        if event_bus is not None and level >= Context.get_ui_log_level():
+            event_bus.post(
+                EventType.LOG,
+                level=level,
+                message=message
+            )
 
     @staticmethod
     def log_info(message):
         """Log an informational message"""
 
         if LoggingHelper.__info_logger is None:
-            LoggingHelper.__init_info_logger()
+            LoggingHelper.__init_loggers()
 
-        if LoggingHelper.__log_ui is not None:
-            LoggingHelper.__log_ui.config(state=tk.NORMAL)
-            LoggingHelper.__log_ui.insert(tk.END, f'\n{message}\n')
-            LoggingHelper.__log_ui.config(state=tk.DISABLED)
-            LoggingHelper.__log_ui.see('end')
+        LoggingHelper.__post_log_event(
+            level=logging.INFO,
+            message=message
+        )
 
         LoggingHelper.__info_logger.info(message)
 
@@ -125,14 +178,13 @@ class LoggingHelper:
     def log_warning(message):
         """Log a warning message"""
 
-        if LoggingHelper.__warning_logger is None:
-            LoggingHelper.__init_warning_logger()
+        if LoggingHelper.__info_logger is None:
+            LoggingHelper.__init_loggers()
 
-        if LoggingHelper.__log_ui is not None:
-            LoggingHelper.__log_ui.config(state=tk.NORMAL)
-            LoggingHelper.__log_ui.insert(tk.END, f'\n{message}\n')
-            LoggingHelper.__log_ui.config(state=tk.DISABLED)
-            LoggingHelper.__log_ui.see('end')
+        LoggingHelper.__post_log_event(
+            level=logging.WARNING,
+            message=message
+        )
 
         LoggingHelper.__warning_logger.warning(message)
 
@@ -140,13 +192,12 @@ class LoggingHelper:
     def log_error(message, exc):
         """Log an error with its stack trace"""
 
-        if LoggingHelper.__error_logger is None:
-            LoggingHelper.__init_error_logger()
+        if LoggingHelper.__info_logger is None:
+            LoggingHelper.__init_loggers()
 
-        if LoggingHelper.__log_ui is not None:
-            LoggingHelper.__log_ui.config(state=tk.NORMAL)
-            LoggingHelper.__log_ui.insert(tk.END, f'\n{message}\n')
-            LoggingHelper.__log_ui.config(state=tk.DISABLED)
-            LoggingHelper.__log_ui.see('end')
+        LoggingHelper.__post_log_event(
+            level=logging.ERROR,
+            message=message
+        )
 
         LoggingHelper.__error_logger.error(message, exc_info=exc)
@@ -0,0 +1,210 @@
+#!/usr/bin/python3
+"""Execution Metrics"""
+
+import collections
+from contextlib import contextmanager
+import functools
+import inspect
+import threading
+import time
+
+from libraries.constants.constants import Constants, MetricsPhase
+
+# pylint: disable=too-many-instance-attributes
+
+
+class ExecutionMetrics:
+    """Counters of an execution (items, files, bytes and time by phase) with throughputs and ETA
+    computed from a moving window (shared by executors of platforms executed in parallel)"""
+
+    KEY_ITEMS = 'items'
+    KEY_TOTAL_ITEMS = 'total_items'
+    KEY_FILES = 'files'
+    KEY_BYTES = 'bytes'
+    KEY_ITEMS_PER_SECOND = 'items_per_second'
+    KEY_FILES_PER_SECOND = 'files_per_second'
+    KEY_BYTES_PER_SECOND = 'bytes_per_second'
+    KEY_ETA = 'eta'
+    KEY_ELAPSED = 'elapsed'
+    KEY_PHASES = 'phases'
+
+    # Metrics bound to the current thread for an execution (and phase measured)
+    __current = threading.local()
+
+    def __init__(
+        self,
+        total_items: int
+    ):
+        """Initialize metrics for a number of items"""
+
+        self.__lock = threading.Lock()
+        self.__total_items = total_items
+        self.__items = 0
+        self.__skipped_items = 0
+        self.__files = 0
+        self.__bytes = 0
+        self.__phases_seconds: dict[MetricsPhase, float] = {
+            phase: 0.0 for phase in MetricsPhase
+        }
+        self.__start_time = time.monotonic()
+
+        # Samples of counters (time, items executed, files, bytes) in the moving window (from the
+        # start)
+        self.__samples = collections.deque([(self.__start_time, 0, 0, 0)])
+
+    def start(self):
+        """Start the time of the execution and the moving window (not the time waited since
+        the metrics were created)"""
+
+        with self.__lock:
+            self.__start_time = time.monotonic()
+            self.__samples = collections.deque([(
+                self.__start_time,
+                self.__items - self.__skipped_items,
+                self.__files,
+                self.__bytes
+            )])
+
+    def bind(self):
+        """Bind the metrics to the current thread (counters of FileHelper and XmlHelper)"""
+
+        ExecutionMetrics.__current.value = self
+        ExecutionMetrics.__current.phase = None
+
+    @staticmethod
+    def unbind():
+        """Unbind the metrics from the current thread"""
+
+        ExecutionMetrics.__current.value = None
+
+    @staticmethod
+    def get_current() -> 'ExecutionMetrics':
+        """Get the metrics bound to the current thread (None if not bound)"""
+
+        return getattr(ExecutionMetrics.__current, 'value', None)
+
+    @staticmethod
+    @contextmanager
+    def measure(phase: MetricsPhase, files: int = 0, bytes_count: int = 0):
+        """Measure the time of a phase and count its files and bytes for the current execution
+        (nested measures are part of the first one)"""
+
+        metrics = ExecutionMetrics.get_current()
+        if metrics is None or getattr(ExecutionMetrics.__current, 'phase', None) is not None:
+            yield
+            return
+
+        ExecutionMetrics.__current.phase = phase
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ExecutionMetrics.__current.phase = None
+            metrics.add(
+                phase=phase,
+                seconds=time.perf_counter() - start,
+                files=files,
+                bytes_count=bytes_count
+            )
+
+    @staticmethod
+    def measured(phase: MetricsPhase):
+        """Decorate a function to measure the time of a phase (each step of a generator)"""
+
+        def decorator(function):
+            if inspect.isgeneratorfunction(function):
+                @functools.wraps(function)
+                def generator_wrapper(*args, **kwargs):
+                    iterator = function(*args, **kwargs)
+                    while True:
+                        with ExecutionMetrics.measure(phase=phase):
+                            try:
+                                item = next(iterator)
+                            except StopIteration:
+                                return
+                        yield item
+
+                return generator_wrapper
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with ExecutionMetrics.measure(phase=phase):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def count_bytes(bytes_count: int):
+        """Count bytes known after an operation for the current execution"""
+
+        metrics = ExecutionMetrics.get_current()
+        if metrics is not None:
+            metrics.add(
+                bytes_count=bytes_count
+            )
+
+    def add(
+        self,
+        phase: MetricsPhase = None,
+        seconds: float = 0.0,
+        files: int = 0,
+        bytes_count: int = 0
+    ):
+        """Add time to a phase, files and bytes"""
+
+        with self.__lock:
+            if phase is not None:
+                self.__phases_seconds[phase] += seconds
+            self.__files += files
+            self.__bytes += bytes_count
+
+    def add_item(self, skipped: bool = False):
+        """Count an item executed (or skipped as completed by a previous execution, not part of
+        throughputs and ETA)"""
+
+        with self.__lock:
+            self.__items += 1
+            if skipped:
+                self.__skipped_items += 1
+
+    def snapshot(self) -> dict:
+        """Take a snapshot of counters with throughputs and ETA (None if unknown)"""
+
+        now = time.monotonic()
+        with self.__lock:
+            # Keep samples of the moving window (and the last one before as the reference)
+            executed_items = self.__items - self.__skipped_items
+            self.__samples.append((now, executed_items, self.__files, self.__bytes))
+            while len(self.__samples) > 2 and \
+                    now - self.__samples[1][0] >= Constants.METRICS_WINDOW_SECONDS:
+                self.__samples.popleft()
+            reference = self.__samples[0]
+
+            result = {
+                self.KEY_ITEMS: self.__items,
+                self.KEY_TOTAL_ITEMS: self.__total_items,
+                self.KEY_FILES: self.__files,
+                self.KEY_BYTES: self.__bytes,
+                self.KEY_ELAPSED: now - self.__start_time,
+                self.KEY_PHASES: dict(self.__phases_seconds)
+            }
+
+        # Compute throughputs in the window
+        duration = now - reference[0]
+        result[self.KEY_ITEMS_PER_SECOND] = (executed_items - reference[1]) / duration \
+            if duration > 0 else None
+        result[self.KEY_FILES_PER_SECOND] = (result[self.KEY_FILES] - reference[2]) / duration \
+            if duration > 0 else None
+        result[self.KEY_BYTES_PER_SECOND] = (result[self.KEY_BYTES] - reference[3]) / duration \
+            if duration > 0 else None
+
+        # Compute ETA from the throughput of items
+        result[self.KEY_ETA] = None
+        if result[self.KEY_ITEMS_PER_SECOND]:
+            result[self.KEY_ETA] = (
+                result[self.KEY_TOTAL_ITEMS] - result[self.KEY_ITEMS]
+            ) / result[self.KEY_ITEMS_PER_SECOND]
+
+        return result
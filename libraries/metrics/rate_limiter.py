@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""Rate Limiter"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Limiter of a rate in bytes per second shared by threads (a thread waits after reading
+    until its bytes fit in the rate)"""
+
+    def __init__(
+        self,
+        bytes_per_second: int
+    ):
+        """Initialize limiter (no limit if 0)"""
+
+        self.__bytes_per_second = bytes_per_second
+        self.__lock = threading.Lock()
+        self.__next_time = time.monotonic()
+
+    def wait(self, size: int):
+        """Wait until a size in bytes fits in the rate"""
+
+        if self.__bytes_per_second <= 0 or not size:
+            return
+
+        # Reserve the duration of the size after the durations already reserved
+        with self.__lock:
+            now = time.monotonic()
+            self.__next_time = max(self.__next_time, now) + size / self.__bytes_per_second
+            delay = self.__next_time - now
+
+        time.sleep(delay)
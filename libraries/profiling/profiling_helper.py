@@ -0,0 +1,223 @@
+#!/usr/bin/python3
+"""Profiling Helper"""
+
+import cProfile
+from datetime import datetime
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+from libraries.constants.constants import Profiling
+from libraries.context.context import Context
+from libraries.metrics.execution_metrics import ExecutionMetrics
+
+# pylint: disable=protected-access
+
+
+class ProfilingHelper:
+    """Class to help profiling of executions (public entry points of classes are wrapped with
+    timers and counters while profiling, so there is no overhead otherwise, only calls of the
+    executions profiled are recorded)"""
+
+    __KEY_CALLS = 'calls'
+    __KEY_SECONDS = 'seconds'
+    __KEY_BYTES = 'bytes'
+
+    # Arguments giving the bytes processed by an operation (size of a file for a full profiling
+    # only as it's read from disk, or length of a text)
+    __FILE_ARGUMENTS = ['source_file_path', 'xml_file_path', 'file_path']
+    __TEXT_ARGUMENTS = ['content', 'message']
+
+    __MEMORY_TOP_COUNT = 20
+
+    __lock = threading.RLock()
+    __sessions_count: int = 0
+    __profiling: Profiling = Profiling.OFF
+    __start_time: float = None
+    __operations: dict[str, dict[str, float]] = {}
+    __originals: list[tuple[type, str, object]] = []
+    __profile: cProfile.Profile = None
+    __metrics: list[ExecutionMetrics] = []
+
+    @staticmethod
+    def __measure_bytes(signature: inspect.Signature, args: tuple, kwargs: dict, result) -> int:
+        """Measure bytes processed by an operation from its arguments or its result"""
+
+        try:
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+        except TypeError:
+            return 0
+
+        if ProfilingHelper.__profiling == Profiling.FULL:
+            for name in ProfilingHelper.__FILE_ARGUMENTS:
+                file_path = arguments.get(name, None)
+                if file_path is not None and os.path.isfile(file_path):
+                    return os.path.getsize(file_path)
+        for name in ProfilingHelper.__TEXT_ARGUMENTS:
+            if isinstance(arguments.get(name, None), str):
+                return len(arguments[name])
+        if isinstance(result, (str, bytes)):
+            return len(result)
+
+        return 0
+
+    @staticmethod
+    def __record(operation: str, seconds: float, bytes_count: int):
+        """Record a call of an operation"""
+
+        with ProfilingHelper.__lock:
+            statistics = ProfilingHelper.__operations.setdefault(operation, {
+                ProfilingHelper.__KEY_CALLS: 0,
+                ProfilingHelper.__KEY_SECONDS: 0.0,
+                ProfilingHelper.__KEY_BYTES: 0
+            })
+            statistics[ProfilingHelper.__KEY_CALLS] += 1
+            statistics[ProfilingHelper.__KEY_SECONDS] += seconds
+            statistics[ProfilingHelper.__KEY_BYTES] += bytes_count
+
+    @staticmethod
+    def __wrap(operation: str, function):
+        """Wrap a function with a timer and counters (calls of other executions, like jobs of
+        the queue, aren't recorded)"""
+
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if ExecutionMetrics.get_current() not in ProfilingHelper.__metrics:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            result = None
+            try:
+                result = function(*args, **kwargs)
+                return result
+            finally:
+                seconds = time.perf_counter() - start
+                ProfilingHelper.__record(
+                    operation=operation,
+                    seconds=seconds,
+                    bytes_count=ProfilingHelper.__measure_bytes(
+                        signature=signature,
+                        args=args,
+                        kwargs=kwargs,
+                        result=result
+                    )
+                )
+
+        return wrapper
+
+    @staticmethod
+    def __instrument(classes: list[type]):
+        """Wrap public functions defined by classes"""
+
+        for cls in classes:
+            for name, attribute in list(vars(cls).items()):
+                if name.startswith('_'):
+                    continue
+                operation = f'{cls.__name__}.{name}'
+                if isinstance(attribute, staticmethod):
+                    wrapped = staticmethod(
+                        ProfilingHelper.__wrap(operation, attribute.__func__)
+                    )
+                elif inspect.isfunction(attribute):
+                    wrapped = ProfilingHelper.__wrap(operation, attribute)
+                else:
+                    continue
+                ProfilingHelper.__originals.append((cls, name, attribute))
+                setattr(cls, name, wrapped)
+
+    @staticmethod
+    def __uninstrument():
+        """Restore functions wrapped"""
+
+        for cls, name, attribute in reversed(ProfilingHelper.__originals):
+            setattr(cls, name, attribute)
+        ProfilingHelper.__originals = []
+
+    @staticmethod
+    def start(profiling: Profiling, classes: list[type]) -> bool:
+        """Start profiling the execution whose metrics are bound to the current thread (nested
+        sessions join the first one, cProfile and tracemalloc are started for a full profiling,
+        cProfile only profiles the thread starting the first session, not threads of platforms
+        or hashing), return False if no profiling"""
+
+        if profiling == Profiling.OFF:
+            return False
+
+        with ProfilingHelper.__lock:
+            ProfilingHelper.__sessions_count += 1
+            ProfilingHelper.__metrics.append(ExecutionMetrics.get_current())
+            if ProfilingHelper.__sessions_count > 1:
+                return True
+
+            ProfilingHelper.__profiling = profiling
+            ProfilingHelper.__operations = {}
+            ProfilingHelper.__instrument(classes=classes)
+            if profiling == Profiling.FULL:
+                tracemalloc.start()
+                ProfilingHelper.__profile = cProfile.Profile()
+                ProfilingHelper.__profile.enable()
+            ProfilingHelper.__start_time = time.perf_counter()
+
+        return True
+
+    @staticmethod
+    def stop(name: str) -> str:
+        """Stop profiling and write the report when the first session stops, return the report's
+        path (None if other sessions are running)"""
+
+        with ProfilingHelper.__lock:
+            ProfilingHelper.__sessions_count -= 1
+            if ProfilingHelper.__sessions_count > 0:
+                return None
+
+            duration = time.perf_counter() - ProfilingHelper.__start_time
+            ProfilingHelper.__uninstrument()
+            ProfilingHelper.__metrics = []
+
+            # Initialize report
+            report_path = os.path.join(
+                Context.get_logs_path(),
+                f'{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_profile_{name}'
+            )
+            report = {
+                'name': name,
+                'profiling': ProfilingHelper.__profiling.name,
+                'seconds': round(duration, 6),
+                'operations': dict(sorted(
+                    ProfilingHelper.__operations.items(),
+                    key=lambda item: -item[1][ProfilingHelper.__KEY_SECONDS]
+                ))
+            }
+
+            # Add cProfile's statistics and memory's top allocations
+            if ProfilingHelper.__profiling == Profiling.FULL:
+                ProfilingHelper.__profile.disable()
+                ProfilingHelper.__profile.dump_stats(f'{report_path}.prof')
+                ProfilingHelper.__profile = None
+                current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+                statistics = tracemalloc.take_snapshot().statistics('lineno')
+                tracemalloc.stop()
+                report['memory'] = {
+                    'current_bytes': current_bytes,
+                    'peak_bytes': peak_bytes,
+                    'top': [
+                        {
+                            'location': str(statistic.traceback),
+                            'bytes': statistic.size,
+                            'count': statistic.count
+                        }
+                        for statistic in statistics[:ProfilingHelper.__MEMORY_TOP_COUNT]
+                    ]
+                }
+
+            os.makedirs(Context.get_logs_path(), exist_ok=True)
+            with open(f'{report_path}.json', mode='w', encoding='UTF-8') as file:
+                json.dump(report, file, indent=2)
+
+            return f'{report_path}.json'
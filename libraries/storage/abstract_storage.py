@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""Abstract Storage"""
+
+from abc import ABC, abstractmethod
+import os
+from typing import IO, Iterator
+
+
+class AbstractStorage(ABC):
+    """Abstract storage (Common for all storage backends used by FileHelper)"""
+
+    @abstractmethod
+    def is_folder(self, path: str) -> bool:
+        """Check if a path is a folder"""
+
+    @abstractmethod
+    def is_file(self, path: str) -> bool:
+        """Check if a path is a file"""
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        """Check if a path exists"""
+
+    @abstractmethod
+    def get_size(self, path: str) -> int:
+        """Get the size of a file"""
+
+    @abstractmethod
+    def get_mtime(self, path: str) -> float:
+        """Get the modification time of a file or a folder"""
+
+    @abstractmethod
+    def get_stat(self, path: str) -> os.stat_result:
+        """Get the stats of a file or a folder"""
+
+    @abstractmethod
+    def list_folder(self, path: str) -> list[str]:
+        """List names in a folder"""
+
+    @abstractmethod
+    def scan_folder(self, path: str) -> list[os.DirEntry]:
+        """Scan a folder and list its entries (with their stats cached when the OS provides them
+        while listing)"""
+
+    @abstractmethod
+    def walk(self, path: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Walk recursively a folder like os.walk"""
+
+    @abstractmethod
+    def create_folders(self, path: str):
+        """Create a folder and its parents"""
+
+    @abstractmethod
+    def delete_file(self, path: str):
+        """Delete a file"""
+
+    @abstractmethod
+    def delete_folder(self, path: str):
+        """Delete recursively a folder"""
+
+    @abstractmethod
+    def copy_file(self, source_path: str, destination_path: str):
+        """Copy a file (with its metadata)"""
+
+    @abstractmethod
+    def copy_stat(self, source_path: str, destination_path: str):
+        """Copy the metadata of a file (modification time and permissions) to another file"""
+
+    @abstractmethod
+    def link_file(self, source_path: str, destination_path: str):
+        """Create a hardlink to a file (OSError if the file system has no hardlinks)"""
+
+    @abstractmethod
+    def copy_folder(self, source_path: str, destination_path: str):
+        """Copy recursively a folder"""
+
+    @abstractmethod
+    def move(self, source_path: str, destination_path: str):
+        """Move a file or a folder"""
+
+    @abstractmethod
+    def open_file(
+        self,
+        path: str,
+        mode: str = 'r',
+        encoding: str = None,
+        newline: str = None
+    ) -> IO:
+        """Open a file like open"""
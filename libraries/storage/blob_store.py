@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+"""Blob Store"""
+
+import os
+import threading
+
+from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
+from libraries.index.hash_index import HashIndex
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.storage.storage_helper import StorageHelper
+from libraries.text.text_helper import TextHelper
+
+
+class BlobStore:
+    """Store of files by content in the games store (a file is stored once as a blob named by its
+    SHA1, games' files are hardlinks to blobs), hashes of source files are kept in indexes so a
+    blob already stored is neither read nor written again, blobs linked to no game are purged"""
+
+    FOLDER_NAME = '.blobs'
+
+    __TEMPORARY_EXTENSION = '.tmp'
+
+    # Lock to store and link blobs while blobs are purged (platforms may be executed in parallel)
+    __lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize blob store of the games store"""
+
+        self.__folder_path = os.path.join(
+            Context.get_games_path(),
+            self.FOLDER_NAME
+        )
+
+        # Indexes of hashes of source files by folder
+        self.__indexes: dict[str, HashIndex] = {}
+
+    def is_used(self) -> bool:
+        """Specify if media are stored by content (selected in setup or blobs already stored)"""
+
+        return Context.is_deduplicated_media() or \
+            StorageHelper.get_storage().is_folder(self.__folder_path)
+
+    def __get_index(self, folder_path: str) -> HashIndex:
+        """Get the index of hashes for a source folder"""
+
+        if folder_path not in self.__indexes:
+            self.__indexes[folder_path] = HashIndex.get_index(
+                folder_path=folder_path
+            )
+
+        return self.__indexes[folder_path]
+
+    def build_blob_file_path(self, sha1: str, extension: str) -> str:
+        """Build the path of a blob by its SHA1 (blobs are spread in folders by the first
+        characters of their SHA1)"""
+
+        return os.path.join(
+            self.__folder_path,
+            sha1[:2],
+            f'{sha1}{extension.lower()}'
+        )
+
+    def copy_file(self, source_file_path: str, destination_file_path: str) -> bool:
+        """Copy a file from source to destination through the blob store (the blob is written
+        only if not stored yet, the destination is linked to the blob)"""
+
+        if ExecutionContext.is_simulated_execution():
+            return FileHelper.copy_file(
+                source_file_path=source_file_path,
+                destination_file_path=destination_file_path
+            )
+
+        # Hash the source file (copied in a temporary file while hashed if not hashed yet, so
+        # that a new file is read once)
+        temporary_file_path = os.path.join(
+            self.__folder_path,
+            f'{threading.get_ident()}{self.__TEMPORARY_EXTENSION}'
+        )
+        FileHelper.delete_file(
+            file_path=temporary_file_path
+        )
+        index = self.__get_index(
+            folder_path=os.path.dirname(source_file_path)
+        )
+        hashes = index.find(
+            file_path=source_file_path
+        )
+        if hashes is None:
+            hashes = index.hash_file(
+                file_path=source_file_path,
+                copy_file_path=temporary_file_path
+            )
+        if hashes is None:
+            return FileHelper.copy_file(
+                source_file_path=source_file_path,
+                destination_file_path=destination_file_path
+            )
+
+        # Store the blob if not stored yet and link the destination (a blob isn't purged
+        # meanwhile)
+        blob_file_path = self.build_blob_file_path(
+            sha1=hashes[HashIndex.KEY_SHA1],
+            extension=FileHelper.retrieve_file_extension(
+                file_path=source_file_path
+            )
+        )
+        with BlobStore.__lock:
+            if FileHelper.is_file_exists(
+                file_path=blob_file_path
+            ):
+                LoggingHelper.log_info(
+                    message=Context.get_text(
+                        'blob_found',
+                        blob_file=blob_file_path,
+                        source_file=source_file_path
+                    )
+                )
+            else:
+                if not FileHelper.is_file_exists(
+                    file_path=temporary_file_path
+                ):
+                    FileHelper.copy_file(
+                        source_file_path=source_file_path,
+                        destination_file_path=temporary_file_path
+                    )
+                if not FileHelper.move_file(
+                    source_file_path=temporary_file_path,
+                    destination_file_path=blob_file_path
+                ):
+                    return False
+
+            result = FileHelper.link_file(
+                source_file_path=blob_file_path,
+                destination_file_path=destination_file_path
+            )
+
+        # Delete the temporary file if the blob was already stored
+        FileHelper.delete_file(
+            file_path=temporary_file_path
+        )
+
+        return result
+
+    def purge(self):
+        """Delete blobs linked to no file of a game anymore (games deleted or exported again)"""
+
+        files_count = 0
+        bytes_count = 0
+        with BlobStore.__lock:
+            for root, _, files in StorageHelper.get_storage().walk(self.__folder_path):
+                for file_name in files:
+                    if file_name.endswith(self.__TEMPORARY_EXTENSION):
+                        continue
+                    file_path = os.path.join(root, file_name)
+                    try:
+                        stat = StorageHelper.get_storage().get_stat(file_path)
+                    except OSError:
+                        continue
+                    if stat.st_nlink > 1:
+                        continue
+                    if FileHelper.delete_file(
+                        file_path=file_path
+                    ):
+                        files_count += 1
+                        bytes_count += stat.st_size
+
+        if files_count > 0:
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'blobs_purged',
+                    files=files_count,
+                    bytes=TextHelper.format_bytes(bytes_count)
+                )
+            )
+
+    def save(self):
+        """Save indexes of hashes of source files"""
+
+        for index in self.__indexes.values():
+            index.save()
@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+"""Local Storage"""
+
+import os
+import shutil
+from typing import IO, Iterator
+
+from libraries.storage.abstract_storage import AbstractStorage
+
+
+class LocalStorage(AbstractStorage):
+    """Storage on the local file system (or a share mounted on it)"""
+
+    def is_folder(self, path: str) -> bool:
+        """Check if a path is a folder"""
+
+        return os.path.isdir(path)
+
+    def is_file(self, path: str) -> bool:
+        """Check if a path is a file"""
+
+        return os.path.isfile(path)
+
+    def exists(self, path: str) -> bool:
+        """Check if a path exists"""
+
+        return os.path.exists(path)
+
+    def get_size(self, path: str) -> int:
+        """Get the size of a file"""
+
+        return os.path.getsize(path)
+
+    def get_mtime(self, path: str) -> float:
+        """Get the modification time of a file or a folder"""
+
+        return os.stat(path).st_mtime
+
+    def get_stat(self, path: str) -> os.stat_result:
+        """Get the stats of a file or a folder"""
+
+        return os.stat(path)
+
+    def list_folder(self, path: str) -> list[str]:
+        """List names in a folder"""
+
+        return os.listdir(path)
+
+    def scan_folder(self, path: str) -> list[os.DirEntry]:
+        """Scan a folder and list its entries (with their stats cached when the OS provides them
+        while listing)"""
+
+        with os.scandir(path) as entries:
+            return list(entries)
+
+    def walk(self, path: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Walk recursively a folder like os.walk"""
+
+        return os.walk(path)
+
+    def create_folders(self, path: str):
+        """Create a folder and its parents"""
+
+        os.makedirs(path, exist_ok=True)
+
+    def delete_file(self, path: str):
+        """Delete a file"""
+
+        os.remove(path)
+
+    def delete_folder(self, path: str):
+        """Delete recursively a folder"""
+
+        shutil.rmtree(path)
+
+    def copy_file(self, source_path: str, destination_path: str):
+        """Copy a file (with its metadata)"""
+
+        shutil.copy2(source_path, destination_path)
+
+    def copy_stat(self, source_path: str, destination_path: str):
+        """Copy the metadata of a file (modification time and permissions) to another file"""
+
+        shutil.copystat(source_path, destination_path)
+
+    def link_file(self, source_path: str, destination_path: str):
+        """Create a hardlink to a file (OSError if the file system has no hardlinks)"""
+
+        os.link(source_path, destination_path)
+
+    def copy_folder(self, source_path: str, destination_path: str):
+        """Copy recursively a folder"""
+
+        shutil.copytree(source_path, destination_path)
+
+    def move(self, source_path: str, destination_path: str):
+        """Move a file or a folder"""
+
+        shutil.move(source_path, destination_path)
+
+    def open_file(
+        self,
+        path: str,
+        mode: str = 'r',
+        encoding: str = None,
+        newline: str = None
+    ) -> IO:
+        """Open a file like open"""
+
+        # pylint: disable=consider-using-with
+        return open(path, mode=mode, encoding=encoding, newline=newline)
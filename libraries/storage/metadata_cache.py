@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+"""Metadata Cache"""
+
+from contextlib import contextmanager
+import os
+import threading
+
+from libraries.storage.storage_helper import StorageHelper
+
+
+class MetadataCache:
+    """Cache of folders' listings and files' stats for a scan (each folder is listed once with
+    its stats, writes done with FileHelper invalidate the cache)"""
+
+    # Cache bound to the current thread for a scan
+    __current = threading.local()
+
+    # Entry of a path written since its folder was listed (its metadata is read again)
+    __WRITTEN = object()
+
+    def __init__(self):
+        """Initialize cache"""
+
+        # Entries of folders by name (None if the folder doesn't exist)
+        self.__folders: dict[str, dict[str, os.DirEntry]] = {}
+
+        # Names written in folders since they were listed
+        self.__written_names: dict[str, set[str]] = {}
+
+    @staticmethod
+    @contextmanager
+    def scope():
+        """Cache the metadata for the current thread during a scan (nested scans use the cache
+        of the first scan)"""
+
+        if MetadataCache.get_current() is not None:
+            yield MetadataCache.get_current()
+            return
+
+        MetadataCache.__current.cache = MetadataCache()
+        try:
+            yield MetadataCache.__current.cache
+        finally:
+            MetadataCache.__current.cache = None
+
+    @staticmethod
+    def get_current() -> 'MetadataCache':
+        """Get the cache of the current thread (None if no scan)"""
+
+        return getattr(MetadataCache.__current, 'cache', None)
+
+    @staticmethod
+    def __build_key(path: str) -> str:
+        """Build the key of a path (case is ignored if the OS ignores it)"""
+
+        return os.path.normcase(os.path.normpath(str(path)))
+
+    def __list_entries(self, folder_key: str) -> dict[str, os.DirEntry]:
+        """List entries of a folder (listed once)"""
+
+        if folder_key not in self.__folders:
+            try:
+                self.__folders[folder_key] = {
+                    os.path.normcase(entry.name): entry
+                    for entry in StorageHelper.get_storage().scan_folder(folder_key)
+                }
+            except OSError:
+                self.__folders[folder_key] = None
+
+        return self.__folders[folder_key]
+
+    def __find_entry(self, path: str):
+        """Find the entry of a path in the listing of its parent (None if not found, __WRITTEN
+        if written since listed)"""
+
+        key = self.__build_key(path)
+        folder_key = os.path.dirname(key)
+        name = os.path.basename(key)
+        if name in self.__written_names.get(folder_key, ()):
+            return self.__WRITTEN
+
+        entries = self.__list_entries(folder_key)
+        if entries is None:
+            return None
+
+        return entries.get(name, None)
+
+    def is_folder(self, path: str) -> bool:
+        """Check if a path is a folder"""
+
+        entry = self.__find_entry(path)
+        if entry is self.__WRITTEN:
+            return StorageHelper.get_storage().is_folder(path)
+
+        return entry is not None and entry.is_dir()
+
+    def is_file(self, path: str) -> bool:
+        """Check if a path is a file"""
+
+        entry = self.__find_entry(path)
+        if entry is self.__WRITTEN:
+            return StorageHelper.get_storage().is_file(path)
+
+        return entry is not None and entry.is_file()
+
+    def exists(self, path: str) -> bool:
+        """Check if a path exists"""
+
+        entry = self.__find_entry(path)
+        if entry is self.__WRITTEN:
+            return StorageHelper.get_storage().exists(path)
+
+        return entry is not None
+
+    def get_size(self, path: str) -> int:
+        """Get the size of a file"""
+
+        entry = self.__find_entry(path)
+        if entry is self.__WRITTEN:
+            return StorageHelper.get_storage().get_size(path)
+        if entry is None:
+            raise FileNotFoundError(path)
+
+        return entry.stat().st_size
+
+    def list_folder(self, path: str) -> list[str]:
+        """List names in a folder (listed again if written since listed)"""
+
+        key = self.__build_key(path)
+        if key in self.__written_names:
+            del self.__written_names[key]
+            self.__folders.pop(key, None)
+
+        entries = self.__list_entries(key)
+        if entries is None:
+            raise FileNotFoundError(path)
+
+        return [entry.name for entry in entries.values()]
+
+    def invalidate(self, path: str, folder: bool = False):
+        """Invalidate a path written (and paths under it for a folder)"""
+
+        key = self.__build_key(path)
+
+        # Forget listings of the path (and under it for a folder)
+        self.__folders.pop(key, None)
+        self.__written_names.pop(key, None)
+        if folder:
+            for folder_key in [
+                folder_key for folder_key in self.__folders
+                if folder_key.startswith(key + os.sep)
+            ]:
+                del self.__folders[folder_key]
+                self.__written_names.pop(folder_key, None)
+
+        # Mark the path and its parents (created if missing) as written in listed folders
+        child_key = key
+        folder_key = os.path.dirname(child_key)
+        while folder_key != child_key:
+            if folder_key in self.__folders:
+                if self.__folders[folder_key] is None:
+                    del self.__folders[folder_key]
+                else:
+                    self.__written_names.setdefault(folder_key, set()).add(
+                        os.path.basename(child_key)
+                    )
+            child_key = folder_key
+            folder_key = os.path.dirname(child_key)
@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+"""Slow Local Storage"""
+
+import os
+import time
+from typing import IO, Iterator
+
+from libraries.metrics.rate_limiter import RateLimiter
+from libraries.storage.local_storage import LocalStorage
+
+
+class ThrottledFile:
+    """File whose reads and writes are limited by a bandwidth"""
+
+    def __init__(
+        self,
+        file: IO,
+        storage: 'SlowLocalStorage'
+    ):
+        """Initialize throttled file"""
+
+        self.__file = file
+        self.__storage = storage
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.__file.close()
+
+    def __iter__(self):
+        for line in self.__file:
+            self.__storage.wait(size=len(line))
+            yield line
+
+    def __getattr__(self, name: str):
+        return getattr(self.__file, name)
+
+    def read(self, size: int = -1):
+        """Read from the file"""
+
+        data = self.__file.read(size)
+        self.__storage.wait(size=len(data))
+        return data
+
+    def readinto(self, buffer) -> int:
+        """Read from the file into a buffer"""
+
+        size = self.__file.readinto(buffer)
+        self.__storage.wait(size=size)
+        return size
+
+    def write(self, data) -> int:
+        """Write to the file"""
+
+        self.__storage.wait(size=len(data))
+        return self.__file.write(data)
+
+
+class SlowLocalStorage(LocalStorage):
+    """Storage on the local file system with a latency for each operation and a bandwidth shared
+    by all threads (to reproduce a network share like SMB when benchmarking)"""
+
+    def __init__(
+        self,
+        latency_ms: int,
+        bandwidth_kbps: int
+    ):
+        """Initialize storage (no bandwidth's limit if 0)"""
+
+        self.__latency_seconds = latency_ms / 1000
+        self.__rate_limiter = RateLimiter(
+            bytes_per_second=bandwidth_kbps * 1024
+        )
+
+    def wait(self, size: int = 0, operations: int = 1):
+        """Wait for operations (each thread waits for its own latency) and for the transfer of a
+        size in bytes (transfers of all threads share the bandwidth)"""
+
+        duration = operations * self.__latency_seconds
+        if duration > 0:
+            time.sleep(duration)
+        self.__rate_limiter.wait(size=size)
+
+    def is_folder(self, path: str) -> bool:
+        """Check if a path is a folder"""
+
+        self.wait()
+        return super().is_folder(path)
+
+    def is_file(self, path: str) -> bool:
+        """Check if a path is a file"""
+
+        self.wait()
+        return super().is_file(path)
+
+    def exists(self, path: str) -> bool:
+        """Check if a path exists"""
+
+        self.wait()
+        return super().exists(path)
+
+    def get_size(self, path: str) -> int:
+        """Get the size of a file"""
+
+        self.wait()
+        return super().get_size(path)
+
+    def get_mtime(self, path: str) -> float:
+        """Get the modification time of a file or a folder"""
+
+        self.wait()
+        return super().get_mtime(path)
+
+    def get_stat(self, path: str) -> os.stat_result:
+        """Get the stats of a file or a folder"""
+
+        self.wait()
+        return super().get_stat(path)
+
+    def list_folder(self, path: str) -> list[str]:
+        """List names in a folder"""
+
+        self.wait()
+        return super().list_folder(path)
+
+    def scan_folder(self, path: str) -> list[os.DirEntry]:
+        """Scan a folder and list its entries (with their stats cached when the OS provides them
+        while listing)"""
+
+        self.wait()
+        return super().scan_folder(path)
+
+    def walk(self, path: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Walk recursively a folder like os.walk (each folder listed is an operation)"""
+
+        for root, dirs, files in super().walk(path):
+            self.wait()
+            yield root, dirs, files
+
+    def create_folders(self, path: str):
+        """Create a folder and its parents"""
+
+        self.wait()
+        super().create_folders(path)
+
+    def delete_file(self, path: str):
+        """Delete a file"""
+
+        self.wait()
+        super().delete_file(path)
+
+    def delete_folder(self, path: str):
+        """Delete recursively a folder (each folder and file deleted is an operation)"""
+
+        operations = sum(1 + len(files) for _, _, files in os.walk(path))
+        self.wait(operations=operations)
+        super().delete_folder(path)
+
+    def copy_file(self, source_path: str, destination_path: str):
+        """Copy a file (with its metadata)"""
+
+        self.wait(size=os.path.getsize(source_path))
+        super().copy_file(source_path, destination_path)
+
+    def copy_stat(self, source_path: str, destination_path: str):
+        """Copy the metadata of a file (modification time and permissions) to another file"""
+
+        self.wait()
+        super().copy_stat(source_path, destination_path)
+
+    def link_file(self, source_path: str, destination_path: str):
+        """Create a hardlink to a file (OSError if the file system has no hardlinks)"""
+
+        self.wait()
+        super().link_file(source_path, destination_path)
+
+    def copy_folder(self, source_path: str, destination_path: str):
+        """Copy recursively a folder (each folder and file copied is an operation)"""
+
+        operations = 0
+        size = 0
+        for root, _, files in os.walk(source_path):
+            operations += 1 + len(files)
+            size += sum(os.path.getsize(os.path.join(root, file)) for file in files)
+        self.wait(size=size, operations=operations)
+        super().copy_folder(source_path, destination_path)
+
+    def move(self, source_path: str, destination_path: str):
+        """Move a file or a folder"""
+
+        self.wait()
+        super().move(source_path, destination_path)
+
+    def open_file(
+        self,
+        path: str,
+        mode: str = 'r',
+        encoding: str = None,
+        newline: str = None
+    ) -> IO:
+        """Open a file like open (reads and writes are limited by the bandwidth)"""
+
+        self.wait()
+        return ThrottledFile(
+            file=super().open_file(path, mode=mode, encoding=encoding, newline=newline),
+            storage=self
+        )
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""Storage Helper"""
+
+import threading
+
+from libraries.constants.constants import Storage
+from libraries.context.context import Context
+from libraries.storage.abstract_storage import AbstractStorage
+from libraries.storage.local_storage import LocalStorage
+from libraries.storage.slow_local_storage import SlowLocalStorage
+
+
+class StorageHelper:
+    """Class to help usage of Storage (backend used by FileHelper for its I/O operations)"""
+
+    __storage: AbstractStorage = None
+    __storage_lock = threading.Lock()
+
+    @staticmethod
+    def get_storage() -> AbstractStorage:
+        """Get the storage backend (created from context when first used)"""
+
+        with StorageHelper.__storage_lock:
+            if StorageHelper.__storage is None:
+                StorageHelper.__storage = StorageHelper.create_storage(
+                    storage=Context.get_storage()
+                )
+
+            return StorageHelper.__storage
+
+    @staticmethod
+    def set_storage(storage: AbstractStorage):
+        """Set the storage backend (None to create it again from context)"""
+
+        with StorageHelper.__storage_lock:
+            StorageHelper.__storage = storage
+
+    @staticmethod
+    def create_storage(storage: Storage) -> AbstractStorage:
+        """Create a storage backend"""
+
+        if storage == Storage.SLOW_LOCAL:
+            return SlowLocalStorage(
+                latency_ms=Context.get_storage_latency_ms(),
+                bandwidth_kbps=Context.get_storage_bandwidth_kbps()
+            )
+
+        return LocalStorage()
@@ -46,3 +46,33 @@ class TextHelper:
         result = re.sub(r'\s+', '_', result)
 
         return result
+
+    @staticmethod
+    def format_duration(
+        seconds: float
+    ) -> str:
+        """Format a duration like 1:02:03 (empty if None)"""
+
+        if seconds is None:
+            return ''
+
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+
+        return f'{hours}:{minutes:02d}:{seconds:02d}'
+
+    @staticmethod
+    def format_bytes(
+        bytes_count: float
+    ) -> str:
+        """Format a number of bytes like 1.5 MB (empty if None)"""
+
+        if bytes_count is None:
+            return ''
+
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if abs(bytes_count) < 1024:
+                return f'{bytes_count:.1f} {unit}' if unit != 'B' else f'{int(bytes_count)} {unit}'
+            bytes_count /= 1024
+
+        return f'{bytes_count:.1f} TB'
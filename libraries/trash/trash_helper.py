@@ -0,0 +1,298 @@
+#!/usr/bin/python3
+"""Trash Helper"""
+
+import os
+from pathlib import Path
+import shutil
+import threading
+import time
+import uuid
+
+from libraries.constants.constants import Constants, Software
+from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class TrashHelper:
+    """Class to help usage of Trash (folders renamed in a trash and purged in background)"""
+
+    __ORIGIN_FILE_NAME = 'origin.txt'
+    __HIDDEN_PREFIX = '.'
+    __PURGED_PREFIX = '.purged_'
+    __PURGE_PAUSE_SECONDS = 0.05
+    __SECONDS_PER_DAY = 24 * 60 * 60
+
+    __purge_lock = threading.Lock()
+    __purge_thread: threading.Thread = None
+    __purge_requested: bool = False
+    __trash_paths: set[str] = set()
+
+    @staticmethod
+    def __retrieve_mount_path(path: str) -> str:
+        """Retrieve the mount path (root of the file system) for the specified path"""
+
+        result = os.path.abspath(path)
+        while not os.path.ismount(result):
+            parent = os.path.dirname(result)
+            if parent == result:
+                break
+            result = parent
+
+        return result
+
+    @staticmethod
+    def retrieve_trash_path(folder_path: str) -> str:
+        """Retrieve the trash on the same file system as the specified folder"""
+
+        # Use the working path's trash if on the same file system
+        working_path = Context.get_working_path()
+        if os.stat(working_path).st_dev == os.stat(folder_path).st_dev:
+            return os.path.join(working_path, Constants.TRASH_PATH)
+
+        return os.path.join(
+            TrashHelper.__retrieve_mount_path(folder_path),
+            Constants.TRASH_PATH
+        )
+
+    @staticmethod
+    def move_folder_to_trash(folder_path: str) -> bool:
+        """Move a folder to the trash (renamed, so done immediately), return False if the folder
+        can't be moved (no trash can be created on its file system or the folder can't be
+        renamed)"""
+
+        if not os.path.isdir(folder_path):
+            return False
+
+        trash_path = TrashHelper.retrieve_trash_path(folder_path)
+
+        if ExecutionContext.is_simulated_execution():
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'trash_folder_simulation',
+                    folder=str(folder_path),
+                    trash=trash_path
+                )
+            )
+            return True
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'trash_folder_in_progress',
+                folder=str(folder_path),
+                trash=trash_path
+            )
+        )
+
+        # Create a temporary entry in trash to keep the origin of the folder and rename the folder
+        # in the entry (entry removed if impossible)
+        entry_id = uuid.uuid4().hex
+        temporary_entry_path = os.path.join(
+            trash_path,
+            f'{TrashHelper.__HIDDEN_PREFIX}{entry_id}'
+        )
+        try:
+            os.makedirs(temporary_entry_path)
+            with open(
+                os.path.join(temporary_entry_path, TrashHelper.__ORIGIN_FILE_NAME),
+                mode='w',
+                encoding='UTF-8'
+            ) as file:
+                file.write(os.path.abspath(folder_path))
+            os.rename(
+                folder_path,
+                os.path.join(temporary_entry_path, Path(folder_path).name)
+            )
+        except OSError:
+            shutil.rmtree(temporary_entry_path, ignore_errors=True)
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'trash_unavailable',
+                    folder=str(folder_path),
+                    trash=trash_path
+                )
+            )
+            return False
+
+        # Rename the entry when complete to make it visible for the purge
+        os.rename(
+            temporary_entry_path,
+            os.path.join(trash_path, f'{int(time.time())}_{entry_id}')
+        )
+
+        # Purge the trash in background
+        with TrashHelper.__purge_lock:
+            TrashHelper.__trash_paths.add(trash_path)
+        TrashHelper.start_purge()
+
+        return True
+
+    @staticmethod
+    def __list_entries(trash_path: str) -> list[tuple[str, str]]:
+        """List entries of a trash with the origin of their folder (most recent first, entries in
+        progress or purged are hidden)"""
+
+        # Initialize result
+        result = []
+
+        if not os.path.isdir(trash_path):
+            return result
+
+        for entry in sorted(os.listdir(trash_path), reverse=True):
+            if entry.startswith(TrashHelper.__HIDDEN_PREFIX):
+                continue
+            entry_path = os.path.join(trash_path, entry)
+            origin_file_path = os.path.join(
+                entry_path,
+                TrashHelper.__ORIGIN_FILE_NAME
+            )
+            if not os.path.isfile(origin_file_path):
+                continue
+            with open(origin_file_path, mode='r', encoding='UTF-8') as file:
+                result.append((entry_path, file.read()))
+
+        return result
+
+    @staticmethod
+    def list_trashed_folders(folder_path: str) -> list[str]:
+        """List trashed folders (their origin) in the specified folder and its sub folders"""
+
+        folder_path = os.path.abspath(folder_path)
+        if not os.path.isdir(folder_path):
+            return []
+
+        return list(dict.fromkeys(
+            origin for _, origin in TrashHelper.__list_entries(
+                trash_path=TrashHelper.retrieve_trash_path(folder_path)
+            )
+            if origin.startswith(folder_path + os.sep)
+        ))
+
+    @staticmethod
+    def restore_folder(folder_path: str) -> bool:
+        """Restore the most recently trashed folder for the specified path"""
+
+        folder_path = os.path.abspath(folder_path)
+        if os.path.exists(folder_path):
+            return False
+
+        for entry_path, origin in TrashHelper.__list_entries(
+            trash_path=TrashHelper.retrieve_trash_path(
+                os.path.dirname(folder_path)
+            )
+        ):
+            trashed_folder_path = os.path.join(entry_path, Path(folder_path).name)
+            if origin != folder_path or not os.path.isdir(trashed_folder_path):
+                continue
+
+            if ExecutionContext.is_simulated_execution():
+                LoggingHelper.log_info(
+                    message=Context.get_text(
+                        'restore_folder_simulation',
+                        folder=folder_path
+                    )
+                )
+                return True
+
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'restore_folder_in_progress',
+                    folder=folder_path
+                )
+            )
+            os.rename(
+                trashed_folder_path,
+                folder_path
+            )
+            shutil.rmtree(entry_path, ignore_errors=True)
+            return True
+
+        return False
+
+    @staticmethod
+    def start_purge():
+        """Start to purge expired folders from trashes in a background thread"""
+
+        with TrashHelper.__purge_lock:
+            # Trashes for the working path and for softwares
+            TrashHelper.__trash_paths.add(os.path.join(
+                Context.get_working_path(),
+                Constants.TRASH_PATH
+            ))
+            for software in Software:
+                software_path = Context.get_software_path(software)
+                if software_path and os.path.isdir(software_path):
+                    TrashHelper.__trash_paths.add(
+                        TrashHelper.retrieve_trash_path(software_path)
+                    )
+
+            # Request a purge (started if not already in progress)
+            TrashHelper.__purge_requested = True
+            if TrashHelper.__purge_thread is None:
+                TrashHelper.__purge_thread = threading.Thread(
+                    target=TrashHelper.__purge,
+                    daemon=True
+                )
+                TrashHelper.__purge_thread.start()
+
+    @staticmethod
+    def __purge():
+        """Purge expired folders from trashes while purges are requested"""
+
+        while True:
+            with TrashHelper.__purge_lock:
+                if not TrashHelper.__purge_requested:
+                    TrashHelper.__purge_thread = None
+                    return
+                TrashHelper.__purge_requested = False
+                trash_paths = list(TrashHelper.__trash_paths)
+
+            for trash_path in trash_paths:
+                TrashHelper.__purge_trash(trash_path)
+
+    @staticmethod
+    def __purge_trash(trash_path: str):
+        """Purge expired folders from a trash (pausing between entries to leave I/O to others)"""
+
+        if not os.path.isdir(trash_path):
+            return
+
+        retention_seconds = Context.get_trash_retention_days() * TrashHelper.__SECONDS_PER_DAY
+        for entry in sorted(os.listdir(trash_path)):
+            # Skip entries in progress or not expired (entries hidden by an interrupted purge are
+            # purged again)
+            purged = entry.startswith(TrashHelper.__PURGED_PREFIX)
+            if not purged:
+                try:
+                    trashed_time = int(entry.split('_')[0])
+                except ValueError:
+                    continue
+                if time.time() - trashed_time < retention_seconds:
+                    continue
+
+            entry_path = os.path.join(trash_path, entry)
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'purge_trash_in_progress',
+                    folder=entry_path
+                )
+            )
+            try:
+                # Hide the entry before deleting it (not restored if partially deleted)
+                if not purged:
+                    purged_entry_path = os.path.join(
+                        trash_path,
+                        f'{TrashHelper.__PURGED_PREFIX}{entry}'
+                    )
+                    os.rename(entry_path, purged_entry_path)
+                    entry_path = purged_entry_path
+                shutil.rmtree(entry_path)
+            except Exception as exc:
+                LoggingHelper.log_error(
+                    message=Context.get_text(
+                        'error_purge_trash',
+                        folder=entry_path
+                    ),
+                    exc=exc
+                )
+            time.sleep(TrashHelper.__PURGE_PAUSE_SECONDS)
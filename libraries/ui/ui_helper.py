@@ -8,6 +8,9 @@ import screeninfo
 from libraries.context.context import Context
 from libraries.logging.logging_helper import LoggingHelper
 
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
+
 
 class UIHelper:
     """Class to help usage of UI"""
@@ -51,7 +54,8 @@ class UIHelper:
         width: int,
         height: int,
         resizable=False,
-        tool_window=True
+        tool_window=True,
+        modal=True
     ):
         """Center dialog depending on its width and its height"""
 
@@ -70,7 +74,8 @@ class UIHelper:
         # Ensure the dialog is modal
         parent_window = dialog.master
         parent_window.update_idletasks()
-        dialog.grab_set()
+        if modal:
+            dialog.grab_set()
 
         # Disable resizing
         if not resizable:
@@ -83,7 +88,8 @@ class UIHelper:
         )
 
         # Hide the window
-        parent_window.withdraw()
+        if modal:
+            parent_window.withdraw()
 
         # Give the dialog focus
         dialog.lift()
@@ -101,9 +101,7 @@ class UITable:
         columns_ids = []
         if len(rows) > 0:
             for key in rows[0].keys():
-                if key == Constants.UI_TABLE_KEY_COLOR:
-                    continue
-                if key == Constants.UI_TABLE_KEY_COL_ID:
+                if key in Constants.UI_TABLE_HIDDEN_KEYS:
                     continue
                 columns_ids.append(key)
 
@@ -388,13 +386,13 @@ class UITable:
             data_row = []
             color = 'black'
             for key, value in row.items():
-                if key == Constants.UI_TABLE_KEY_COL_ID:
-                    continue
                 if key == Constants.UI_TABLE_KEY_COLOR:
                     color = value
                     if color not in colors:
                         self.__tree.tag_configure(color, foreground=color)
                         colors.append(color)
+                elif key in Constants.UI_TABLE_HIDDEN_KEYS:
+                    continue
                 elif key == Constants.UI_TABLE_KEY_COL_SELECTION:
                     data_row.append(self.__get_selected_value(value))
                 elif isinstance(value, bool):
@@ -1,14 +1,27 @@
 #!/usr/bin/python3
 """XML Helper"""
 
+import re
+from typing import Callable, Iterator
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import quoteattr
 
+from libraries.constants.constants import MetricsPhase
+from libraries.context.execution_context import ExecutionContext
 from libraries.file.file_helper import FileHelper
+from libraries.metrics.execution_metrics import ExecutionMetrics
+from libraries.storage.storage_helper import StorageHelper
+
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
 
 
 class XmlHelper:
     """Class to help usage of XML"""
 
+    # Declaration of XML files rewritten
+    __DECLARATION = '<?xml version="1.0" standalone="yes"?>'
+
     @staticmethod
     def _matches_criteria(node: ET.Element, criteria: dict[str, str]) -> bool:
         """Check if node matches all criteria"""
@@ -37,6 +50,7 @@ class XmlHelper:
             print(f"Tag : {elem.tag}  |  Text : {elem.text!r}")
 
     @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
     def list_tag_values(
         xml_file_path: str,
         parent_tag: str,
@@ -75,6 +89,7 @@ class XmlHelper:
         return result
 
     @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
     def get_tag_data(
         xml_file_path: str,
         parent_tag: str,
@@ -117,6 +132,7 @@ class XmlHelper:
         return {}
 
     @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
     def get_tag_content(
         xml_file_path: str,
         parent_tag: str,
@@ -155,6 +171,7 @@ class XmlHelper:
         return None
 
     @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
     def delete_tag(
         xml_file_path: str,
         parent_tag: str,
@@ -189,13 +206,551 @@ class XmlHelper:
                 if XmlHelper._matches_criteria(node, criteria):
                     node.tail = None
                     parent.remove(node)
-                    ET.indent(tree, space="  ")
-                    tree.write(
-                        xml_file_path,
-                        encoding="utf-8",
-                        xml_declaration=True
-                    )
+                    XmlHelper.__write_tree(xml_file_path=xml_file_path, tree=tree)
                     return True
 
         # No match
         return False
+
+    @staticmethod
+    def __index_tags(
+        xml_file_path: str,
+        parent_tag: str,
+        tag: str,
+        key_tag: str
+    ) -> dict[str, ET.Element]:
+        """Index tags by the value of a child tag (the first tag is kept for a value)"""
+
+        # Initialize result
+        result = {}
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return result
+
+        # Load tree from XML file
+        tree = ET.parse(xml_file_path)
+        root = tree.getroot()
+
+        # Retrieve parents
+        if parent_tag == root.tag:
+            parents = [root]
+        else:
+            parents = root.findall(f'.//{parent_tag}')
+
+        # For each parent
+        for parent in parents:
+            # For each parent's node
+            for node in list(parent):
+                # If bad tag, continue
+                if node.tag != tag:
+                    continue
+
+                # Index node by its key
+                key_node = node.find(key_tag)
+                if key_node is not None and key_node.text not in result:
+                    result[key_node.text] = node
+
+        return result
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def index_tags_data(
+        xml_file_path: str,
+        parent_tag: str,
+        tag: str,
+        key_tag: str
+    ) -> dict[str, dict[str, str]]:
+        """Return the data dict of tags indexed by the value of a child tag (in one pass)"""
+
+        return {
+            key: {child.tag: child.text for child in node}
+            for key, node in XmlHelper.__index_tags(
+                xml_file_path=xml_file_path,
+                parent_tag=parent_tag,
+                tag=tag,
+                key_tag=key_tag
+            ).items()
+        }
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def list_tags_data(
+        xml_file_path: str,
+        parent_tag: str,
+        tag: str
+    ) -> list[dict[str, str]]:
+        """List the data dict of all tags, duplicates included (in one pass)"""
+
+        # Initialize result
+        result = []
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return result
+
+        # Load tree from XML file
+        tree = ET.parse(xml_file_path)
+        root = tree.getroot()
+
+        # Retrieve parents
+        if parent_tag == root.tag:
+            parents = [root]
+        else:
+            parents = root.findall(f'.//{parent_tag}')
+
+        # For each parent
+        for parent in parents:
+            # For each parent's node
+            for node in list(parent):
+                # If bad tag, continue
+                if node.tag != tag:
+                    continue
+
+                # Add node's data
+                result.append({child.tag: child.text for child in node})
+
+        return result
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def index_tags_content(
+        xml_file_path: str,
+        parent_tag: str,
+        tag: str,
+        key_tag: str
+    ) -> dict[str, str]:
+        """Return the content of tags indexed by the value of a child tag (in one pass)"""
+
+        return {
+            key: ET.tostring(node, encoding="unicode")
+            for key, node in XmlHelper.__index_tags(
+                xml_file_path=xml_file_path,
+                parent_tag=parent_tag,
+                tag=tag,
+                key_tag=key_tag
+            ).items()
+        }
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def delete_tags(
+        xml_file_path: str,
+        parent_tag: str,
+        tag: str,
+        key_tag: str,
+        key_values: list[str]
+    ) -> int:
+        """Delete the first tag for each value of a child tag (XML file written once)"""
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return 0
+
+        # Load tree from XML file
+        tree = ET.parse(xml_file_path)
+        root = tree.getroot()
+
+        # Retrieve parents
+        if parent_tag == root.tag:
+            parents = [root]
+        else:
+            parents = root.findall(f'.//{parent_tag}')
+
+        # For each parent
+        remaining_values = set(key_values)
+        deleted_count = 0
+        for parent in parents:
+            # For each parent's node
+            for node in list(parent):
+                # If bad tag, continue
+                if node.tag != tag:
+                    continue
+
+                # If the key is one of the values, delete the tag
+                key_node = node.find(key_tag)
+                if key_node is not None and key_node.text in remaining_values:
+                    remaining_values.remove(key_node.text)
+                    node.tail = None
+                    parent.remove(node)
+                    deleted_count += 1
+
+        # Write the XML file if some tags are deleted
+        if deleted_count > 0:
+            XmlHelper.__write_tree(xml_file_path=xml_file_path, tree=tree)
+
+        return deleted_count
+
+    @staticmethod
+    def __write_tree(xml_file_path: str, tree: ET.ElementTree):
+        """Write an indented tree in a XML file (with FileHelper so that it isn't written if
+        simulated and cached metadata of the file is invalidated)"""
+
+        ET.indent(tree, space="  ")
+        FileHelper.write_file(
+            file_path=xml_file_path,
+            content=ET.tostring(
+                tree.getroot(),
+                encoding="utf-8",
+                xml_declaration=True
+            ).decode('utf-8')
+        )
+
+    @staticmethod
+    def __iterate_root_children(
+        xml_file_path: str,
+        root_tags: list[str] = None
+    ) -> Iterator[ET.Element]:
+        """Iterate over children of the root parsed incrementally (each child is freed after
+        being used so that memory doesn't depend on the size of the XML file)"""
+
+        root = None
+        depth = 0
+        for event, elem in ET.iterparse(xml_file_path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                    if root_tags is not None:
+                        root_tags.append(root)
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                yield elem
+                root.clear()
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def iterate_tags(
+        xml_file_path: str,
+        tags: list[str]
+    ) -> Iterator[ET.Element]:
+        """Iterate over tags children of the root with their attributes and children (the XML
+        file is parsed incrementally for large files, a tag can't be used after the next one)"""
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return
+
+        for node in XmlHelper.__iterate_root_children(xml_file_path=xml_file_path):
+            if node.tag in tags:
+                yield node
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def iterate_tags_data(
+        xml_file_path: str,
+        tag: str,
+        fields: list[str]
+    ) -> Iterator[dict[str, str]]:
+        """Iterate over the specified fields of tags children of the root (the XML file is parsed
+        incrementally for large files)"""
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return
+
+        for node in XmlHelper.__iterate_root_children(xml_file_path=xml_file_path):
+            if node.tag == tag:
+                yield {field: node.findtext(field) for field in fields}
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def retrieve_tags_content(
+        xml_file_path: str,
+        tag: str,
+        key_tag: str,
+        key_values: list[str]
+    ) -> dict[str, str]:
+        """Return the content of tags children of the root indexed by the value of a child tag,
+        for the specified values only (the XML file is parsed incrementally for large files)"""
+
+        # Initialize result
+        result = {}
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return result
+
+        remaining_values = set(key_values)
+        for node in XmlHelper.__iterate_root_children(xml_file_path=xml_file_path):
+            if node.tag != tag:
+                continue
+            key_value = node.findtext(key_tag)
+            if key_value in remaining_values:
+                remaining_values.remove(key_value)
+                ET.indent(node, space="  ", level=1)
+                node.tail = None
+                result[key_value] = ET.tostring(node, encoding="unicode")
+
+        return result
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def rewrite_tags(
+        xml_file_path: str,
+        deleted_tags: dict[str, tuple[str, set[str]]],
+        added_contents: list[str]
+    ) -> int:
+        """Rewrite tags children of the root, deleting those whose key is in the values (by tag:
+        key's tag and values) and adding contents at the end (the XML file is parsed and written
+        incrementally for large files)"""
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return 0
+
+        # Contents of the rewritten file (deleted tags counted while iterating)
+        deleted_names: list[str] = []
+        contents = XmlHelper.__iterate_rewritten_contents(
+            xml_file_path=xml_file_path,
+            deleted_tags=deleted_tags,
+            added_contents=added_contents,
+            deleted_names=deleted_names
+        )
+        if ExecutionContext.is_simulated_execution():
+            for _ in contents:
+                pass
+        else:
+            XmlHelper.__replace_file(
+                xml_file_path=xml_file_path,
+                contents=contents,
+                encoding='utf-8'
+            )
+
+        return len(deleted_names)
+
+    @staticmethod
+    def __iterate_rewritten_contents(
+        xml_file_path: str,
+        deleted_tags: dict[str, tuple[str, set[str]]],
+        added_contents: list[str],
+        deleted_names: list[str]
+    ) -> Iterator[str]:
+        """Iterate over contents of a rewritten XML file (kept tags children of the root and
+        added contents between the opening and the closing tags of the root), names of deleted
+        tags are added to a list"""
+
+        root_tags = []
+        position = -1
+        for position, node in enumerate(XmlHelper.__iterate_root_children(
+            xml_file_path=xml_file_path,
+            root_tags=root_tags
+        )):
+            # Opening root tag before its first child
+            if position == 0:
+                yield XmlHelper.__build_root_opening_tag(
+                    root=root_tags[0],
+                    declaration=XmlHelper.__DECLARATION
+                )
+
+            key_tag, key_values = deleted_tags.get(node.tag, (None, set()))
+            if key_tag is not None and node.findtext(key_tag) in key_values:
+                deleted_names.append(node.tag)
+                continue
+
+            node.tail = '\n'
+            yield '  ' + ET.tostring(node, encoding="unicode")
+
+        # Root without children
+        if len(root_tags) == 0:
+            raise Exception(f'{xml_file_path} is inconsistent!')
+        if position < 0:
+            yield XmlHelper.__build_root_opening_tag(
+                root=root_tags[0],
+                declaration=XmlHelper.__DECLARATION
+            )
+
+        for content in added_contents:
+            yield f'  {content.strip()}\n'
+        yield f'</{root_tags[0].tag}>\n'
+
+    @staticmethod
+    def __replace_file(xml_file_path: str, contents: Iterator[str], encoding: str) -> int:
+        """Replace a XML file at once by contents written in a temporary file (deleted if
+        failed), return the size of the file written"""
+
+        temporary_file_path = f'{xml_file_path}.tmp'
+        with StorageHelper.get_storage().open_file(
+            temporary_file_path,
+            mode='w',
+            encoding=encoding,
+            newline='\n'
+        ) as file:
+            for content in contents:
+                file.write(content)
+        size = StorageHelper.get_storage().get_size(temporary_file_path)
+
+        if not FileHelper.move_file(
+            source_file_path=temporary_file_path,
+            destination_file_path=xml_file_path
+        ):
+            FileHelper.delete_file(
+                file_path=temporary_file_path
+            )
+
+        return size
+
+    @staticmethod
+    @ExecutionMetrics.measured(phase=MetricsPhase.XML)
+    def compact_tags(
+        xml_file_path: str,
+        tag: str,
+        key_tag: str,
+        is_kept: Callable[[str], bool],
+        space: str = '  '
+    ) -> tuple[int, int, int]:
+        """Compact tags children of the root, keeping the last tag for each value of a child tag
+        if the value is kept, with whitespace normalized (the XML file is parsed and written
+        incrementally for large files, only values are kept in memory), return the count of
+        duplicate tags and stale tags deleted and the size of the compacted file (computed
+        without writing if simulated)"""
+
+        # Do nothing if XML file doesn't exist
+        if not FileHelper.is_file_exists(xml_file_path):
+            return 0, 0, 0
+
+        # Find the position of the last tag for each value and values not kept
+        last_positions, tags_count = XmlHelper.__find_last_positions(
+            xml_file_path=xml_file_path,
+            tag=tag,
+            key_tag=key_tag
+        )
+        stale_values = {
+            key_value for key_value in last_positions if not is_kept(key_value)
+        }
+
+        # Contents of the compacted file
+        declaration, encoding = XmlHelper.__read_declaration(xml_file_path=xml_file_path)
+        contents = XmlHelper.__iterate_compacted_contents(
+            xml_file_path=xml_file_path,
+            tag=tag,
+            key_tag=key_tag,
+            last_positions=last_positions,
+            stale_values=stale_values,
+            declaration=declaration,
+            space=space
+        )
+        if ExecutionContext.is_simulated_execution():
+            return tags_count - len(last_positions), len(stale_values), sum(
+                len(content.encode(encoding, errors='xmlcharrefreplace')) for content in contents
+            )
+
+        # Replace the XML file at once
+        size = XmlHelper.__replace_file(
+            xml_file_path=xml_file_path,
+            contents=contents,
+            encoding=encoding
+        )
+
+        return tags_count - len(last_positions), len(stale_values), size
+
+    @staticmethod
+    def __find_last_positions(
+        xml_file_path: str,
+        tag: str,
+        key_tag: str
+    ) -> tuple[dict[str, int], int]:
+        """Find the position of the last tag children of the root for each value of a child tag,
+        return positions by value and the count of tags"""
+
+        # Initialize result
+        result: dict[str, int] = {}
+
+        tags_count = 0
+        for position, node in enumerate(XmlHelper.__iterate_root_children(
+            xml_file_path=xml_file_path
+        )):
+            if node.tag != tag:
+                continue
+            tags_count += 1
+            key_value = node.findtext(key_tag)
+            result[key_value.strip() if key_value is not None else None] = position
+
+        return result, tags_count
+
+    @staticmethod
+    def __iterate_compacted_contents(
+        xml_file_path: str,
+        tag: str,
+        key_tag: str,
+        last_positions: dict[str, int],
+        stale_values: set[str],
+        declaration: str,
+        space: str
+    ) -> Iterator[str]:
+        """Iterate over contents of a compacted XML file (kept tags children of the root between
+        the opening and the closing tags of the root)"""
+
+        root_tags = []
+        position = -1
+        for position, node in enumerate(XmlHelper.__iterate_root_children(
+            xml_file_path=xml_file_path,
+            root_tags=root_tags
+        )):
+            # Opening root tag before its first child
+            if position == 0:
+                yield XmlHelper.__build_root_opening_tag(
+                    root=root_tags[0],
+                    declaration=declaration
+                )
+
+            if node.tag == tag:
+                key_value = node.findtext(key_tag)
+                key_value = key_value.strip() if key_value is not None else None
+                if last_positions[key_value] != position or key_value in stale_values:
+                    continue
+
+            yield XmlHelper.__build_normalized_tag(node=node, space=space)
+
+        # Root without children
+        if len(root_tags) == 0:
+            raise Exception(f'{xml_file_path} is inconsistent!')
+        if position < 0:
+            yield XmlHelper.__build_root_opening_tag(
+                root=root_tags[0],
+                declaration=declaration
+            )
+        yield f'</{root_tags[0].tag}>\n'
+
+    @staticmethod
+    def __read_declaration(xml_file_path: str) -> tuple[str, str]:
+        """Read the XML declaration of a XML file and its encoding (a declaration in UTF-8 is
+        built if not declared)"""
+
+        with StorageHelper.get_storage().open_file(
+            xml_file_path,
+            mode='r',
+            encoding='latin-1'
+        ) as file:
+            head = file.read(1024).lstrip('\ufeff\xef\xbb\xbf \t\r\n')
+        if not head.startswith('<?xml') or '?>' not in head:
+            return '<?xml version="1.0" encoding="utf-8"?>', 'utf-8'
+
+        declaration = head[:head.index('?>') + 2]
+        match = re.search(r'encoding=["\']([^"\']+)["\']', declaration)
+
+        return declaration, match.group(1) if match is not None else 'utf-8'
+
+    @staticmethod
+    def __build_normalized_tag(node: ET.Element, space: str) -> str:
+        """Build a tag child of the root with whitespace of texts and indentation normalized"""
+
+        for child in node.iter():
+            if len(child) == 0 and child.text is not None:
+                child.text = child.text.strip()
+        ET.indent(node, space=space, level=1)
+        node.tail = '\n'
+
+        return space + ET.tostring(node, encoding="unicode")
+
+    @staticmethod
+    def __build_root_opening_tag(root: ET.Element, declaration: str) -> str:
+        """Build the XML declaration and the opening tag of the root"""
+
+        attributes = ''.join(
+            f' {key}={quoteattr(value)}' for key, value in root.attrib.items()
+        )
+
+        return f'{declaration}\n<{root.tag}{attributes}>\n'
@@ -2,9 +2,12 @@
 """Abstract Manager"""
 
 from abc import ABC, abstractmethod
+import os
 
-from libraries.constants.constants import Media, Platform, Software
+from libraries.constants.constants import Constants, Media, Platform, Software
 from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
 
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-positional-arguments
@@ -41,6 +44,21 @@ class AbstractManager(ABC):
     def retrieve_media_files(self, platform: Platform, game_item: dict) -> dict[Media, str]:
         """Retrieve media files"""
 
+    def retrieve_media_files_many(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, dict[Media, str]]:
+        """Retrieve media files for several games (by game's id)"""
+
+        return {
+            game_item[Constants.UI_TABLE_KEY_COL_ID]: self.retrieve_media_files(
+                platform=platform,
+                game_item=game_item
+            )
+            for game_item in game_items
+        }
+
     @abstractmethod
     def retrieve_rom_file(self, platform: Platform, game_item: dict) -> str:
         """Retrieve rom file"""
@@ -49,9 +67,86 @@ class AbstractManager(ABC):
     def retrieve_game_info(self, platform: Platform, game_item: dict) -> str:
         """Retrieve game info"""
 
+    def retrieve_game_info_many(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, str]:
+        """Retrieve game info for several games (by game's id)"""
+
+        return {
+            game_item[Constants.UI_TABLE_KEY_COL_ID]: self.retrieve_game_info(
+                platform=platform,
+                game_item=game_item
+            )
+            for game_item in game_items
+        }
+
+    # pylint: disable=unused-argument
+    def retrieve_games_info_timestamp(self, platform: Platform) -> float:
+        """Retrieve the last modification's timestamp of games info (None if unknown)"""
+
+        return None
+
+    # pylint: disable=unused-argument
+    def retrieve_games_list_file(self, platform: Platform) -> str:
+        """Retrieve the file listing games of a platform (None if games aren't listed in a
+        file)"""
+
+        return None
+
+    # pylint: disable=unused-argument
+    def compact_games_list(self, platform: Platform) -> tuple[int, int, int]:
+        """Compact the file listing games of a platform (the last entry of a rom is kept, entries
+        without rom are deleted), return the count of duplicate entries and stale entries deleted
+        and the size of the compacted file, None if the file can't be compacted"""
+
+        return None
+
+    # pylint: disable=unused-argument
+    def scan_media(self, platform: Platform) -> tuple[list[str], list[str]]:
+        """Scan media files of a platform in one pass, return media files referenced by no game
+        (orphaned) and media files referenced by games but not found (missing), None if media
+        can't be scanned"""
+
+        return None
+
+    @staticmethod
+    def _compare_media_files(
+        referenced_files: set[str],
+        media_files: set[str],
+        unresolved_names: set[str] = None
+    ) -> tuple[list[str], list[str]]:
+        """Compare media files referenced by games with media files found in media's folders,
+        return orphaned and missing media files (only files not found are looked up, media files
+        named as a file whose path isn't resolved are never orphaned)"""
+
+        # Index files by their normalized path
+        referenced_paths = {
+            os.path.normcase(os.path.normpath(file_path)): file_path
+            for file_path in referenced_files
+        }
+        media_paths = {
+            os.path.normcase(os.path.normpath(file_path)): file_path
+            for file_path in media_files
+            if unresolved_names is None or os.path.basename(file_path) not in unresolved_names
+        }
+
+        return sorted(
+            media_paths[path] for path in media_paths.keys() - referenced_paths.keys()
+        ), sorted(
+            referenced_paths[path] for path in referenced_paths.keys() - media_paths.keys()
+            if not FileHelper.is_file_exists(referenced_paths[path])
+        )
+
     @abstractmethod
-    def uninstall_game(self, platform: Platform, game_item: dict) -> bool:
-        """Uninstall game"""
+    def uninstall_game(
+        self,
+        platform: Platform,
+        game_item: dict,
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall game with the components of an execution context"""
 
     @abstractmethod
     def install_game(
@@ -60,6 +155,56 @@ class AbstractManager(ABC):
         game_item: dict,
         media_files: dict[Media, str],
         game_info_files: dict[Software, str],
-        rom_file: str
+        rom_file: str,
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Install game with the specified media files, game info files and rom file (with the
+        components of an execution context)"""
+
+    def uninstall_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall games with the components of an execution context"""
+
+        # Initialize result
+        result = True
+
+        for game_item in game_items:
+            result = self.uninstall_game(
+                platform=platform,
+                game_item=game_item,
+                execution_context=execution_context
+            ) and result
+
+        return result
+
+    def install_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        media_files: dict[str, dict[Media, str]],
+        game_info_files: dict[str, dict[Software, str]],
+        rom_files: dict[str, str],
+        execution_context: ExecutionContext
     ) -> bool:
-        """Install game with the specified media files, game info files and rom file"""
+        """Install games with the specified media files, game info files and rom files by game's
+        id (with the components of an execution context)"""
+
+        # Initialize result
+        result = True
+
+        for game_item in game_items:
+            game_id = game_item[Constants.UI_TABLE_KEY_COL_ID]
+            result = self.install_game(
+                platform=platform,
+                game_item=game_item,
+                media_files=media_files.get(game_id, {}),
+                game_info_files=game_info_files.get(game_id, {}),
+                rom_file=rom_files.get(game_id, None),
+                execution_context=execution_context
+            ) and result
+
+        return result
@@ -1,7 +1,12 @@
 #!/usr/bin/python3
 """Manager for the Software EMU_MOVIES"""
 
-from libraries.constants.constants import Media, Platform, Software
+import os
+
+from libraries.constants.constants import Component, Constants, Media, Platform, Software
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
+from libraries.index.folder_index import FolderIndex
 from manager.abstract_manager import AbstractManager
 
 # pylint: disable=too-many-arguments
@@ -32,6 +37,41 @@ class EmuMoviesManager(AbstractManager):
         'megadrive': Platform.SEGA_MEGADRIVE
     }
 
+    __PLATFORM_DICT_INV = {v: k for k, v in __PLATFORM_DICT.items()}
+
+    def __init__(self):
+        """Initialize Manager"""
+
+        super().__init__()
+
+        # Indexes of media's folders (media packs are big flat folders)
+        self.__media_indexes: dict[str, FolderIndex] = {}
+
+    def __list_media_indexes(self, platform: Platform) -> list[tuple[Media, FolderIndex]]:
+        """List media with the refreshed index of their folder for a platform (only folders
+        modified since the last refresh are scanned again)"""
+
+        # Initialize result
+        result: list[tuple[Media, FolderIndex]] = []
+
+        for folder, media in self.__MEDIA_DICT.items():
+            folder_path = os.path.join(
+                self._folder_path,
+                self.__PLATFORM_DICT_INV.get(platform, ''),
+                folder
+            )
+            if not FileHelper.is_folder_exists(folder_path=folder_path):
+                continue
+
+            if folder_path not in self.__media_indexes:
+                self.__media_indexes[folder_path] = FolderIndex(
+                    folder_path=folder_path
+                )
+            self.__media_indexes[folder_path].refresh()
+            result.append((media, self.__media_indexes[folder_path]))
+
+        return result
+
     def get_enum(self) -> Software:
         """Get enum"""
 
@@ -40,48 +80,111 @@ class EmuMoviesManager(AbstractManager):
     def list_platforms(self) -> list[Platform]:
         """List platforms"""
 
-        return []
+        # Initialize result
+        result: list[Platform] = []
+
+        # Add platforms linked to a sub directory
+        for folder in FileHelper.list_sub_directories(
+            folder_path=self._folder_path
+        ):
+            platform = self.__PLATFORM_DICT.get(folder, None)
+            if platform is not None:
+                result.append(platform)
+
+        return result
 
     def list_games_with_rom(self, platform: Platform) -> dict[str, str]:
-        """List games in a dictionary where the key is the rom and the value is the name"""
+        """List games in a dictionary where the key is the rom and the value is the name (EmuMovies
+        has no roms, games are the names of media files)"""
+
+        # Initialize result
+        result: dict[str, str] = {}
 
-        print(platform)
+        for _, media_index in self.__list_media_indexes(platform=platform):
+            for file_path in media_index.list_files().values():
+                name = FileHelper.retrieve_file_basename(file_path)
+                result.setdefault(name, name)
 
-        return {}
+        return result
 
     def retrieve_media_files(self, platform: Platform, game_item: dict) -> dict[Media, str]:
         """Retrieve media files"""
 
-        print(platform)
-        print(game_item)
-        print(self.__MEDIA_DICT)
-        print(self.__PLATFORM_DICT)
+        return self.retrieve_media_files_many(
+            platform=platform,
+            game_items=[game_item]
+        )[game_item[Constants.UI_TABLE_KEY_COL_ID]]
 
-        return {}
+    def retrieve_media_files_many(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, dict[Media, str]]:
+        """Retrieve media files for several games (by game's id) from indexes of media's folders
+        (the first folder found is kept for a media)"""
 
-    def retrieve_rom_file(self, platform: Platform, game_item: dict) -> str:
-        """Retrieve rom file"""
+        # Initialize result
+        result: dict[str, dict[Media, str]] = {
+            game_item[Constants.UI_TABLE_KEY_COL_ID]: {} for game_item in game_items
+        }
 
-        print(platform)
-        print(game_item)
+        for media, media_index in self.__list_media_indexes(platform=platform):
+            for game_item in game_items:
+                media_files = result[game_item[Constants.UI_TABLE_KEY_COL_ID]]
+                if media in media_files:
+                    continue
+                media_file = media_index.find(
+                    file_name=game_item[Constants.UI_TABLE_KEY_COL_ROM]
+                )
+                if media_file is not None:
+                    media_files[media] = media_file
 
-        return ''
+        return result
 
-    def retrieve_game_info(self, platform: Platform, game_item: dict) -> str:
-        """Retrieve game info"""
+    def retrieve_rom_file(self, platform: Platform, game_item: dict) -> str:
+        """Retrieve rom file (EmuMovies has no roms)"""
 
-        print(platform)
-        print(game_item)
+        return None
+
+    def retrieve_game_info(self, platform: Platform, game_item: dict) -> str:
+        """Retrieve game info (EmuMovies has no game info)"""
 
         return ''
 
-    def uninstall_game(self, platform: Platform, game_item: dict) -> bool:
-        """Uninstall game"""
+    def uninstall_game(
+        self,
+        platform: Platform,
+        game_item: dict,
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall game with the components of an execution context"""
+
+        return self.uninstall_games(
+            platform=platform,
+            game_items=[game_item],
+            execution_context=execution_context
+        )
+
+    def uninstall_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall games with the components of an execution context (only media)"""
 
-        print(platform)
-        print(game_item)
+        # Delete media files
+        if Component.MEDIA in execution_context.components:
+            for media_files in self.retrieve_media_files_many(
+                platform=platform,
+                game_items=game_items
+            ).values():
+                for media_file in media_files.values():
+                    FileHelper.delete_file(
+                        file_path=media_file
+                    )
 
-        return False
+        return True
 
     def install_game(
         self,
@@ -89,14 +192,73 @@ class EmuMoviesManager(AbstractManager):
         game_item: dict,
         media_files: dict[Media, str],
         game_info_files: dict[Software, str],
-        rom_file: str
+        rom_file: str,
+        execution_context: ExecutionContext
     ) -> bool:
-        """Install game with the specified media files, game info files and rom file"""
+        """Install game with the specified media files, game info files and rom file (with the
+        components of an execution context)"""
+
+        game_id = game_item[Constants.UI_TABLE_KEY_COL_ID]
+
+        return self.install_games(
+            platform=platform,
+            game_items=[game_item],
+            media_files={game_id: media_files},
+            game_info_files={game_id: game_info_files},
+            rom_files={game_id: rom_file},
+            execution_context=execution_context
+        )
+
+    def install_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        media_files: dict[str, dict[Media, str]],
+        game_info_files: dict[str, dict[Software, str]],
+        rom_files: dict[str, str],
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Install games with the specified media files by game's id (only media, with the
+        components of an execution context)"""
+
+        # Uninstall before installing
+        self.uninstall_games(
+            platform=platform,
+            game_items=game_items,
+            execution_context=execution_context
+        )
+
+        if Component.MEDIA not in execution_context.components:
+            return True
+
+        # Retrieve the folder of each media (the first one if several)
+        media_folders: dict[Media, str] = {}
+        for folder, media in self.__MEDIA_DICT.items():
+            media_folders.setdefault(
+                media,
+                os.path.join(
+                    self._folder_path,
+                    self.__PLATFORM_DICT_INV.get(platform, ''),
+                    folder
+                )
+            )
 
-        print(platform)
-        print(game_item)
-        print(media_files)
-        print(game_info_files)
-        print(rom_file)
+        # Copy media files named like the rom
+        for game_item in game_items:
+            for media, media_file in media_files.get(
+                game_item[Constants.UI_TABLE_KEY_COL_ID],
+                {}
+            ).items():
+                if media not in media_folders:
+                    continue
+                FileHelper.copy_file(
+                    source_file_path=media_file,
+                    destination_file_path=os.path.join(
+                        media_folders[media],
+                        FileHelper.retrieve_file_basename(
+                            game_item[Constants.UI_TABLE_KEY_COL_ROM]
+                        ) + FileHelper.retrieve_file_extension(media_file)
+                    )
+                )
 
-        return False
+        return True
@@ -1,24 +1,294 @@
 #!/usr/bin/python3
 """Manager for the Software LAUNCHBOX"""
 
-from libraries.constants.constants import Media, Platform, Software
+import os
+import re
+import uuid
+import xml.etree.ElementTree as ET
+
+from libraries.constants.constants import Component, Constants, Media, Platform, Software
+from libraries.context.execution_context import ExecutionContext
+from libraries.file.file_helper import FileHelper
+from libraries.xml.xml_helper import XmlHelper
 from manager.abstract_manager import AbstractManager
 
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-locals
 
 
 class LaunchboxManager(AbstractManager):
     """Manager for the Software LAUNCHBOX"""
 
+    __PATH_PLATFORMS = os.path.join('Data', 'Platforms')
+    __PATH_GAMES = 'Games'
+    __PATH_IMAGES = 'Images'
+    __PATH_VIDEOS = 'Videos'
+    __PATH_MANUALS = 'Manuals'
+
+    __TAG_GAME = 'Game'
+    __TAG_ADDITIONAL_APPLICATION = 'AdditionalApplication'
+    __TAG_ALTERNATE_NAME = 'AlternateName'
+    __TAG_ID = 'ID'
+    __TAG_ADDITIONAL_APPLICATION_GAME_ID = 'GameID'
+    __TAG_ALTERNATE_NAME_GAME_ID = 'GameId'
+    __TAG_TITLE = 'Title'
+    __TAG_APPLICATION_PATH = 'ApplicationPath'
+    __TAG_PLATFORM = 'Platform'
+
+    __PATH_SEPARATOR = '\\'
+    __MEDIA_SUFFIX = '-01'
+
+    # Characters replaced by LaunchBox in media's file names
+    __MEDIA_NAME_INVALID_CHARACTERS = re.compile(r'[\\/:*?"<>|\']')
+
     __MEDIA_DICT = {
+        'Box - Front': Media.BOX_2D_FRONT,
+        'Box - Spine': Media.BOX_2D_SIDE,
+        'Box - Back': Media.BOX_2D_BACK,
+        'Box - 3D': Media.BOX_3D,
+        'Cart - Front': Media.SUPPORT,
+        'Disc': Media.SUPPORT,
+        'Fanart - Background': Media.FAN_ART,
+        'Screenshot - Gameplay': Media.SCREENSHOT_GAME,
+        'Screenshot - Game Title': Media.SCREENSHOT_TITLE,
+        'Clear Logo': Media.LOGO,
+        'Arcade - Marquee': Media.LOGO
     }
 
     __PLATFORM_DICT = {
+        'Microsoft Xbox 360': Platform.MICROSOFT_XBOX360,
+        'Nintendo 64': Platform.NINTENDO_64,
+        'Nintendo GameCube': Platform.NINTENDO_GAME_CUBE,
+        'Sega Dreamcast': Platform.SEGA_DREAMCAST,
         'Sega Master System': Platform.SEGA_MASTERSYSTEM,
-        'MegaDrive': Platform.SEGA_MEGADRIVE
+        'MegaDrive': Platform.SEGA_MEGADRIVE,
+        'Sony Playstation 2': Platform.SONY_PLAYSTATION_2
     }
 
+    __PLATFORM_DICT_INV = {v: k for k, v in __PLATFORM_DICT.items()}
+
+    def __retrieve_platform_xml_path(self, platform: Platform) -> str:
+        """Retrieve the path for XML file of a platform"""
+
+        return os.path.join(
+            self._folder_path,
+            self.__PATH_PLATFORMS,
+            f'{self.__PLATFORM_DICT_INV.get(platform, "")}{Constants.XML_EXTENSION}'
+        )
+
+    def __retrieve_application_file(self, application_path: str) -> str:
+        """Retrieve the file of an application's path (relative to LaunchBox if not absolute)"""
+
+        return os.path.normpath(
+            os.path.join(
+                self._folder_path,
+                application_path.replace(self.__PATH_SEPARATOR, os.sep)
+            )
+        )
+
+    def __find_games(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, dict[str, str]]:
+        """Find games' data (id, title and application's path) by game's id with one pass over
+        the XML file of the platform"""
+
+        # Initialize result
+        result: dict[str, dict[str, str]] = {}
+
+        # Retrieve games' ids by rom
+        games_ids_by_rom = {
+            game_item[Constants.UI_TABLE_KEY_COL_ROM]: game_item[Constants.UI_TABLE_KEY_COL_ID]
+            for game_item in game_items
+        }
+        if len(games_ids_by_rom) == 0:
+            return result
+
+        for game_data in XmlHelper.iterate_tags_data(
+            xml_file_path=self.__retrieve_platform_xml_path(
+                platform=platform
+            ),
+            tag=self.__TAG_GAME,
+            fields=[
+                self.__TAG_ID,
+                self.__TAG_TITLE,
+                self.__TAG_APPLICATION_PATH
+            ]
+        ):
+            if game_data[self.__TAG_APPLICATION_PATH] is None:
+                continue
+            rom = FileHelper.retrieve_file_name(
+                self.__retrieve_application_file(
+                    application_path=game_data[self.__TAG_APPLICATION_PATH]
+                )
+            )
+            game_id = games_ids_by_rom.pop(rom, None)
+            if game_id is not None:
+                result[game_id] = game_data
+
+            # Stop when all games are found
+            if len(games_ids_by_rom) == 0:
+                break
+
+        return result
+
+    def __build_media_name(self, title: str) -> str:
+        """Build the name of media files for a game's title"""
+
+        return self.__MEDIA_NAME_INVALID_CHARACTERS.sub('_', title) + self.__MEDIA_SUFFIX
+
+    def __list_media_folders(self, platform: Platform) -> list[tuple[Media, str]]:
+        """List media with their folder for a platform"""
+
+        platform_name = self.__PLATFORM_DICT_INV.get(platform, '')
+
+        # Add a folder for each type of image
+        result = [
+            (
+                media,
+                os.path.join(
+                    self._folder_path,
+                    self.__PATH_IMAGES,
+                    platform_name,
+                    folder
+                )
+            )
+            for folder, media in self.__MEDIA_DICT.items()
+        ]
+
+        # Add folders for videos and manuals
+        result.append((
+            Media.VIDEO,
+            os.path.join(self._folder_path, self.__PATH_VIDEOS, platform_name)
+        ))
+        result.append((
+            Media.MANUAL,
+            os.path.join(self._folder_path, self.__PATH_MANUALS, platform_name)
+        ))
+
+        return result
+
+    def __retrieve_games_media_files(
+        self,
+        platform: Platform,
+        games: dict[str, dict[str, str]]
+    ) -> dict[str, dict[Media, str]]:
+        """Retrieve media files for found games with one walk of each media's folder"""
+
+        # Initialize result
+        result: dict[str, dict[Media, str]] = {game_id: {} for game_id in games}
+        if len(games) == 0:
+            return result
+
+        for media, folder_path in self.__list_media_folders(platform=platform):
+            # Index media's folder (with its regions' sub folders)
+            relative_paths_by_name = FileHelper.index_relative_paths(
+                folder_path=folder_path
+            )
+            if len(relative_paths_by_name) == 0:
+                continue
+
+            for game_id, game_data in games.items():
+                # Keep the first media found (if several folders for the media)
+                if media in result[game_id] or game_data[self.__TAG_TITLE] is None:
+                    continue
+
+                relative_paths = relative_paths_by_name.get(
+                    self.__build_media_name(
+                        title=game_data[self.__TAG_TITLE]
+                    ),
+                    []
+                )
+                if len(relative_paths) == 0:
+                    continue
+
+                result[game_id][media] = os.path.join(
+                    folder_path,
+                    relative_paths[0]
+                )
+
+        return result
+
+    def __delete_games_files(
+        self,
+        platform: Platform,
+        games: dict[str, dict[str, str]],
+        components: tuple[Component, ...]
+    ):
+        """Delete media and rom files of found games depending on components"""
+
+        # Delete media files
+        if Component.MEDIA in components:
+            for media_files in self.__retrieve_games_media_files(
+                platform=platform,
+                games=games
+            ).values():
+                for media_file in media_files.values():
+                    FileHelper.delete_file(
+                        file_path=media_file
+                    )
+
+        # Delete rom files
+        if Component.ROM in components:
+            for game_data in games.values():
+                FileHelper.delete_file(
+                    file_path=self.__retrieve_application_file(
+                        application_path=game_data[self.__TAG_APPLICATION_PATH]
+                    )
+                )
+
+    def __rewrite_games(
+        self,
+        platform: Platform,
+        deleted_games: dict[str, dict[str, str]],
+        added_games_info: list[str],
+        replaced: bool = False
+    ):
+        """Delete games (with their additional applications and alternate names unless they're
+        replaced by games with the same id) and add games in the XML file of the platform
+        (written once)"""
+
+        if len(deleted_games) == 0 and len(added_games_info) == 0:
+            return
+
+        # Create the XML file if it doesn't exist
+        platform_xml_path = self.__retrieve_platform_xml_path(
+            platform=platform
+        )
+        if not FileHelper.is_file_exists(platform_xml_path):
+            if len(added_games_info) == 0:
+                return
+            FileHelper.create_folder(
+                folder_path=os.path.dirname(platform_xml_path)
+            )
+            FileHelper.write_file(
+                file_path=platform_xml_path,
+                content='<?xml version="1.0" standalone="yes"?>\n<LaunchBox>\n</LaunchBox>\n'
+            )
+
+        deleted_ids = {
+            game_data[self.__TAG_ID] for game_data in deleted_games.values()
+        }
+        deleted_tags = {
+            self.__TAG_GAME: (self.__TAG_ID, deleted_ids)
+        }
+        if not replaced:
+            deleted_tags[self.__TAG_ADDITIONAL_APPLICATION] = (
+                self.__TAG_ADDITIONAL_APPLICATION_GAME_ID,
+                deleted_ids
+            )
+            deleted_tags[self.__TAG_ALTERNATE_NAME] = (
+                self.__TAG_ALTERNATE_NAME_GAME_ID,
+                deleted_ids
+            )
+        XmlHelper.rewrite_tags(
+            xml_file_path=platform_xml_path,
+            deleted_tags=deleted_tags,
+            added_contents=added_games_info
+        )
+
     def get_enum(self) -> Software:
         """Get enum"""
 
@@ -27,48 +297,210 @@ class LaunchboxManager(AbstractManager):
     def list_platforms(self) -> list[Platform]:
         """List platforms"""
 
-        return []
+        # Initialize result
+        result: list[Platform] = []
+
+        # Add platforms linked to a XML file
+        for file_name in FileHelper.list_sub_directories(
+            folder_path=os.path.join(
+                self._folder_path,
+                self.__PATH_PLATFORMS
+            )
+        ):
+            platform = self.__PLATFORM_DICT.get(
+                FileHelper.retrieve_file_basename(file_name),
+                None
+            )
+            if platform is not None:
+                result.append(platform)
+
+        return result
 
     def list_games_with_rom(self, platform: Platform) -> dict[str, str]:
         """List games in a dictionary where the key is the rom and the value is the name"""
 
-        print(platform)
+        # Initialize result
+        result: dict[str, str] = {}
+
+        # Add games whose rom file exists (XML file parsed incrementally)
+        for game_data in XmlHelper.iterate_tags_data(
+            xml_file_path=self.__retrieve_platform_xml_path(
+                platform=platform
+            ),
+            tag=self.__TAG_GAME,
+            fields=[
+                self.__TAG_TITLE,
+                self.__TAG_APPLICATION_PATH
+            ]
+        ):
+            if game_data[self.__TAG_APPLICATION_PATH] is None:
+                continue
+            rom_file = self.__retrieve_application_file(
+                application_path=game_data[self.__TAG_APPLICATION_PATH]
+            )
+            if FileHelper.is_file_exists(rom_file):
+                result[FileHelper.retrieve_file_name(rom_file)] = \
+                    game_data[self.__TAG_TITLE] or ''
 
-        return {}
+        return result
 
     def retrieve_media_files(self, platform: Platform, game_item: dict) -> dict[Media, str]:
         """Retrieve media files"""
 
-        print(platform)
-        print(game_item)
-        print(self.__MEDIA_DICT)
-        print(self.__PLATFORM_DICT)
+        return self.retrieve_media_files_many(
+            platform=platform,
+            game_items=[game_item]
+        )[game_item[Constants.UI_TABLE_KEY_COL_ID]]
 
-        return {}
+    def retrieve_media_files_many(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, dict[Media, str]]:
+        """Retrieve media files for several games (by game's id) with one pass over the XML file
+        and one walk of each media's folder"""
+
+        # Initialize result
+        result: dict[str, dict[Media, str]] = {
+            game_item[Constants.UI_TABLE_KEY_COL_ID]: {} for game_item in game_items
+        }
+
+        result.update(
+            self.__retrieve_games_media_files(
+                platform=platform,
+                games=self.__find_games(
+                    platform=platform,
+                    game_items=game_items
+                )
+            )
+        )
+
+        return result
 
     def retrieve_rom_file(self, platform: Platform, game_item: dict) -> str:
         """Retrieve rom file"""
 
-        print(platform)
-        print(game_item)
+        game_data = self.__find_games(
+            platform=platform,
+            game_items=[game_item]
+        ).get(game_item[Constants.UI_TABLE_KEY_COL_ID], None)
+        if game_data is None:
+            return None
+
+        # Check that rom file exists
+        result = self.__retrieve_application_file(
+            application_path=game_data[self.__TAG_APPLICATION_PATH]
+        )
+        if not FileHelper.is_file_exists(result):
+            return None
 
-        return ''
+        return result
 
     def retrieve_game_info(self, platform: Platform, game_item: dict) -> str:
         """Retrieve game info"""
 
-        print(platform)
-        print(game_item)
+        return self.retrieve_game_info_many(
+            platform=platform,
+            game_items=[game_item]
+        )[game_item[Constants.UI_TABLE_KEY_COL_ID]]
+
+    def retrieve_game_info_many(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, str]:
+        """Retrieve game info for several games (by game's id) with two passes over the XML file
+        (only found games are kept in memory)"""
+
+        # Initialize result
+        result: dict[str, str] = {
+            game_item[Constants.UI_TABLE_KEY_COL_ID]: '' for game_item in game_items
+        }
+
+        # Retrieve content of found games
+        games = self.__find_games(
+            platform=platform,
+            game_items=game_items
+        )
+        if len(games) == 0:
+            return result
+        games_content = XmlHelper.retrieve_tags_content(
+            xml_file_path=self.__retrieve_platform_xml_path(
+                platform=platform
+            ),
+            tag=self.__TAG_GAME,
+            key_tag=self.__TAG_ID,
+            key_values=[game_data[self.__TAG_ID] for game_data in games.values()]
+        )
+
+        for game_id, game_data in games.items():
+            game_content = games_content.get(game_data[self.__TAG_ID], None)
+            if game_content is None:
+                continue
 
-        return ''
+            # Filter out lines specific to the installation
+            lines = [
+                line for line in game_content.splitlines()
+                if line.strip() != '' and not any(
+                    line.strip().startswith(f'<{tag}>') or line.strip() == f'<{tag} />'
+                    for tag in [self.__TAG_ID, self.__TAG_APPLICATION_PATH]
+                )
+            ]
 
-    def uninstall_game(self, platform: Platform, game_item: dict) -> bool:
-        """Uninstall game"""
+            # Add 2 spaces to the first line if any lines exist
+            if lines:
+                lines[0] = '  ' + lines[0]
+
+            result[game_id] = '\n'.join(lines)
+
+        return result
+
+    def uninstall_game(
+        self,
+        platform: Platform,
+        game_item: dict,
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall game with the components of an execution context"""
+
+        return self.uninstall_games(
+            platform=platform,
+            game_items=[game_item],
+            execution_context=execution_context
+        )
+
+    def uninstall_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall games with the components of an execution context (the XML file of the
+        platform is parsed and written incrementally)"""
 
-        print(platform)
-        print(game_item)
+        # Retrieve components and games
+        components = execution_context.components
+        games = self.__find_games(
+            platform=platform,
+            game_items=game_items
+        )
 
-        return False
+        # Delete files
+        self.__delete_games_files(
+            platform=platform,
+            games=games,
+            components=components
+        )
+
+        # Delete games' entries
+        if Component.ROM in components:
+            self.__rewrite_games(
+                platform=platform,
+                deleted_games=games,
+                added_games_info=[]
+            )
+
+        return True
 
     def install_game(
         self,
@@ -76,14 +508,146 @@ class LaunchboxManager(AbstractManager):
         game_item: dict,
         media_files: dict[Media, str],
         game_info_files: dict[Software, str],
-        rom_file: str
+        rom_file: str,
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Install game with the specified media files, game info files and rom file (with the
+        components of an execution context)"""
+
+        game_id = game_item[Constants.UI_TABLE_KEY_COL_ID]
+
+        return self.install_games(
+            platform=platform,
+            game_items=[game_item],
+            media_files={game_id: media_files},
+            game_info_files={game_id: game_info_files},
+            rom_files={game_id: rom_file},
+            execution_context=execution_context
+        )
+
+    def install_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        media_files: dict[str, dict[Media, str]],
+        game_info_files: dict[str, dict[Software, str]],
+        rom_files: dict[str, str],
+        execution_context: ExecutionContext
     ) -> bool:
-        """Install game with the specified media files, game info files and rom file"""
+        """Install games with the specified media files, game info files and rom files by game's
+        id (with the components of an execution context, the XML file of the platform is parsed
+        and written incrementally once)"""
+
+        # Retrieve components and installed games
+        components = execution_context.components
+        games = self.__find_games(
+            platform=platform,
+            game_items=game_items
+        )
+
+        # Uninstall files before installing
+        self.__delete_games_files(
+            platform=platform,
+            games=games,
+            components=components
+        )
+
+        # Install files of games and build their game info
+        games_info = []
+        for game_item in game_items:
+            game_id = game_item[Constants.UI_TABLE_KEY_COL_ID]
+            games_info.append(
+                self.__install_game_files(
+                    platform=platform,
+                    game_item=game_item,
+                    media_files=media_files.get(game_id, {}),
+                    game_info_file=game_info_files.get(game_id, {}).get(
+                        Software.LAUNCHBOX,
+                        None
+                    ),
+                    rom_file=rom_files.get(game_id, None),
+                    components=components,
+                    launchbox_id=games.get(game_id, {}).get(self.__TAG_ID, None)
+                )
+            )
+
+        # Replace games' entries (installed games keep their id)
+        if Component.ROM in components:
+            self.__rewrite_games(
+                platform=platform,
+                deleted_games=games,
+                added_games_info=games_info,
+                replaced=True
+            )
+
+        return True
+
+    def __install_game_files(
+        self,
+        platform: Platform,
+        game_item: dict,
+        media_files: dict[Media, str],
+        game_info_file: str,
+        rom_file: str,
+        components: tuple[Component, ...],
+        launchbox_id: str = None
+    ) -> str:
+        """Install rom and media files of a game and build its game info (from LaunchBox's game
+        info if any, with the id of its installed entry if any or a new id)"""
+
+        platform_name = self.__PLATFORM_DICT_INV.get(platform, '')
+
+        # Build the game's entry from its game info (or from its name if no game info)
+        if game_info_file is not None:
+            game_node = ET.fromstring(FileHelper.read_file(game_info_file))
+        else:
+            game_node = ET.Element(self.__TAG_GAME)
+            ET.SubElement(game_node, self.__TAG_TITLE).text = \
+                game_item[Constants.UI_TABLE_KEY_COL_NAME]
+        title = game_node.findtext(self.__TAG_TITLE) or \
+            game_item[Constants.UI_TABLE_KEY_COL_NAME]
+
+        # Copy the rom
+        rom_file_name = FileHelper.retrieve_file_name(rom_file)
+        if Component.ROM in components:
+            FileHelper.copy_file(
+                source_file_path=rom_file,
+                destination_file_path=os.path.join(
+                    self._folder_path,
+                    self.__PATH_GAMES,
+                    platform_name,
+                    rom_file_name
+                )
+            )
+
+        # Copy media files (in the first folder of each media)
+        if Component.MEDIA in components:
+            media_folders: dict[Media, str] = {}
+            for media, folder_path in self.__list_media_folders(platform=platform):
+                media_folders.setdefault(media, folder_path)
+            for media, media_file in media_files.items():
+                if media not in media_folders:
+                    continue
+                FileHelper.copy_file(
+                    source_file_path=media_file,
+                    destination_file_path=os.path.join(
+                        media_folders[media],
+                        self.__build_media_name(title=title) +
+                        FileHelper.retrieve_file_extension(media_file)
+                    )
+                )
+
+        # Replace fields specific to the installation
+        for tag in [self.__TAG_ID, self.__TAG_APPLICATION_PATH, self.__TAG_PLATFORM]:
+            for node in game_node.findall(tag):
+                game_node.remove(node)
+        ET.SubElement(game_node, self.__TAG_ID).text = launchbox_id or str(uuid.uuid4())
+        ET.SubElement(game_node, self.__TAG_APPLICATION_PATH).text = self.__PATH_SEPARATOR.join(
+            [self.__PATH_GAMES, platform_name, rom_file_name]
+        )
+        ET.SubElement(game_node, self.__TAG_PLATFORM).text = platform_name
 
-        print(platform)
-        print(game_item)
-        print(media_files)
-        print(game_info_files)
-        print(rom_file)
+        ET.indent(game_node, space='  ', level=1)
+        game_node.tail = None
 
-        return False
+        return ET.tostring(game_node, encoding='unicode')
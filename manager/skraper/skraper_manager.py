@@ -2,8 +2,9 @@
 """Manager for the Software SKRAPER"""
 
 import os
+from pathlib import PureWindowsPath
 from libraries.constants.constants import Component, Constants, Media, Platform, Software
-from libraries.context.context import Context
+from libraries.context.execution_context import ExecutionContext
 from libraries.file.file_helper import FileHelper
 from libraries.xml.xml_helper import XmlHelper
 from manager.abstract_manager import AbstractManager
@@ -86,13 +87,25 @@ class SkraperManager(AbstractManager):
             self.__PATH_GAMELIST
         )
 
-    def __build_game_criteria(self, game_item: dict) -> dict[str, str]:
-        """Build criteria to find a game"""
+    def __build_game_path(self, game_item: dict) -> str:
+        """Build the path identifying a game in the XML file listing games"""
 
-        return {
-            self.__TAG_PATH: self.__FILE_PREFIX +
-            game_item[Constants.UI_TABLE_KEY_COL_ROM]
-        }
+        return self.__FILE_PREFIX + game_item[Constants.UI_TABLE_KEY_COL_ROM]
+
+    def __delete_games_entries(self, platform: Platform, game_items: list[dict]):
+        """Delete games' entries from the XML file listing games (written once)"""
+
+        XmlHelper.delete_tags(
+            xml_file_path=self.__retrieve_game_list_xml_path(
+                platform=platform
+            ),
+            parent_tag=self.__TAG_GAMES,
+            tag=self.__TAG_GAME,
+            key_tag=self.__TAG_PATH,
+            key_values=[
+                self.__build_game_path(game_item) for game_item in game_items
+            ]
+        )
 
     def get_enum(self) -> Software:
         """Get enum"""
@@ -172,8 +185,23 @@ class SkraperManager(AbstractManager):
     def retrieve_media_files(self, platform: Platform, game_item: dict) -> dict[Media, str]:
         """Retrieve media files"""
 
+        return self.retrieve_media_files_many(
+            platform=platform,
+            game_items=[game_item]
+        )[game_item[Constants.UI_TABLE_KEY_COL_ID]]
+
+    def retrieve_media_files_many(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, dict[Media, str]]:
+        """Retrieve media files for several games (by game's id) with one walk of each media's
+        folder"""
+
         # Initialize result
-        result: dict[Media, str] = {}
+        result: dict[str, dict[Media, str]] = {
+            game_item[Constants.UI_TABLE_KEY_COL_ID]: {} for game_item in game_items
+        }
 
         # Retrieve media's path
         media_path = os.path.join(
@@ -182,7 +210,7 @@ class SkraperManager(AbstractManager):
             self.__MEDIA_PATH
         )
 
-        # Add media for the game
+        # Add media for the games
         for folder in FileHelper.list_sub_directories(
             folder_path=media_path
         ):
@@ -190,28 +218,152 @@ class SkraperManager(AbstractManager):
             if media is None:
                 continue
 
-            relative_paths = FileHelper.list_relative_paths(
+            relative_paths_by_name = FileHelper.index_relative_paths(
                 folder_path=os.path.join(
                     media_path,
                     folder
-                ),
-                file_name=FileHelper.retrieve_file_basename(
-                    game_item[Constants.UI_TABLE_KEY_COL_ID]
-                ),
-                error_if_not_found=False
+                )
             )
 
-            if len(relative_paths) == 0:
-                continue
+            for game_item in game_items:
+                relative_paths = relative_paths_by_name.get(
+                    FileHelper.retrieve_file_basename(
+                        game_item[Constants.UI_TABLE_KEY_COL_ID]
+                    ),
+                    []
+                )
 
-            result[media] = os.path.join(
-                media_path,
-                folder,
-                relative_paths[0]
-            )
+                if len(relative_paths) == 0:
+                    continue
+
+                result[game_item[Constants.UI_TABLE_KEY_COL_ID]][media] = os.path.join(
+                    media_path,
+                    folder,
+                    relative_paths[0]
+                )
 
         return result
 
+    def retrieve_games_list_file(self, platform: Platform) -> str:
+        """Retrieve the file listing games of a platform (None if games aren't listed in a
+        file)"""
+
+        return self.__retrieve_game_list_xml_path(
+            platform=platform
+        )
+
+    def __resolve_file_path(self, platform_folder_path: str, file_path: str) -> str:
+        """Resolve the path of a file in the XML file listing games, relative to the platform's
+        folder or absolute (None if not resolved)"""
+
+        if file_path is None:
+            return None
+
+        file_path = file_path.strip()
+        if file_path.startswith(self.__FILE_PREFIX):
+            return os.path.join(
+                platform_folder_path,
+                *file_path[len(self.__FILE_PREFIX):].split(self.__PATH_SEPARATOR)
+            )
+        if os.path.isabs(file_path):
+            return file_path
+
+        return None
+
+    def __is_rom_existing(self, platform_folder_path: str, rom_path: str) -> bool:
+        """Specify if the rom of an entry in the XML file listing games exists (file or folder,
+        a rom whose path isn't resolved is considered existing)"""
+
+        if rom_path is None:
+            return False
+        rom_file = self.__resolve_file_path(
+            platform_folder_path=platform_folder_path,
+            file_path=rom_path
+        )
+        if rom_file is None:
+            return True
+
+        return FileHelper.is_file_exists(rom_file) or FileHelper.is_folder_exists(rom_file)
+
+    def compact_games_list(self, platform: Platform) -> tuple[int, int, int]:
+        """Compact the file listing games of a platform (the last entry of a rom is kept, entries
+        without rom are deleted), return the count of duplicate entries and stale entries deleted
+        and the size of the compacted file, None if the file can't be compacted"""
+
+        game_list_xml_path = self.__retrieve_game_list_xml_path(
+            platform=platform
+        )
+        if not FileHelper.is_file_exists(game_list_xml_path):
+            return None
+
+        return XmlHelper.compact_tags(
+            xml_file_path=game_list_xml_path,
+            tag=self.__TAG_GAME,
+            key_tag=self.__TAG_PATH,
+            is_kept=lambda rom_path: self.__is_rom_existing(
+                platform_folder_path=os.path.dirname(game_list_xml_path),
+                rom_path=rom_path
+            ),
+            space=self.__PARENT_PREFIX
+        )
+
+    def scan_media(self, platform: Platform) -> tuple[list[str], list[str]]:
+        """Scan media files of a platform in one pass, return media files referenced by no game
+        (orphaned) and media files referenced by games but not found (missing), None if media
+        can't be scanned"""
+
+        game_list_xml_path = self.__retrieve_game_list_xml_path(
+            platform=platform
+        )
+        if not FileHelper.is_file_exists(game_list_xml_path):
+            return None
+        platform_folder_path = os.path.dirname(game_list_xml_path)
+
+        # Media files referenced by games (any file of an entry except its rom), roms' names and
+        # names of files whose path isn't resolved
+        referenced_files: set[str] = set()
+        rom_names: set[str] = set()
+        unresolved_names: set[str] = set()
+        for game_data in XmlHelper.list_tags_data(
+            xml_file_path=game_list_xml_path,
+            parent_tag=self.__TAG_GAMES,
+            tag=self.__TAG_GAME
+        ):
+            for key, value in game_data.items():
+                if value is None:
+                    continue
+                if key == self.__TAG_PATH:
+                    rom_names.add(FileHelper.retrieve_file_basename(
+                        PureWindowsPath(value.strip()).name
+                    ))
+                    continue
+                file_path = self.__resolve_file_path(
+                    platform_folder_path=platform_folder_path,
+                    file_path=value
+                )
+                if file_path is not None:
+                    referenced_files.add(file_path)
+                elif PureWindowsPath(value.strip()).anchor != '':
+                    unresolved_names.add(PureWindowsPath(value.strip()).name)
+
+        # Media files found in media's folders (named as the rom of a game if not referenced)
+        media_files = set(FileHelper.list_file_paths(
+            folder_path=os.path.join(
+                platform_folder_path,
+                self.__MEDIA_PATH
+            )
+        ))
+        referenced_files.update(
+            media_file for media_file in media_files
+            if FileHelper.retrieve_file_basename(media_file) in rom_names
+        )
+
+        return self._compare_media_files(
+            referenced_files=referenced_files,
+            media_files=media_files,
+            unresolved_names=unresolved_names
+        )
+
     def retrieve_rom_file(self, platform: Platform, game_item: dict) -> str:
         """Retrieve rom file"""
 
@@ -231,65 +383,112 @@ class SkraperManager(AbstractManager):
     def retrieve_game_info(self, platform: Platform, game_item: dict) -> str:
         """Retrieve game info"""
 
+        return self.retrieve_game_info_many(
+            platform=platform,
+            game_items=[game_item]
+        )[game_item[Constants.UI_TABLE_KEY_COL_ID]]
+
+    def retrieve_game_info_many(
+        self,
+        platform: Platform,
+        game_items: list[dict]
+    ) -> dict[str, str]:
+        """Retrieve game info for several games (by game's id) with one read of the XML file"""
+
         # Initialize result
-        result = ''
+        result: dict[str, str] = {}
 
-        game_data = XmlHelper.get_tag_content(
+        # Get games' data by path
+        games_data = XmlHelper.index_tags_content(
             xml_file_path=self.__retrieve_game_list_xml_path(
                 platform=platform
             ),
             parent_tag=self.__TAG_GAMES,
             tag=self.__TAG_GAME,
-            criteria=self.__build_game_criteria(game_item)
+            key_tag=self.__TAG_PATH
         )
 
-        if game_data is None:
-            return result
+        for game_item in game_items:
+            game_data = games_data.get(self.__build_game_path(game_item), None)
+            if game_data is None:
+                result[game_item[Constants.UI_TABLE_KEY_COL_ID]] = ''
+                continue
 
-        # Filter out lines containing the file prefix
-        lines = [
-            line for line in game_data.splitlines()
-            if self.__FILE_PREFIX not in line and line.strip() != ""
-        ]
+            # Filter out lines containing the file prefix
+            lines = [
+                line for line in game_data.splitlines()
+                if self.__FILE_PREFIX not in line and line.strip() != ""
+            ]
 
-        # Add 2 spaces to the first line if any lines exist
-        if lines:
-            lines[0] = '  ' + lines[0]
+            # Add 2 spaces to the first line if any lines exist
+            if lines:
+                lines[0] = '  ' + lines[0]
 
-        result = '\n'.join(lines)
+            result[game_item[Constants.UI_TABLE_KEY_COL_ID]] = '\n'.join(lines)
 
         return result
 
-    def uninstall_game(self, platform: Platform, game_item: dict) -> bool:
-        """Uninstall game"""
+    def retrieve_games_info_timestamp(self, platform: Platform) -> float:
+        """Retrieve the last modification's timestamp of games info (None if unknown)"""
+
+        game_list_xml_path = self.__retrieve_game_list_xml_path(
+            platform=platform
+        )
+        if not FileHelper.is_file_exists(game_list_xml_path):
+            return None
+
+        return os.path.getmtime(game_list_xml_path)
+
+    def uninstall_game(
+        self,
+        platform: Platform,
+        game_item: dict,
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall game with the components of an execution context"""
+
+        return self.uninstall_games(
+            platform=platform,
+            game_items=[game_item],
+            execution_context=execution_context
+        )
+
+    def uninstall_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Uninstall games with the components of an execution context (the XML file listing
+        games is read and written once)"""
+
+        # Retrieve components
+        components = execution_context.components
 
         # Delete media files
-        if Component.MEDIA in Context.get_selected_components():
-            media_files = self.retrieve_media_files(
+        if Component.MEDIA in components:
+            for media_files in self.retrieve_media_files_many(
                 platform=platform,
-                game_item=game_item
-            )
-            for media_file in media_files.values():
+                game_items=game_items
+            ).values():
+                for media_file in media_files.values():
+                    FileHelper.delete_file(
+                        file_path=media_file
+                    )
+
+        # Delete rom files
+        if Component.ROM in components:
+            for game_item in game_items:
                 FileHelper.delete_file(
-                    file_path=media_file
+                    file_path=self.retrieve_rom_file(
+                        platform=platform,
+                        game_item=game_item
+                    )
                 )
 
-        # Delete rom file
-        if Component.ROM in Context.get_selected_components():
-            FileHelper.delete_file(
-                file_path=self.retrieve_rom_file(
-                    platform=platform,
-                    game_item=game_item
-                )
-            )
-
-            XmlHelper.delete_tag(
-                xml_file_path=self.__retrieve_game_list_xml_path(
-                    platform=platform
-                ),
-                parent_tag=self.__TAG_GAMES,
-                tag=self.__TAG_GAME,
-                criteria=self.__build_game_criteria(game_item)
+            self.__delete_games_entries(
+                platform=platform,
+                game_items=game_items
             )
 
         return True
@@ -300,16 +499,120 @@ class SkraperManager(AbstractManager):
         game_item: dict,
         media_files: dict[Media, str],
         game_info_files: dict[Software, str],
-        rom_file: str
+        rom_file: str,
+        execution_context: ExecutionContext
+    ) -> bool:
+        """Install game with the specified media files, game info files and rom file (with the
+        components of an execution context)"""
+
+        game_id = game_item[Constants.UI_TABLE_KEY_COL_ID]
+
+        return self.install_games(
+            platform=platform,
+            game_items=[game_item],
+            media_files={game_id: media_files},
+            game_info_files={game_id: game_info_files},
+            rom_files={game_id: rom_file},
+            execution_context=execution_context
+        )
+
+    def install_games(
+        self,
+        platform: Platform,
+        game_items: list[dict],
+        media_files: dict[str, dict[Media, str]],
+        game_info_files: dict[str, dict[Software, str]],
+        rom_files: dict[str, str],
+        execution_context: ExecutionContext
     ) -> bool:
-        """Install game with the specified media files, game info files and rom file"""
+        """Install games with the specified media files, game info files and rom files by game's
+        id (with the components of an execution context, the XML file listing games is written
+        once)"""
+
+        # Retrieve components
+        components = execution_context.components
 
         # Uninstall before installing
-        self.uninstall_game(
+        self.uninstall_games(
             platform=platform,
-            game_item=game_item
+            game_items=game_items,
+            execution_context=execution_context
         )
 
+        # Remove the games' entries kept by the uninstallation if roms not reinstalled
+        if Component.ROM not in components:
+            self.__delete_games_entries(
+                platform=platform,
+                game_items=game_items
+            )
+
+        # Install files of games and build their game info
+        games_info = []
+        games_info_software = None
+        for game_item in game_items:
+            game_id = game_item[Constants.UI_TABLE_KEY_COL_ID]
+            better_software, better_game_info = self.__install_game_files(
+                platform=platform,
+                media_files=media_files.get(game_id, {}),
+                game_info_files=game_info_files.get(game_id, {}),
+                rom_file=rom_files.get(game_id, None),
+                components=components
+            )
+            if better_game_info is None:
+                continue
+            games_info.append(better_game_info)
+            if games_info_software is None:
+                games_info_software = better_software
+
+        # If no game info found, finish the installation without info and media
+        if len(games_info) == 0:
+            return True
+
+        # Add the games info before </gameList>
+        game_list_xml_path = self.__retrieve_game_list_xml_path(
+            platform=platform
+        )
+        game_list_xml_content = FileHelper.read_file(game_list_xml_path)
+
+        if len(game_list_xml_content) == 0:
+            # Build an empty XML file if XML doesn't exist
+            game_list_xml_content = f"""<?xml version="1.0"?>
+<gameList>
+{self.__PARENT_PREFIX}<provider>
+{self.__CHILD_PREFIX}<System>{platform.value}</System>
+{self.__CHILD_PREFIX}<software>{games_info_software.value}</software>
+{self.__PARENT_PREFIX}</provider>
+</gameList>
+"""
+
+        closing_tag = f"</{self.__TAG_GAMES}>"
+        if closing_tag not in game_list_xml_content:
+            raise Exception(f'{game_list_xml_path} is inconsistent!')
+
+        game_list_xml_content = game_list_xml_content.replace(
+            closing_tag,
+            "\n".join(games_info) + f"\n{closing_tag}",
+            1
+        )
+
+        FileHelper.write_file(
+            file_path=game_list_xml_path,
+            content=game_list_xml_content
+        )
+
+        return True
+
+    def __install_game_files(
+        self,
+        platform: Platform,
+        media_files: dict[Media, str],
+        game_info_files: dict[Software, str],
+        rom_file: str,
+        components: tuple[Component, ...]
+    ) -> tuple[Software, str]:
+        """Install rom and media files of a game and build its game info (software and game info
+        are None if no game info found)"""
+
         # Initialize fields to add
         fields_to_add = {}
 
@@ -321,7 +624,7 @@ class SkraperManager(AbstractManager):
         )
 
         # Copy the rom
-        if Component.ROM in Context.get_selected_components():
+        if Component.ROM in components:
             FileHelper.copy_file(
                 source_file_path=rom_file,
                 destination_file_path=skraper_rom_file
@@ -345,7 +648,7 @@ class SkraperManager(AbstractManager):
 
         # If no game info found, finish the installation without info and media
         if better_game_info is None:
-            return True
+            return None, None
 
         # Install media files
         skraper_media_files = {}
@@ -372,7 +675,7 @@ class SkraperManager(AbstractManager):
                 file_name
             )
 
-            if Component.MEDIA in Context.get_selected_components():
+            if Component.MEDIA in components:
                 FileHelper.copy_file(
                     source_file_path=media_file,
                     destination_file_path=skraper_media_files[media]
@@ -408,36 +711,4 @@ class SkraperManager(AbstractManager):
 
         better_game_info = "\n".join(lines)
 
-        # Add the game info before </gameList>
-        game_list_xml_path = self.__retrieve_game_list_xml_path(
-            platform=platform
-        )
-        game_list_xml_content = FileHelper.read_file(game_list_xml_path)
-
-        if len(game_list_xml_content) == 0:
-            # Build an empty XML file if XML doesn't exist
-            game_list_xml_content = f"""<?xml version="1.0"?>
-<gameList>
-{self.__PARENT_PREFIX}<provider>
-{self.__CHILD_PREFIX}<System>{platform.value}</System>
-{self.__CHILD_PREFIX}<software>{better_software.value}</software>
-{self.__PARENT_PREFIX}</provider>
-</gameList>
-"""
-
-        closing_tag = f"</{self.__TAG_GAMES}>"
-        if closing_tag not in game_list_xml_content:
-            raise Exception(f'{game_list_xml_path} is inconsistent!')
-
-        game_list_xml_content = game_list_xml_content.replace(
-            closing_tag,
-            f"{better_game_info}\n{closing_tag}",
-            1
-        )
-
-        FileHelper.write_file(
-            file_path=game_list_xml_path,
-            content=game_list_xml_content
-        )
-
-        return True
+        return better_software, better_game_info
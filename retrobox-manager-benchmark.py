@@ -0,0 +1,136 @@
+# pylint: disable=invalid-name
+#!/usr/bin/python3
+"""Application to benchmark Retrobox Manager on synthetic libraries (without UI)"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from benchmark.benchmark_runner import BenchmarkRunner
+from benchmark.library_generator import LibraryGenerator
+from libraries.constants.constants import Platform, Software
+
+
+class BenchmarkApplication:
+    """Application to benchmark Retrobox Manager"""
+
+    # Exit codes
+    EXIT_FINISHED = 0
+    EXIT_REGRESSION = 1
+
+    # Softwares with a generator
+    __SOFTWARES = [Software.BATOCERA, Software.SKRAPER]
+
+    @staticmethod
+    def __parse_arguments(arguments: list[str]) -> argparse.Namespace:
+        """Parse arguments"""
+
+        parser = argparse.ArgumentParser(
+            description='Benchmark headless scenarios on generated libraries, results in JSON'
+        )
+        parser.add_argument(
+            '--path',
+            default=os.path.join(tempfile.gettempdir(), 'retrobox-manager-benchmark'),
+            help='working folder generated (must be empty or generated by a previous benchmark)'
+        )
+        parser.add_argument(
+            '--softwares',
+            nargs='+',
+            default=[software.name.lower() for software in BenchmarkApplication.__SOFTWARES],
+            choices=[software.name.lower() for software in BenchmarkApplication.__SOFTWARES],
+            help='softwares to benchmark'
+        )
+        parser.add_argument(
+            '--platforms',
+            nargs='+',
+            default=[Platform.SEGA_MEGADRIVE.name.lower()],
+            choices=[platform.name.lower() for platform in Platform],
+            help='platforms generated (executed in parallel)'
+        )
+        parser.add_argument(
+            '--scenarios',
+            nargs='+',
+            default=BenchmarkRunner.SCENARIOS,
+            choices=BenchmarkRunner.SCENARIOS,
+            help='scenarios to run'
+        )
+        parser.add_argument('--games', type=int, default=1000, help='games by platform')
+        parser.add_argument('--gamelist', type=int, help='games in gamelists (with missing roms)')
+        parser.add_argument('--media', type=int, default=3, help='media by game')
+        parser.add_argument('--rom-size', type=int, default=4096, help='size of roms in bytes')
+        parser.add_argument('--media-size', type=int, default=1024, help='size of media in bytes')
+        parser.add_argument('--seed', type=int, default=0, help='seed of generated contents')
+        parser.add_argument('--output', help='JSON file to write results')
+        parser.add_argument('--baseline', help='JSON file of results to compare to')
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.2,
+            help='ratio of slowdown tolerated compared to the baseline'
+        )
+
+        return parser.parse_args(arguments)
+
+    def run(self, arguments: list[str]) -> int:
+        """Run the benchmark and return the exit code"""
+
+        parsed_arguments = self.__parse_arguments(arguments)
+
+        # Work in the generated folder
+        os.environ['RETROBOX_MANAGER_PATH'] = parsed_arguments.path
+
+        platforms = [Platform[platform.upper()] for platform in parsed_arguments.platforms]
+        parameters = {
+            'platforms': parsed_arguments.platforms,
+            'games': parsed_arguments.games,
+            'gamelist': parsed_arguments.gamelist,
+            'media': parsed_arguments.media,
+            'rom_size': parsed_arguments.rom_size,
+            'media_size': parsed_arguments.media_size,
+            'seed': parsed_arguments.seed
+        }
+        results = BenchmarkRunner(
+            generator=LibraryGenerator(
+                working_path=parsed_arguments.path,
+                platforms=platforms,
+                games_count=parsed_arguments.games,
+                media_count=parsed_arguments.media,
+                rom_size=parsed_arguments.rom_size,
+                media_size=parsed_arguments.media_size,
+                gamelist_count=parsed_arguments.gamelist,
+                seed=parsed_arguments.seed
+            ),
+            platforms=platforms
+        ).run(
+            softwares=[Software[software.upper()] for software in parsed_arguments.softwares],
+            scenarios=parsed_arguments.scenarios
+        )
+        sys.stdout.write(json.dumps(results, indent=2) + '\n')
+
+        if parsed_arguments.output is not None:
+            BenchmarkRunner.write_results(
+                file_path=parsed_arguments.output,
+                parameters=parameters,
+                results=results
+            )
+
+        # Compare to the baseline
+        if parsed_arguments.baseline is not None:
+            regressions = BenchmarkRunner.compare_results(
+                baseline_file_path=parsed_arguments.baseline,
+                results=results,
+                tolerance=parsed_arguments.tolerance
+            )
+            for regression in regressions:
+                sys.stdout.write(f'Regression: {regression}\n')
+            if len(regressions) > 0:
+                return self.EXIT_REGRESSION
+
+        return self.EXIT_FINISHED
+
+
+if __name__ == "__main__":
+    # python3 retrobox-manager-benchmark.py --softwares batocera --games 5000 --output results.json
+    sys.exit(BenchmarkApplication().run(sys.argv[1:]))
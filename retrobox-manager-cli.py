@@ -0,0 +1,274 @@
+# pylint: disable=invalid-name
+#!/usr/bin/python3
+"""Application to manage my Retrobox from the command line (without UI)"""
+
+import argparse
+import fnmatch
+import json
+import logging
+import sys
+import threading
+from enum import Enum
+
+from executor.executor_factory import ExecutorFactory
+from executor.rows_builder import RowsBuilder
+from manager.manager_factory import ManagerFactory
+from libraries.constants.constants import Action, Category, Component, Constants, Platform
+from libraries.constants.constants import Profiling, Software
+from libraries.context.context import Context
+from libraries.event.event_bus import EventBus, EventType
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class CommandLineApplication:
+    """Application to manage Retrobox from the command line"""
+
+    # Exit codes
+    EXIT_FINISHED = 0
+    EXIT_FAILED = 1
+    EXIT_NOT_CONFIRMED = 2
+
+    @staticmethod
+    def __parse_enum(enum_type: type[Enum], value: str) -> Enum:
+        """Parse an enum from its name (case insensitive)"""
+
+        try:
+            return enum_type[value.upper()]
+        except KeyError as exc:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: '{value}' (choose from "
+                f"{', '.join(item.name.lower() for item in enum_type)})"
+            ) from exc
+
+    @staticmethod
+    def __parse_arguments(arguments: list[str]) -> argparse.Namespace:
+        """Parse arguments"""
+
+        parser = argparse.ArgumentParser(
+            description='Manage Retrobox without UI, events are written in JSON lines'
+        )
+        parser.add_argument(
+            '--category',
+            required=True,
+            type=lambda value: CommandLineApplication.__parse_enum(Category, value),
+            help='category (games, configs)'
+        )
+        parser.add_argument(
+            '--action',
+            required=True,
+            type=lambda value: CommandLineApplication.__parse_enum(Action, value),
+            help='action (export, install, uninstall, delete, sync, hash, deduplicate, verify, '
+            'clean_media, compact, ...)'
+        )
+        parser.add_argument(
+            '--software',
+            type=lambda value: CommandLineApplication.__parse_enum(Software, value),
+            help='software (batocera, launchbox, emu_movies, skraper)'
+        )
+        parser.add_argument(
+            '--platform',
+            nargs='+',
+            default=[],
+            type=lambda value: value.lower() if value.lower() == 'all'
+            else CommandLineApplication.__parse_enum(Platform, value),
+            help='platforms (sega_megadrive, nintendo_64, ... or all) executed in parallel'
+        )
+        parser.add_argument(
+            '--components',
+            nargs='+',
+            help='components (info, rom, media, ...), all available components if not specified'
+        )
+        parser.add_argument(
+            '--rows',
+            nargs='+',
+            default=['*'],
+            help='patterns matching id, name or rom of rows to select (all rows if not specified)'
+        )
+        parser.add_argument(
+            '--colors',
+            nargs='+',
+            choices=[
+                Constants.ITEM_COLOR_RED,
+                Constants.ITEM_COLOR_ORANGE,
+                Constants.ITEM_COLOR_GREEN,
+                Constants.ITEM_COLOR_BLACK
+            ],
+            help='colors of rows to select (all colors if not specified)'
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='only list selected rows'
+        )
+        parser.add_argument(
+            '--profile',
+            type=lambda value: CommandLineApplication.__parse_enum(Profiling, value),
+            help='profiling of the execution (off, timers, full), setup is used if not specified'
+        )
+        parser.add_argument(
+            '--yes',
+            action='store_true',
+            help='confirm execution if a confirmation is required (not executed with exit code 2 '
+            'otherwise)'
+        )
+
+        return parser.parse_args(arguments)
+
+    @staticmethod
+    def __write_event(event: str, **data):
+        """Write an event in a JSON line"""
+
+        sys.stdout.write(json.dumps({'event': event, **data}, default=str) + '\n')
+        sys.stdout.flush()
+
+    @staticmethod
+    def __is_row_selected(row: dict, arguments: argparse.Namespace) -> bool:
+        """Specify if a row is selected by arguments"""
+
+        if arguments.colors is not None and \
+                row[Constants.UI_TABLE_KEY_COLOR] not in arguments.colors:
+            return False
+
+        for pattern in arguments.rows:
+            for key in [
+                Constants.UI_TABLE_KEY_COL_ID,
+                Constants.UI_TABLE_KEY_COL_NAME,
+                Constants.UI_TABLE_KEY_COL_ROM
+            ]:
+                if key in row and fnmatch.fnmatch(str(row[key]), pattern):
+                    return True
+
+        return False
+
+    @staticmethod
+    def __select_platforms(arguments: argparse.Namespace) -> list[Platform]:
+        """Select platforms from arguments"""
+
+        if 'all' not in arguments.platform:
+            return arguments.platform
+
+        # All platforms of the software
+        if arguments.software is None:
+            return list(Platform)
+        return ManagerFactory.create(
+            software=arguments.software
+        ).list_platforms()
+
+    @staticmethod
+    def __select_components_rows(arguments: argparse.Namespace) -> list[dict]:
+        """Select rows of components from arguments"""
+
+        components_rows = RowsBuilder.build_components_rows()
+        if arguments.components is None:
+            return components_rows
+
+        # Keep rows of specified components
+        components_names = [
+            Context.get_text(
+                CommandLineApplication.__parse_enum(Component, component).value
+            )
+            for component in arguments.components
+        ]
+        return [
+            components_row for components_row in components_rows
+            if components_row[Constants.UI_TABLE_KEY_COL_NAME] in components_names
+        ]
+
+    def __print_events(self, event_bus: EventBus) -> bool:
+        """Print events posted since the last call and specify if the execution finished"""
+
+        # Initialize result
+        result = False
+
+        for event_type, data in event_bus.drain():
+            if event_type == EventType.LOG:
+                self.__write_event(
+                    EventType.LOG.value,
+                    level=logging.getLevelName(data['level']),
+                    message=data['message']
+                )
+            else:
+                self.__write_event(event_type.value, **data)
+                result = result or event_type == EventType.FINISHED
+
+        return result
+
+    def run(self, arguments: list[str]) -> int:
+        """Run the application and return the exit code"""
+
+        parsed_arguments = self.__parse_arguments(arguments)
+
+        # Update context from arguments
+        Context.set_selected_category(parsed_arguments.category)
+        Context.set_selected_action(parsed_arguments.action)
+        Context.set_selected_software(parsed_arguments.software)
+        Context.set_selected_platforms(
+            self.__select_platforms(arguments=parsed_arguments)
+        )
+        Context.set_selected_rows([
+            row for row in RowsBuilder.build_rows()
+            if self.__is_row_selected(row=row, arguments=parsed_arguments)
+        ])
+        Context.set_selected_components(
+            self.__select_components_rows(arguments=parsed_arguments)
+        )
+
+        # Only list selected rows
+        if parsed_arguments.list:
+            for row in Context.get_selected_rows():
+                self.__write_event('row', **row)
+            return self.EXIT_FINISHED
+
+        # Profile the execution if specified
+        if parsed_arguments.profile is not None:
+            Context.set_profiling(parsed_arguments.profile)
+
+        # Build executor
+        executor = ExecutorFactory.create()
+
+        # Write the confirmation asked (not confirmed and not executed without --yes)
+        confirmation_message = executor.retrieve_confirmation_message()
+        if confirmation_message is not None:
+            self.__write_event('confirmation', message=confirmation_message)
+            if not parsed_arguments.yes:
+                return self.EXIT_NOT_CONFIRMED
+
+        # Set event bus for log of this thread and executor (log of the execution posted to it)
+        event_bus = EventBus()
+        LoggingHelper.bind_event_bus(
+            event_bus=event_bus
+        )
+        executor.set_event_bus(
+            event_bus=event_bus
+        )
+
+        # Execute in a thread
+        execution_thread = threading.Thread(
+            target=executor.execute
+        )
+        execution_thread.start()
+
+        # Print events until the end of execution (stopped if interrupted)
+        finished = False
+        while execution_thread.is_alive():
+            try:
+                execution_thread.join(Constants.UI_EVENTS_INTERVAL_MS / 1000)
+            except KeyboardInterrupt:
+                LoggingHelper.log_info(
+                    message=Context.get_text('waiting_for_stopping')
+                )
+                executor.stop_execution()
+            finished = self.__print_events(event_bus=event_bus) or finished
+        finished = self.__print_events(event_bus=event_bus) or finished
+
+        # Unset event bus for log
+        LoggingHelper.unbind_event_bus()
+        Context.destroy()
+
+        return self.EXIT_FINISHED if finished else self.EXIT_FAILED
+
+
+if __name__ == "__main__":
+    # python3 retrobox-manager-cli.py --category games --action install --software batocera
+    # --platform sega_megadrive nintendo_64 --components rom media
+    sys.exit(CommandLineApplication().run(sys.argv[1:]))
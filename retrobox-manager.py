@@ -4,16 +4,20 @@
 
 import os
 import tkinter as tk
+from tkinter import messagebox
 from tkinter import ttk
 
 from dialogs.about.about_dialog import AboutDialog
 from dialogs.execute.execute_dialog import ExecuteDialog
+from dialogs.queue.queue_dialog import QueueDialog
 from dialogs.setup.setup_dialog import SetupDialog
-from executor.games.abstract_games_executor import AbstractGamesExecutor
+from executor.executor_factory import ExecutorFactory
+from executor.queue.operation_queue import OperationQueue
+from executor.rows_builder import RowsBuilder
 from manager.manager_factory import ManagerFactory
-from libraries.constants.constants import Action, Category, Component, Constants, Platform, Software
+from libraries.constants.constants import Action, Category, Constants, Platform, Software
 from libraries.context.context import Context
-from libraries.file.file_helper import FileHelper
+from libraries.trash.trash_helper import TrashHelper
 from libraries.ui.ui_helper import UIHelper
 from libraries.ui.ui_table import UITable
 
@@ -37,8 +41,10 @@ class ApplicationWindow:
         # Update execute button state
         if len(selected_top_rows) > 0 and len(selected_bottom_rows) > 0:
             self.button_execute.config(state=tk.NORMAL)
+            self.button_add_to_queue.config(state=tk.NORMAL)
         else:
             self.button_execute.config(state=tk.DISABLED)
+            self.button_add_to_queue.config(state=tk.DISABLED)
 
     def __on_combo_changed(self, event):
         """Called when a combo changed"""
@@ -68,7 +74,14 @@ class ApplicationWindow:
                         Action.EXPORT,
                         Action.INSTALL,
                         Action.UNINSTALL,
-                        Action.DELETE
+                        Action.DELETE,
+                        Action.SYNC,
+                        Action.HASH,
+                        Action.DEDUPLICATE,
+                        Action.VERIFY,
+                        Action.CLEAN_MEDIA,
+                        Action.COMPACT,
+                        Action.RESTORE
                     ]
 
                 case Category.CONFIGS:
@@ -115,7 +128,11 @@ class ApplicationWindow:
             self.label_platform.pack_forget()
             self.combo_platform.pack_forget()
             if Context.get_selected_category() == Category.GAMES:
-                if Context.get_selected_action() != Action.DELETE:
+                if Context.get_selected_action() not in [
+                    Action.DELETE,
+                    Action.DEDUPLICATE,
+                    Action.VERIFY
+                ]:
                     self.label_software.pack(
                         side=tk.LEFT,
                         padx=Constants.UI_PAD_SMALL
@@ -132,7 +149,11 @@ class ApplicationWindow:
                     side=tk.LEFT,
                     padx=Constants.UI_PAD_SMALL
                 )
-                if Context.get_selected_action() != Action.DELETE:
+                if Context.get_selected_action() not in [
+                    Action.DELETE,
+                    Action.DEDUPLICATE,
+                    Action.VERIFY
+                ]:
                     self.combo_software.current(0)
                     self.combo_software.event_generate("<<ComboboxSelected>>")
                 else:
@@ -157,6 +178,11 @@ class ApplicationWindow:
             ).list_platforms():
                 values.append(platform.value)
             values.sort()
+
+            # Allow to select all platforms
+            if len(values) > 1:
+                values.append(Context.get_text('all_platforms'))
+
             self.combo_platform.configure(
                 values=values
             )
@@ -176,6 +202,11 @@ class ApplicationWindow:
             for platform in Platform:
                 if platform.value == self.combo_platform.get():
                     Context.set_selected_platform(platform)
+            if self.combo_platform.get() == Context.get_text('all_platforms'):
+                Context.set_selected_platforms([
+                    platform for platform in Platform
+                    if platform.value in self.combo_platform.cget('values')
+                ])
 
             # Update UI
             self.__update_ui()
@@ -183,205 +214,14 @@ class ApplicationWindow:
     def __update_ui(self):
         """Update UI depending on choices made in combos"""
 
-        # Create rows for table
-        table_rows = []
-        if Context.get_selected_category() == Category.GAMES:
-            # List games for selected Software
-            selected_software_games = ManagerFactory.create(
-                software=Context.get_selected_software()
-            ).list_games_with_rom(
-                platform=Context.get_selected_platform()
-            )
-
-            # List games for data
-            data_games = {}
-            for game_folder in FileHelper.list_sub_directories(
-                folder_path=os.path.join(
-                    Context.get_games_path(),
-                    Context.get_selected_platform().value
-                )
-            ):
-                # Try to find the rom file
-                rom_files = FileHelper.list_relative_paths(
-                    folder_path=os.path.join(
-                        Context.get_games_path(),
-                        Context.get_selected_platform().value,
-                        game_folder,
-                        AbstractGamesExecutor.ROM_FOLDER_NAME
-                    ),
-                    file_name='*',
-                    error_if_not_found=False
-                )
-
-                if len(rom_files) == 0:
-                    continue
-
-                rom_file = rom_files[0]
-
-                # Try to extract the name from software if possible
-                game_name = FileHelper.retrieve_file_basename(rom_file)
-                for software in Context.list_available_softwares():
-                    software_manager = ManagerFactory.create(software)
-                    software_games = software_manager.list_games_with_rom(
-                        platform=Context.get_selected_platform()
-                    )
-                    if rom_file not in software_games:
-                        continue
-                    if len(software_games[rom_file]) == 0:
-                        continue
-                    game_name = software_games[rom_file]
-                    break
-
-                data_games[FileHelper.retrieve_file_name(rom_file)] = game_name
-
-            match(Context.get_selected_action()):
-                case Action.EXPORT:
-                    for rom, name in selected_software_games.items():
-                        # Build row
-                        row = {}
-                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
-                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
-                            rom
-                        )
-                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
-                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
-
-                        # Check if unique
-                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
-                            data_games.values()
-                        ).count(name) == 1
-
-                        # Retrieve color
-                        if row[Constants.UI_TABLE_KEY_COL_ROM] not in data_games:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_RED
-                        elif not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
-                        else:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
-
-                        # Append row
-                        table_rows.append(row)
-
-                case Action.INSTALL:
-                    for rom, name in data_games.items():
-                        # Build row
-                        row = {}
-                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
-                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
-                            rom
-                        )
-                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
-                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
-
-                        # Check if unique
-                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
-                            data_games.values()
-                        ).count(name) == 1
-
-                        # Retrieve color
-                        if row[Constants.UI_TABLE_KEY_COL_ROM] not in selected_software_games:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_RED
-                        elif not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
-                        else:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
-
-                        # Append row
-                        table_rows.append(row)
-
-                case Action.UNINSTALL:
-                    for rom, name in data_games.items():
-                        # Build row
-                        row = {}
-                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
-                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
-                            rom
-                        )
-                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
-                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
-
-                        # Check if unique
-                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
-                            data_games.values()
-                        ).count(name) == 1
-
-                        # Retrieve color
-                        if row[Constants.UI_TABLE_KEY_COL_ROM] in selected_software_games:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_RED
-                        elif not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
-                        else:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
-
-                        # Append row
-                        table_rows.append(row)
-
-                case Action.DELETE:
-                    for rom, name in data_games.items():
-                        # Build row
-                        row = {}
-                        row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
-                        row[Constants.UI_TABLE_KEY_COL_ID] = FileHelper.retrieve_file_basename(
-                            rom
-                        )
-                        row[Constants.UI_TABLE_KEY_COL_NAME] = name
-                        row[Constants.UI_TABLE_KEY_COL_ROM] = rom
-
-                        # Check if unique
-                        row[Constants.UI_TABLE_KEY_COL_UNIQUE] = list(
-                            data_games.values()
-                        ).count(name) == 1
-
-                        # Retrieve color
-                        if not row[Constants.UI_TABLE_KEY_COL_UNIQUE]:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_ORANGE
-                        else:
-                            row[Constants.UI_TABLE_KEY_COLOR] = Constants.ITEM_COLOR_GREEN
-
-                        # Append row
-                        table_rows.append(row)
-
-        # Sort rows depending on UI_TABLE_KEY_COLOR (desc) and Constants.UI_TABLE_KEY_COL_NAME (asc)
-        sorted_rows = sorted(
-            table_rows,
-            key=lambda x: (-ord(
-                x[Constants.UI_TABLE_KEY_COLOR][0]),
-                x[Constants.UI_TABLE_KEY_COL_NAME]
-            )
-        )
-
+        # Create table top
         self.__create_table_top(
-            rows=sorted_rows
+            rows=RowsBuilder.build_rows()
         )
 
         # Create table bottom
-        components = []
-        match(Context.get_selected_category()):
-            case Category.GAMES:
-                if Context.get_selected_action() not in [
-                    Action.INSTALL,
-                    Action.UNINSTALL,
-                    Action.DELETE
-                ]:
-                    components.append(Component.INFO)
-                components.append(Component.ROM)
-                components.append(Component.MEDIA)
-
-            case Category.CONFIGS:
-                components.append(Component.FILES)
-                components.append(Component.REGISTRY)
-
-        table_bottom_rows = []
-        for component in components:
-            table_bottom_rows.append({
-                Constants.UI_TABLE_KEY_COL_SELECTION: False,
-                Constants.UI_TABLE_KEY_COL_ID: Context.get_text(component.value),
-                Constants.UI_TABLE_KEY_COL_NAME: Context.get_text(component.value),
-                Constants.UI_TABLE_KEY_COLOR: Constants.ITEM_COLOR_BLACK
-            })
-
         self.__create_table_bottom(
-            rows=table_bottom_rows
+            rows=RowsBuilder.build_components_rows()
         )
 
     def __load_setup(self):
@@ -404,6 +244,15 @@ class ApplicationWindow:
     def __execute(self):
         """Execute"""
 
+        # Jobs of the queue and an execution in foreground can't write the same store at once
+        if OperationQueue.has_pending_jobs():
+            messagebox.showwarning(
+                Context.get_text('warning'),
+                Context.get_text('execute_with_jobs'),
+                parent=self.__window
+            )
+            return
+
         # Update selected rows in context
         Context.set_selected_rows(
             self.table_top.get_selected_rows()
@@ -420,6 +269,61 @@ class ApplicationWindow:
             callback=self.__update_ui
         )
 
+    def __add_to_queue(self):
+        """Add an execution to the operation queue"""
+
+        # Update selected rows in context
+        Context.set_selected_rows(
+            self.table_top.get_selected_rows()
+        )
+
+        # Update selected components in context
+        Context.set_selected_components(
+            self.table_bottom.get_selected_rows()
+        )
+
+        # Build executor (with a snapshot of the selection)
+        executor = ExecutorFactory.create()
+
+        # Ask confirmation before queueing the execution (not queued if cancelled)
+        confirmation_message = executor.retrieve_confirmation_message()
+        if confirmation_message is not None and not messagebox.askokcancel(
+            Context.get_text('confirmation'),
+            confirmation_message,
+            parent=self.__window
+        ):
+            return
+
+        # Add the job named from the selection
+        OperationQueue.add_job(
+            executor=executor,
+            name=Context.get_text(
+                'job_title',
+                action=Context.get_text(
+                    Context.get_selected_action().value,
+                    category=Context.get_text(
+                        Context.get_selected_category().value
+                    )
+                ),
+                platforms=', '.join(
+                    platform.value for platform in Context.get_selected_platforms()
+                ),
+                item_total_counter=len(executor.get_rows())
+            )
+        )
+
+        # Show the queue
+        self.__load_queue()
+
+    def __load_queue(self):
+        """Load queue"""
+
+        # Load dialog for queue
+        QueueDialog(
+            self.__window,
+            callback=self.__update_ui
+        )
+
     def __create_top_components(self):
         """Create top components"""
 
@@ -544,6 +448,16 @@ class ApplicationWindow:
             padx=Constants.UI_PAD_SMALL
         )
 
+        # Button for queue
+        self.button_queue = tk.Button(
+            setup_about_frame,
+            command=self.__load_queue
+        )
+        self.button_queue.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+
         # Button for about
         self.button_about = tk.Button(
             setup_about_frame,
@@ -653,7 +567,23 @@ class ApplicationWindow:
         )
         self.button_execute.config(state=tk.DISABLED)
         self.button_execute.pack(
-            side=tk.BOTTOM
+            side=tk.LEFT,
+            expand=True,
+            anchor=tk.E,
+            padx=Constants.UI_PAD_SMALL
+        )
+
+        # Create button to add to the queue
+        self.button_add_to_queue = tk.Button(
+            bottom_frame,
+            command=self.__add_to_queue
+        )
+        self.button_add_to_queue.config(state=tk.DISABLED)
+        self.button_add_to_queue.pack(
+            side=tk.LEFT,
+            expand=True,
+            anchor=tk.W,
+            padx=Constants.UI_PAD_SMALL
         )
 
     def __update_components_from_context(self):
@@ -681,6 +611,12 @@ class ApplicationWindow:
         self.button_execute.config(
             text=Context.get_text('execute')
         )
+        self.button_add_to_queue.config(
+            text=Context.get_text('add_to_queue')
+        )
+        self.button_queue.config(
+            text=Context.get_text('queue')
+        )
 
         # Fix labels text
         self.label_category.config(
@@ -761,11 +697,25 @@ class ApplicationWindow:
         if not Context.get_setup_file_path().exists():
             self.__load_setup()
 
+        # Purge expired folders from trashes in background
+        TrashHelper.start_purge()
+
         # Show window
         self.__window.mainloop()
 
     def __on_close(self):
         """Called when the window is closing"""
+
+        # Confirm to stop jobs of the queue (they can be resumed)
+        if OperationQueue.has_pending_jobs():
+            if not messagebox.askokcancel(
+                Context.get_text('confirmation'),
+                Context.get_text('confirm_close_with_jobs'),
+                parent=self.__window
+            ):
+                return
+            OperationQueue.stop_all_jobs()
+
         Context.destroy()
         self.__window.destroy()
 